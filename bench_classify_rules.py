@@ -0,0 +1,56 @@
+# bench_classify_rules.py
+# Per-row cost of the compiled rule engine against classify_clients.
+#
+#   python bench_classify_rules.py --rows 200000 --bands 10 1000
+import argparse
+import random
+import time
+
+from classify_rules import DEFAULT_RULES, compile_rules, default_rules
+from classify_stream import kuvalda
+
+
+def make_clients(rows, seed=1):
+    rng = random.Random(seed)
+    statuses = ["clean", "suspicious", "fraud", "pending"]
+    return [{"name": f"c{i}", "amount": rng.uniform(0, 2000), "status": rng.choice(statuses)}
+            for i in range(rows)]
+
+
+def make_rules(bands, statuses=100):
+    """Rule table with bands evenly spaced over [0, 2000) and extra statuses."""
+    rules = dict(DEFAULT_RULES)
+    step = 2000 / bands
+    rules["bands"] = [{"below": step * (i + 1), "category": f"band-{i}"} for i in range(bands - 1)]
+    rules["bands"].append({"category": f"band-{bands - 1}"})
+    rules["statuses"] = {**DEFAULT_RULES["statuses"],
+                         **{f"status-{i}": f"decision-{i}" for i in range(statuses)}}
+    return compile_rules(rules)
+
+
+def per_row(function, clients, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function(clients)
+        best = min(best, time.perf_counter() - started)
+    return best / len(clients)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rule engine benchmark")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--bands", type=int, nargs="+", default=[3, 10, 100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    clients = make_clients(args.rows)
+    print(f"{'classify_clients':<28}{per_row(kuvalda.classify_clients, clients, args.repeat) * 1e9:>10.0f} ns/row")
+    print(f"{'rules (default)':<28}{per_row(default_rules.classify, clients, args.repeat) * 1e9:>10.0f} ns/row")
+    for bands in args.bands:
+        rules = make_rules(bands)
+        print(f"{f'rules ({bands} bands)':<28}{per_row(rules.classify, clients, args.repeat) * 1e9:>10.0f} ns/row")
+
+
+if __name__ == "__main__":
+    main()
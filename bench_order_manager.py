@@ -0,0 +1,140 @@
+# bench_order_manager.py
+# Бенчмарки гарячих шляхів order_manager.
+#
+# Окремий скрипт (масштабування за розміром, пікова пам'ять, JSON-базова лінія):
+#   python bench_order_manager.py --save baseline.json
+#   python bench_order_manager.py --compare baseline.json --threshold 0.2
+#
+# Через pytest-benchmark:
+#   python -m pytest bench_order_manager.py --benchmark-only
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import pytest
+
+from order_manager import Item, Order
+
+
+def make_order(size):
+    return Order([Item(f"item-{i}", float(i % 997) + 0.5) for i in range(size)])
+
+
+def make_small_orders(size, per_order=10):
+    return [make_order(per_order) for _ in range(max(1, size // per_order))]
+
+
+# кожен випадок: (назва, підготовка, операція над підготовленими даними)
+CASES = [
+    ("total", make_order, lambda order: order.total()),
+    ("most_expensive", make_order, lambda order: order.most_expensive()),
+    ("apply_discount", make_order, lambda order: order.apply_discount(1)),
+    # знижка з подальшим читанням цін — повна вартість лінивої знижки
+    ("discount_and_read", make_order, lambda order: (order.apply_discount(1), order.most_expensive())),
+    ("small_orders_total", make_small_orders, lambda orders: [o.total() for o in orders]),
+    ("small_orders_discount", make_small_orders, lambda orders: [o.apply_discount(1) for o in orders]),
+]
+
+
+def time_case(prepare, operation, size, repeat):
+    """Найкращий час із repeat запусків (підготовка не враховується)."""
+    best = float("inf")
+    for _ in range(repeat):
+        data = prepare(size)
+        started = time.perf_counter()
+        operation(data)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def peak_memory(prepare, operation, size):
+    """Пікова пам'ять (байти) на підготовку та операцію."""
+    tracemalloc.start()
+    data = prepare(size)
+    operation(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def run_suite(sizes, repeat=3, cases=None):
+    results = {}
+    for name, prepare, operation in CASES:
+        if cases and name not in cases:
+            continue
+        for size in sizes:
+            key = f"{name}/{size}"
+            results[key] = {
+                "seconds": time_case(prepare, operation, size, repeat),
+                "peak_bytes": peak_memory(prepare, operation, size),
+            }
+            print(f"{key:<32}{results[key]['seconds'] * 1e3:>12.3f} ms"
+                  f"{results[key]['peak_bytes'] / 2**20:>12.1f} MiB")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Порівнює з базовою лінією. Повертає список ключів,
+    час яких погіршився більше ніж на threshold (частка).
+    """
+    regressions = []
+    for key, current in results.items():
+        old = baseline.get(key)
+        if old is None:
+            continue
+        ratio = current["seconds"] / old["seconds"] if old["seconds"] > 0 else 1.0
+        marker = ""
+        if ratio > 1 + threshold:
+            regressions.append(key)
+            marker = "  REGRESSION"
+        print(f"{key:<32}{old['seconds'] * 1e3:>12.3f}{current['seconds'] * 1e3:>12.3f}  x{ratio:.2f}{marker}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарки order_manager")
+    parser.add_argument("--min-exp", type=int, default=3, help="найменший розмір 10^N")
+    parser.add_argument("--max-exp", type=int, default=6, help="найбільший розмір 10^N")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--case", action="append", help="запустити лише цей випадок")
+    parser.add_argument("--save", help="зберегти результати в JSON")
+    parser.add_argument("--compare", help="порівняти з JSON базовою лінією")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="допустиме погіршення (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    sizes = [10 ** n for n in range(args.min_exp, args.max_exp + 1)]
+    results = run_suite(sizes, args.repeat, args.case)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": results,
+            }, f, indent=2)
+        print(f"Збережено в {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"Погіршення: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+# --- pytest-benchmark ---
+
+@pytest.mark.parametrize("size", [10 ** 3, 10 ** 4, 10 ** 5])
+@pytest.mark.parametrize("name, prepare, operation", CASES, ids=[case[0] for case in CASES])
+def test_bench(benchmark, name, prepare, operation, size):
+    benchmark.pedantic(operation, setup=lambda: ((prepare(size),), {}), rounds=5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# classify_cache.py
+# Incremental classification of a repeated client feed.
+#
+#   python classify_cache.py feed.jsonl --cache cache.json > delta.jsonl
+#
+# The cache remembers the last classification of every client, keyed by
+# name together with a fingerprint of (amount, status). On the next run
+# only new or changed rows go through classify_clients, and the result
+# is a delta: clients whose category or decision changed. Entries are
+# kept in least-recently-seen order and evicted by count and by age.
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+
+from classify_stream import detect_format, iter_clients, kuvalda
+
+MAX_ENTRIES = 1_000_000
+# entries not seen for this long are dropped (seconds), None - never
+MAX_AGE = 7 * 24 * 3600
+
+
+def fingerprint(client):
+    """Hash of the fields that affect classification."""
+    data = repr((client.get("amount"), client.get("status"))).encode()
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+class ClassificationCache:
+    def __init__(self, path=None, max_entries=MAX_ENTRIES, max_age=MAX_AGE, clock=time.time):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.clock = clock
+        # name -> [fingerprint, category, decision, last seen]; oldest first
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.entries = OrderedDict(json.load(f))
+
+    def classify(self, clients):
+        """
+        Classifies the feed, reusing cached results for unchanged clients.
+        Returns (results, delta); delta items are
+        {"name", "old": [category, decision] or None, "new": [category, decision]}.
+        """
+        now = self.clock()
+        keys = [fingerprint(client) for client in clients]
+
+        changed = [i for i, (client, key) in enumerate(zip(clients, keys))
+                   if self.entries.get(client.get("name"), (None,))[0] != key]
+        fresh = kuvalda.classify_clients([clients[i] for i in changed])
+        self.misses += len(changed)
+        self.hits += len(clients) - len(changed)
+
+        results = [None] * len(clients)
+        delta = []
+        for i, result in zip(changed, fresh):
+            results[i] = result
+            name = result["name"]
+            old = self.entries.get(name)
+            new = [result["category"], result["decision"]]
+            if old is None or old[1:3] != new:
+                delta.append({"name": name, "old": None if old is None else old[1:3], "new": new})
+            self.entries[name] = [keys[i], *new, now]
+
+        for i, client in enumerate(clients):
+            name = client.get("name")
+            entry = self.entries[name]
+            entry[3] = now
+            self.entries.move_to_end(name)
+            if results[i] is None:
+                results[i] = {"name": name, "category": entry[1], "decision": entry[2]}
+
+        self.evict(now)
+        return results, delta
+
+    def evict(self, now=None):
+        now = self.clock() if now is None else now
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        if self.max_age is not None:
+            while self.entries:
+                entry = next(iter(self.entries.values()))
+                if now - entry[3] <= self.max_age:
+                    break
+                self.entries.popitem(last=False)
+
+    def save(self):
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(list(self.entries.items()), f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental classification of a client feed")
+    parser.add_argument("path")
+    parser.add_argument("--cache", default="classify_cache.json")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="input format (default: by extension)")
+    parser.add_argument("--max-entries", type=int, default=MAX_ENTRIES)
+    parser.add_argument("--max-age", type=float, default=MAX_AGE, help="seconds, 0 - never expire")
+    args = parser.parse_args()
+
+    cache = ClassificationCache(args.cache, args.max_entries, args.max_age or None)
+    clients = list(iter_clients(args.path, args.format or detect_format(args.path)))
+    _, delta = cache.classify(clients)
+    for change in delta:
+        print(json.dumps(change, ensure_ascii=False))
+    cache.save()
+    print(f"{len(clients)} clients, {cache.misses} reclassified, {len(delta)} changed",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# classify_rules.py
+# Configurable rule engine for client classification.
+#
+# Rules live in a JSON file:
+#   {
+#     "bands": [{"below": 100, "category": "Low-value"},
+#               {"below": 1000, "category": "Medium-value"},
+#               {"category": "High-value"}],
+#     "statuses": {"clean": "Proceed without concerns", ...},
+#     "unknown_decision": "Unknown verification status",
+#     "invalid": {"category": "Invalid data", "decision": "Fake information detected"}
+#   }
+# Bands are ordered; each covers amounts below its "below" bound and the
+# last one has no bound. compile_rules() turns the table into a bisect
+# bound list and lookup tables once, and the RuleSet is reused for every
+# call. DEFAULT_RULES reproduces classify_clients from kuvalda(1).py.
+import json
+from bisect import bisect_right
+
+import numpy as np
+
+DEFAULT_RULES = {
+    "bands": [
+        {"below": 100, "category": "Low-value"},
+        {"below": 1000, "category": "Medium-value"},
+        {"category": "High-value"},
+    ],
+    "statuses": {
+        "clean": "Proceed without concerns",
+        "suspicious": "Require document verification",
+        "fraud": "Blacklist the client",
+    },
+    "unknown_decision": "Unknown verification status",
+    "invalid": {"category": "Invalid data", "decision": "Fake information detected"},
+}
+
+
+class RuleSet:
+    """Compiled rules: band bounds for bisect plus label lookups."""
+
+    def __init__(self, bounds, categories, statuses, unknown_decision, invalid_category, invalid_decision):
+        self.bounds = bounds
+        self.categories = categories
+        self.statuses = statuses
+        self.unknown_decision = unknown_decision
+        self.invalid_category = invalid_category
+        self.invalid_decision = invalid_decision
+        self._bounds_array = np.array(bounds, dtype=np.float64)
+
+    def classify(self, clients):
+        """Same output format as classify_clients."""
+        bounds = self.bounds
+        categories = self.categories
+        statuses = self.statuses
+        unknown = self.unknown_decision
+        invalid = {"category": self.invalid_category, "decision": self.invalid_decision}
+        results = []
+        append = results.append
+        for client in clients:
+            amount = client.get("amount")
+            if not isinstance(amount, (int, float)):
+                append({"name": client.get("name"), **invalid})
+                continue
+            status = client.get("status")
+            append({
+                "name": client.get("name"),
+                "category": categories[bisect_right(bounds, amount)],
+                "decision": statuses.get(status, unknown) if isinstance(status, str) else unknown,
+            })
+        return results
+
+    def category_codes(self, amounts):
+        """Band index for every amount of a numeric array."""
+        return np.searchsorted(self._bounds_array, np.asarray(amounts, dtype=np.float64), side="right")
+
+
+def compile_rules(rules):
+    bands = rules["bands"]
+    if not bands or "below" in bands[-1]:
+        raise ValueError("the last band must have no 'below' bound")
+    bounds = [band["below"] for band in bands[:-1]]
+    if any("below" not in band for band in bands[:-1]):
+        raise ValueError("every band except the last needs a 'below' bound")
+    if any(a >= b for a, b in zip(bounds, bounds[1:])):
+        raise ValueError("band bounds must be strictly increasing")
+    invalid = rules.get("invalid", DEFAULT_RULES["invalid"])
+    return RuleSet(
+        bounds,
+        [band["category"] for band in bands],
+        dict(rules.get("statuses", {})),
+        rules.get("unknown_decision", DEFAULT_RULES["unknown_decision"]),
+        invalid["category"],
+        invalid["decision"],
+    )
+
+
+def load_rules(path):
+    with open(path, encoding="utf-8") as f:
+        return compile_rules(json.load(f))
+
+
+default_rules = compile_rules(DEFAULT_RULES)
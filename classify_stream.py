@@ -0,0 +1,175 @@
+# classify_stream.py
+# Streaming classification of large CSV/JSONL deal files.
+#
+#   python classify_stream.py deals.jsonl --out results.jsonl --workers 0
+#   python classify_stream.py deals.csv --out results.csv --chunk-size 50000
+#
+# The input is read in chunks of rows, each chunk is classified in a
+# process pool, and results are written in input order as soon as the
+# chunk at the head of the queue is ready. At most 2 * workers chunks
+# are in flight, so memory stays bounded regardless of file size.
+import argparse
+import csv
+import importlib.util
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+CHUNK_SIZE = 10000
+FIELDS = ("row", "name", "category", "decision")
+
+
+def load_kuvalda():
+    """Import kuvalda(1).py (its file name is not a valid module name)."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "kuvalda(1).py")
+    spec = importlib.util.spec_from_file_location("kuvalda_1", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+kuvalda = load_kuvalda()
+
+
+def detect_format(path):
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def parse_amount(value):
+    """CSV cells are strings: numbers become int/float, anything else stays invalid."""
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def iter_clients(path, fmt):
+    with open(path, encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            for row in csv.DictReader(f):
+                row["amount"] = parse_amount(row.get("amount"))
+                yield row
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def iter_chunks(clients, chunk_size=CHUNK_SIZE):
+    """Yields (number of the first row, list of clients)."""
+    chunk = []
+    start = 0
+    for client in clients:
+        chunk.append(client)
+        if len(chunk) == chunk_size:
+            yield start, chunk
+            start += len(chunk)
+            chunk = []
+    if chunk:
+        yield start, chunk
+
+
+def classify_chunk(start, clients, columnar=False):
+    """Classifies one chunk (runs in a worker). Returns (start, results)."""
+    if columnar:
+        result = kuvalda.classify_clients_columnar(kuvalda.columns_from_records(clients))
+        return start, kuvalda.records_from_columns(result)
+    return start, kuvalda.classify_clients(clients)
+
+
+class ResultWriter:
+    """Writes classified rows as JSONL or CSV, each tagged with its row number."""
+
+    def __init__(self, f, fmt):
+        self.f = f
+        self.csv = None
+        if fmt == "csv":
+            self.csv = csv.DictWriter(f, fieldnames=FIELDS)
+            self.csv.writeheader()
+
+    def write(self, start, results):
+        for row, result in enumerate(results, start):
+            record = {"row": row, **result}
+            if self.csv is not None:
+                self.csv.writerow(record)
+            else:
+                self.f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def classify_file(path, out, fmt=None, out_fmt="jsonl", workers=1,
+                  chunk_size=CHUNK_SIZE, columnar=False, progress=None):
+    """
+    Classifies path chunk by chunk and writes results to the file object out.
+    workers > 1 enables the process pool. progress(rows, seconds) is
+    called after every written chunk. Returns the number of rows.
+    """
+    started = time.perf_counter()
+    writer = ResultWriter(out, out_fmt)
+    chunks = iter_chunks(iter_clients(path, fmt or detect_format(path)), chunk_size)
+    rows = 0
+
+    def written(start, results):
+        nonlocal rows
+        writer.write(start, results)
+        rows += len(results)
+        if progress:
+            progress(rows, time.perf_counter() - started)
+
+    if workers <= 1:
+        for start, clients in chunks:
+            written(*classify_chunk(start, clients, columnar))
+        return rows
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for start, clients in chunks:
+            pending.append(pool.submit(classify_chunk, start, clients, columnar))
+            # bounded read-ahead: wait for the oldest chunk before reading more
+            if len(pending) >= 2 * workers:
+                written(*pending.popleft().result())
+        while pending:
+            written(*pending.popleft().result())
+    return rows
+
+
+def print_progress(rows, seconds):
+    rate = rows / seconds if seconds > 0 else 0.0
+    print(f"\r{rows} rows, {rate:.0f} rows/s", end="", file=sys.stderr, flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming client classification for CSV/JSONL files")
+    parser.add_argument("path")
+    parser.add_argument("--out", help="output file (default: stdout)")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="input format (default: by extension)")
+    parser.add_argument("--workers", type=int, default=1, help="number of processes (0 - all cores)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--columnar", action="store_true", help="use the vectorized classifier")
+    parser.add_argument("--quiet", action="store_true", help="do not show progress")
+    args = parser.parse_args()
+
+    workers = args.workers or os.cpu_count()
+    out_fmt = "csv" if args.out and args.out.lower().endswith(".csv") else "jsonl"
+    out = open(args.out, "w", encoding="utf-8", newline="") if args.out else sys.stdout
+    try:
+        rows = classify_file(args.path, out, args.format, out_fmt, workers, args.chunk_size,
+                             args.columnar, None if args.quiet else print_progress)
+    finally:
+        if args.out:
+            out.close()
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(f"Classified {rows} rows", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,60 +1,416 @@
-import socket
-import time
-
-# адреса та порт сервера
-HOST = '127.0.0.1'
-PORT = 5000
-
-
-def start_client():
-    """
-    Функція запуску клієнта
-    """
-    # створюємо TCP-сокет
-    client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-
-    # підключаємося до сервера
-    client_socket.connect((HOST, PORT))
-    print("Підключено до сервера")
-
-    try:
-        while True:
-            # отримуємо повідомлення від сервера
-            data = client_socket.recv(1024).decode()
-
-            # якщо сервер нічого не надіслав — виходимо
-            if not data:
-                break
-
-            print(f"Отримано повідомлення: {data}")
-
-            # якщо повідомлення має формат MSG:id
-            if data.startswith("MSG:"):
-                # витягуємо ID повідомлення
-                message_id = data.split(":")[1]
-
-                # імітація обробки повідомлення
-                time.sleep(0.5)
-
-                # формуємо підтвердження доставки
-                ack = f"ACK:{message_id}"
-
-                # надсилаємо підтвердження серверу
-                client_socket.send(ack.encode())
-                print(f"Надіслано підтвердження: {ack}")
-
-    except ConnectionResetError:
-        print("З’єднання з сервером втрачено")
-
-    finally:
-        # закриваємо сокет
-        client_socket.close()
-        print("Клієнт завершив роботу")
-
-
-if __name__ == "__main__":
-    start_client()
-
-
-# cd D:\exam
+import asyncio
+import queue
+import socket
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import framing
+
+# адреса та порт сервера
+HOST = '127.0.0.1'
+PORT = 5000
+
+# імітація часу обробки одного повідомлення (секунди)
+PROCESSING_TIME = 0.5
+
+# найбільше id в одному кадрі SACK
+MAX_SACK_IDS = 0xFFFF // framing.ID.size
+
+
+def start_client(session=None):
+    """
+    Функція запуску клієнта.
+    Якщо задано session, сервер продовжить доставку з останнього
+    підтвердженого повідомлення цієї сесії.
+    """
+    # створюємо TCP-сокет
+    client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+
+    # підключаємося до сервера
+    client_socket.connect((HOST, PORT))
+    if session:
+        client_socket.sendall(f"HELLO:SESSION:{session}\n".encode())
+    print("Підключено до сервера")
+
+    # кілька MSG можуть прийти одним читанням (повтор після таймауту)
+    messages = framing.LegacyParser(b"MSG")
+
+    try:
+        while True:
+            # отримуємо повідомлення від сервера
+            data = client_socket.recv(1024)
+
+            # якщо сервер нічого не надіслав — виходимо
+            if not data:
+                break
+
+            print(f"Отримано повідомлення: {data.decode(errors='replace')}")
+
+            # кожне повідомлення формату MSG:id
+            for message_id in messages.feed(data):
+                # імітація обробки повідомлення
+                time.sleep(0.5)
+
+                # формуємо підтвердження доставки
+                ack = f"ACK:{message_id}"
+
+                # надсилаємо підтвердження серверу
+                client_socket.send(ack.encode())
+                print(f"Надіслано підтвердження: {ack}")
+
+    except ConnectionResetError:
+        print("З’єднання з сервером втрачено")
+
+    finally:
+        # закриваємо сокет
+        client_socket.close()
+        print("Клієнт завершив роботу")
+
+
+def start_windowed_client(window=8, session=None):
+    """
+    Клієнт конвеєрного режиму: просить у сервера вікно розміром window
+    і підтверджує повідомлення кумулятивно (CACK) або вибірково (SACK).
+    """
+    client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    client_socket.connect((HOST, PORT))
+    hello = f"HELLO:WINDOW:{window}"
+    if session:
+        hello += f":SESSION:{session}"
+    client_socket.sendall(f"{hello}\n".encode())
+    print("Підключено до сервера")
+
+    # повідомлення в цьому режимі — рядки, що закінчуються \n
+    stream = client_socket.makefile("rb")
+
+    received = set()      # оброблені id
+    next_expected = 0     # усі id менші за нього вже оброблені
+
+    try:
+        for line in stream:
+            data = line.decode().strip()
+            print(f"Отримано повідомлення: {data}")
+
+            if data.startswith("WINDOW:"):
+                print(f"Сервер погодив вікно {data.split(':')[1]}")
+                continue
+
+            if not data.startswith("MSG:"):
+                continue
+
+            message_id = int(data.split(":")[1])
+
+            # повтор уже обробленого повідомлення лише підтверджуємо
+            if message_id >= next_expected and message_id not in received:
+                time.sleep(0.5)
+                received.add(message_id)
+
+            while next_expected in received:
+                received.discard(next_expected)
+                next_expected += 1
+
+            if message_id < next_expected:
+                ack = f"CACK:{next_expected - 1}"
+            else:
+                ack = f"SACK:{message_id}"
+
+            client_socket.sendall(f"{ack}\n".encode())
+            print(f"Надіслано підтвердження: {ack}")
+
+    except ConnectionResetError:
+        print("З’єднання з сервером втрачено")
+
+    finally:
+        stream.close()
+        client_socket.close()
+        print("Клієнт завершив роботу")
+
+
+def start_framed_client(window=8, session=None):
+    """
+    Клієнт кадрового режиму (framing.py): одне читання з сокета
+    може принести багато кадрів MSG, підтвердження на них
+    відправляються одним пакетом.
+    """
+    client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    client_socket.connect((HOST, PORT))
+    client_socket.sendall(framing.MAGIC + framing.encode_hello(window, session or ""))
+    print("Підключено до сервера")
+
+    buffer = framing.FrameBuffer()
+    out = framing.FrameWriter()
+
+    received = set()      # оброблені id
+    next_expected = 0     # усі id менші за нього вже оброблені
+
+    try:
+        while buffer.recv_from(client_socket):
+            for kind, body in buffer.frames():
+                if kind == framing.WINDOW:
+                    print(f"Сервер погодив вікно {framing.read_id(body)}")
+                    continue
+
+                if kind != framing.MSG:
+                    continue
+
+                message_id = framing.read_id(body)
+                print(f"Отримано повідомлення: MSG:{message_id}")
+
+                if message_id >= next_expected and message_id not in received:
+                    time.sleep(0.5)
+                    received.add(message_id)
+
+                while next_expected in received:
+                    received.discard(next_expected)
+                    next_expected += 1
+
+                if message_id >= next_expected:
+                    out.add(framing.SACK, message_id)
+
+            # одне кумулятивне підтвердження на все, що прийшло разом
+            if next_expected:
+                out.add(framing.CACK, next_expected - 1)
+            out.flush(client_socket)
+            print(f"Надіслано підтвердження до MSG:{next_expected - 1}")
+
+    except ConnectionResetError:
+        print("З’єднання з сервером втрачено")
+
+    finally:
+        client_socket.close()
+        print("Клієнт завершив роботу")
+
+
+def process_message(message_id):
+    """Обробка одного повідомлення (імітація)."""
+    time.sleep(PROCESSING_TIME)
+    return message_id
+
+
+class AckBatcher:
+    """
+    Збирає підтвердження оброблених повідомлень для відправки пакетом.
+    strict_order=True — ACK відправляються в порядку надходження
+    повідомлень: готове повідомлення чекає, доки оброблять попередні.
+    """
+
+    def __init__(self, strict_order=False):
+        self.strict_order = strict_order
+        self.arrived = deque()    # порядок надходження (strict_order)
+        self.finished = set()     # оброблені, але ще не підтверджені
+        self.ready = []           # id для наступного пакета
+        self.acked = set()        # id, підтвердження яких уже відправлено
+
+    def received(self, message_id):
+        if self.strict_order:
+            self.arrived.append(message_id)
+
+    def done(self, message_id):
+        if self.strict_order:
+            self.finished.add(message_id)
+        else:
+            self.ready.append(message_id)
+
+    def again(self, message_id):
+        """
+        Повтор повідомлення, ACK якого вже відправлено, — підтверджуємо знову.
+        Повтори повідомлень, що ще обробляються, сюди не потрапляють.
+        """
+        self.ready.append(message_id)
+
+    def write(self, out):
+        """Додає в out кадри SACK. Повертає кількість підтверджених id."""
+        ids = self.ready
+        self.ready = []
+        while self.arrived and self.arrived[0] in self.finished:
+            message_id = self.arrived.popleft()
+            self.finished.discard(message_id)
+            ids.append(message_id)
+
+        for start in range(0, len(ids), MAX_SACK_IDS):
+            out.add(framing.SACK, *ids[start:start + MAX_SACK_IDS])
+        self.acked.update(ids)
+        return len(ids)
+
+
+def start_pipelined_client(window=8, workers=4, strict_order=False, session=None):
+    """
+    Кадровий клієнт з пулом потоків: повідомлення обробляються
+    паралельно (до workers одночасно), а ACK відправляються одразу
+    після обробки — усі готові на момент запису одним пакетом.
+    """
+    client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    client_socket.connect((HOST, PORT))
+    client_socket.sendall(framing.MAGIC + framing.encode_hello(window, session or ""))
+    print("Підключено до сервера")
+
+    buffer = framing.FrameBuffer()
+    batcher = AckBatcher(strict_order)
+    completed = queue.SimpleQueue()   # (id, повтор?) або None — кінець
+    seen = set()                      # усі отримані id (в обробці або вже підтверджені)
+
+    def send_acks():
+        out = framing.FrameWriter()
+        while True:
+            item = completed.get()
+            # забираємо все, що вже готове, щоб відправити одним записом
+            while item is not None:
+                message_id, repeat = item
+                if repeat:
+                    batcher.again(message_id)
+                else:
+                    batcher.done(message_id)
+                try:
+                    item = completed.get_nowait()
+                except queue.Empty:
+                    break
+            count = batcher.write(out)
+            if count:
+                try:
+                    out.flush(client_socket)
+                except OSError:
+                    return
+                print(f"Надіслано підтверджень: {count}")
+            if item is None:
+                return
+
+    sender = threading.Thread(target=send_acks, daemon=True)
+    sender.start()
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while buffer.recv_from(client_socket):
+                for kind, body in buffer.frames():
+                    if kind == framing.WINDOW:
+                        print(f"Сервер погодив вікно {framing.read_id(body)}")
+                        continue
+                    if kind != framing.MSG:
+                        continue
+
+                    message_id = framing.read_id(body)
+                    print(f"Отримано повідомлення: MSG:{message_id}")
+
+                    if message_id in seen:
+                        # ACK ще не відправлено (у черзі пулу, в обробці чи
+                        # чекає на попередні) — повтор просто відкидаємо
+                        if message_id in batcher.acked:
+                            completed.put((message_id, True))
+                        continue
+                    seen.add(message_id)
+                    batcher.received(message_id)
+                    future = pool.submit(process_message, message_id)
+                    future.add_done_callback(lambda f: completed.put((f.result(), False)))
+
+    except ConnectionResetError:
+        print("З’єднання з сервером втрачено")
+
+    finally:
+        completed.put(None)
+        sender.join()
+        client_socket.close()
+        print("Клієнт завершив роботу")
+
+
+async def run_async_pipelined_client(window=8, workers=4, strict_order=False, session=None):
+    """
+    Той самий конвеєр на asyncio: кожне повідомлення — окрема задача,
+    одночасно виконується не більше workers задач.
+    """
+    reader, writer = await asyncio.open_connection(HOST, PORT)
+    writer.write(framing.MAGIC + framing.encode_hello(window, session or ""))
+    print("Підключено до сервера")
+
+    buffer = framing.FrameBuffer()
+    out = framing.FrameWriter()
+    batcher = AckBatcher(strict_order)
+    limit = asyncio.Semaphore(workers)
+    ready = asyncio.Event()
+    seen = set()
+    tasks = set()
+
+    async def work(message_id):
+        async with limit:
+            await asyncio.sleep(PROCESSING_TIME)
+        batcher.done(message_id)
+        ready.set()
+
+    async def send_acks():
+        while True:
+            await ready.wait()
+            # даємо завершитися іншим готовим задачам, щоб відправити їх разом
+            await asyncio.sleep(0)
+            ready.clear()
+            count = batcher.write(out)
+            if count:
+                writer.write(out.take())
+                print(f"Надіслано підтверджень: {count}")
+
+    sender = asyncio.create_task(send_acks())
+    try:
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            buffer.feed(data)
+            for kind, body in buffer.frames():
+                if kind == framing.WINDOW:
+                    print(f"Сервер погодив вікно {framing.read_id(body)}")
+                    continue
+                if kind != framing.MSG:
+                    continue
+
+                message_id = framing.read_id(body)
+                print(f"Отримано повідомлення: MSG:{message_id}")
+
+                if message_id in seen:
+                    # повтор повідомлення, яке ще не підтверджено, відкидаємо
+                    if message_id in batcher.acked:
+                        batcher.again(message_id)
+                        ready.set()
+                    continue
+                seen.add(message_id)
+                batcher.received(message_id)
+                task = asyncio.create_task(work(message_id))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+    except ConnectionResetError:
+        print("З’єднання з сервером втрачено")
+
+    finally:
+        sender.cancel()
+        for task in tasks:
+            task.cancel()
+        writer.close()
+        print("Клієнт завершив роботу")
+
+
+if __name__ == "__main__":
+    session = None
+    if "--session" in sys.argv:
+        session = sys.argv[sys.argv.index("--session") + 1]
+
+    workers = None
+    if "--workers" in sys.argv:
+        workers = int(sys.argv[sys.argv.index("--workers") + 1])
+    strict_order = "--strict" in sys.argv
+
+    if "--framed" in sys.argv and workers:
+        window = int(sys.argv[sys.argv.index("--framed") + 1])
+        if "--asyncio" in sys.argv:
+            asyncio.run(run_async_pipelined_client(window, workers, strict_order, session))
+        else:
+            start_pipelined_client(window, workers, strict_order, session)
+    elif "--framed" in sys.argv:
+        start_framed_client(int(sys.argv[sys.argv.index("--framed") + 1]), session)
+    elif "--window" in sys.argv:
+        start_windowed_client(int(sys.argv[sys.argv.index("--window") + 1]), session)
+    else:
+        start_client(session)
+
+
+# cd D:\exam
 # python client.py
\ No newline at end of file
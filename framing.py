@@ -0,0 +1,177 @@
+# framing.py
+# Бінарні кадри з префіксом довжини для трафіку MSG/ACK.
+#
+# Кадр:  довжина тіла (uint16) | тип (uint8) | тіло
+# Тіло MSG/ACK/CACK — один id (uint32), SACK — кілька id,
+# HELLO/WINDOW — розмір вікна (uint32); HELLO може далі містити
+# ідентифікатор сесії (ASCII). Усі числа в мережевому порядку.
+#
+# Клієнт, що хоче кадровий режим, першими байтами надсилає MAGIC,
+# а за ним — кадр HELLO.
+#
+# Старий текстовий протокол ("MSG:<id>", "ACK:<id>" без роздільників)
+# розбирає LegacyParser: кілька повідомлень в одному читанні та
+# повідомлення, розірване між читаннями, більше не ламають обмін.
+import re
+import struct
+
+MAGIC = b"FRM1"
+
+HEADER = struct.Struct("!HB")
+ID = struct.Struct("!I")
+
+MSG = 1
+ACK = 2
+CACK = 3
+SACK = 4
+HELLO = 5
+WINDOW = 6
+
+# найбільший можливий кадр
+MAX_FRAME = HEADER.size + 0xFFFF
+
+
+def encode(kind, *ids):
+    """Один кадр у вигляді bytes."""
+    return struct.pack(f"!HB{len(ids)}I", ID.size * len(ids), kind, *ids)
+
+
+def encode_hello(window, session=""):
+    session = session.encode("ascii")
+    return HEADER.pack(ID.size + len(session), HELLO) + ID.pack(window) + session
+
+
+def read_hello(body):
+    """(вікно, сесія) з тіла кадру HELLO."""
+    return read_id(body), bytes(body[ID.size:]).decode("ascii")
+
+
+def read_id(body):
+    return ID.unpack_from(body)[0]
+
+
+def read_ids(body):
+    return [value for (value,) in ID.iter_unpack(body)]
+
+
+class LegacyParser:
+    """
+    Розбір потоку старого протоколу "<PREFIX>:<id>" (prefix — b"MSG" або b"ACK").
+    Повідомлення не мають роздільника, тож id, що закінчується рівно на
+    межі читання, вважається повним: розрив усередині цифр у цьому
+    форматі не відрізнити від кінця повідомлення. Повністю цю проблему
+    знімає лише кадровий режим.
+    """
+
+    def __init__(self, prefix):
+        self.prefix = prefix + b":"
+        self.token = re.compile(re.escape(self.prefix) + rb"(\d+)")
+        self.pending = bytearray()
+
+    def feed(self, data):
+        """Додає отримані байти. Повертає список повних id."""
+        self.pending += data
+        ids = []
+        end = 0
+        for match in self.token.finditer(self.pending):
+            ids.append(int(match.group(1)))
+            end = match.end()
+        tail = bytes(self.pending[end:])
+        self.pending.clear()
+        # зберігаємо лише початок наступного повідомлення ("MS", "ACK:")
+        for start in range(len(tail)):
+            if self.prefix.startswith(tail[start:]):
+                self.pending += tail[start:]
+                break
+        return ids
+
+
+class FrameBuffer:
+    """
+    Буфер прийому, що використовується повторно.
+    Дані читаються прямо в bytearray (recv_into), а кадри віддаються
+    як memoryview на цей самий буфер — без копій і без рядків.
+    Кадри, отримані з frames(), дійсні до наступного читання.
+    """
+
+    def __init__(self, capacity=4 * MAX_FRAME):
+        self.buffer = bytearray(capacity)
+        self.view = memoryview(self.buffer)
+        self.start = 0
+        self.end = 0
+
+    def _compact(self):
+        # переносимо незавершений кадр на початок буфера
+        if self.start == 0:
+            return
+        pending = self.end - self.start
+        # bytes() — джерело й призначення перетинаються
+        self.buffer[:pending] = bytes(self.view[self.start:self.end])
+        self.start = 0
+        self.end = pending
+
+    def writable(self):
+        """Вільна частина буфера для наступного читання."""
+        if len(self.buffer) - self.end < MAX_FRAME:
+            self._compact()
+        return self.view[self.end:]
+
+    def advance(self, count):
+        self.end += count
+
+    def recv_from(self, sock):
+        """Одне читання з сокета. Повертає кількість отриманих байтів."""
+        count = sock.recv_into(self.writable())
+        self.advance(count)
+        return count
+
+    def feed(self, data):
+        """Додає вже отримані байти (для asyncio StreamReader)."""
+        data = memoryview(data)
+        while data:
+            target = self.writable()
+            count = min(len(target), len(data))
+            target[:count] = data[:count]
+            self.advance(count)
+            data = data[count:]
+            if data and self.end == len(self.buffer):
+                raise ValueError("frame buffer overflow")
+
+    def frames(self):
+        """Генератор усіх повних кадрів у буфері: (тип, тіло)."""
+        while self.end - self.start >= HEADER.size:
+            length, kind = HEADER.unpack_from(self.buffer, self.start)
+            frame_end = self.start + HEADER.size + length
+            if frame_end > self.end:
+                break
+            body = self.view[self.start + HEADER.size:frame_end]
+            self.start = frame_end
+            yield kind, body
+        if self.start == self.end:
+            self.start = self.end = 0
+
+
+class FrameWriter:
+    """
+    Накопичує кадри і відправляє їх одним системним викликом.
+    """
+
+    def __init__(self):
+        self.out = bytearray()
+
+    def add(self, kind, *ids):
+        self.out += encode(kind, *ids)
+
+    def __len__(self):
+        return len(self.out)
+
+    def take(self):
+        """Забирає накопичені байти (для asyncio writer.write)."""
+        data = bytes(self.out)
+        self.out.clear()
+        return data
+
+    def flush(self, sock):
+        if self.out:
+            sock.sendall(self.out)
+            self.out.clear()
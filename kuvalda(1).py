@@ -1,67 +1,178 @@
-# Client filtering and classification system.
-# Each client deal contains:
-# - name (string),
-# - amount (numeric value),
-# - verification status ("clean", "suspicious", "fraud").
-
-def classify_clients(clients):
-    results = []
-
-    for client in clients:
-        name = client.get("name")
-        amount = client.get("amount")
-        status = client.get("status")
-
-        # Check if the amount is a valid number.
-        # If the data type is incorrect, the client is immediately flagged.
-        if not isinstance(amount, (int, float)):
-            results.append({
-                "name": name,
-                "category": "Invalid data",
-                "decision": "Fake information detected"
-            })
-            continue
-
-        # Categorization based on the amount of the deal.
-        if amount < 100:
-            amount_category = "Low-value"
-        elif 100 <= amount < 1000:
-            amount_category = "Medium-value"
-        else:
-            amount_category = "High-value"
-
-        # Decision based on verification status.
-        match status:
-            case "clean":
-                decision = "Proceed without concerns"
-            case "suspicious":
-                decision = "Require document verification"
-            case "fraud":
-                decision = "Blacklist the client"
-            case _:
-                decision = "Unknown verification status"
-
-        results.append({
-            "name": name,
-            "category": amount_category,
-            "decision": decision
-        })
-
-    return results
-
-
-# Example data set:
-clients_data = [
-    {"name": "Ivan", "amount": 55, "status": "clean"},
-    {"name": "Maria", "amount": "500", "status": "clean"},
-    {"name": "Oleh", "amount": 420, "status": "suspicious"},
-    {"name": "Daria", "amount": 1800, "status": "fraud"},
-    {"name": "Sergiy", "amount": 730, "status": "unknown"},
-]
-
-# Running classification:
-classified = classify_clients(clients_data)
-
-# Simple output of results.
-for item in classified:
-    print(f"{item['name']}: {item['category']} — {item['decision']}")
+# Client filtering and classification system.
+# Each client deal contains:
+# - name (string),
+# - amount (numeric value),
+# - verification status ("clean", "suspicious", "fraud").
+
+import numpy as np
+
+
+def classify_clients(clients, rules=None):
+    # rules: a compiled RuleSet from classify_rules.py (config-driven policy)
+    if rules is not None:
+        return rules.classify(clients)
+
+    results = []
+
+    for client in clients:
+        name = client.get("name")
+        amount = client.get("amount")
+        status = client.get("status")
+
+        # Check if the amount is a valid number.
+        # If the data type is incorrect, the client is immediately flagged.
+        if not isinstance(amount, (int, float)):
+            results.append({
+                "name": name,
+                "category": "Invalid data",
+                "decision": "Fake information detected"
+            })
+            continue
+
+        # Categorization based on the amount of the deal.
+        if amount < 100:
+            amount_category = "Low-value"
+        elif 100 <= amount < 1000:
+            amount_category = "Medium-value"
+        else:
+            amount_category = "High-value"
+
+        # Decision based on verification status.
+        match status:
+            case "clean":
+                decision = "Proceed without concerns"
+            case "suspicious":
+                decision = "Require document verification"
+            case "fraud":
+                decision = "Blacklist the client"
+            case _:
+                decision = "Unknown verification status"
+
+        results.append({
+            "name": name,
+            "category": amount_category,
+            "decision": decision
+        })
+
+    return results
+
+
+# Columnar classification.
+# The same rules as classify_clients, applied to whole columns at once:
+# categories and decisions are returned as small integer codes that
+# index into CATEGORY_LABELS and DECISION_LABELS.
+
+AMOUNT_THRESHOLDS = np.array([100, 1000])
+
+CATEGORY_LABELS = ("Low-value", "Medium-value", "High-value", "Invalid data")
+INVALID_CATEGORY = 3
+
+DECISION_LABELS = (
+    "Proceed without concerns",
+    "Require document verification",
+    "Blacklist the client",
+    "Unknown verification status",
+    "Fake information detected",
+)
+STATUS_CODES = {"clean": 0, "suspicious": 1, "fraud": 2}
+UNKNOWN_DECISION = 3
+INVALID_DECISION = 4
+
+_is_number = np.frompyfunc(lambda value: isinstance(value, (int, float)), 1, 1)
+
+
+def _amount_column(amount):
+    """Amounts as float64 plus a mask of valid (numeric) rows."""
+    if isinstance(amount, np.ma.MaskedArray):
+        valid = ~np.ma.getmaskarray(amount)
+        values = np.ma.getdata(amount)
+    else:
+        values = np.asarray(amount)
+        valid = np.ones(values.shape, dtype=bool)
+
+    if values.dtype == object:
+        # mixed input: same isinstance rule as classify_clients
+        valid &= _is_number(values).astype(bool)
+        numbers = np.zeros(values.shape, dtype=np.float64)
+        numbers[valid] = values[valid].astype(np.float64)
+        return numbers, valid
+
+    if values.dtype.kind not in "biuf":
+        # a column of strings is invalid as a whole
+        return np.zeros(values.shape, dtype=np.float64), np.zeros(values.shape, dtype=bool)
+
+    return values.astype(np.float64, copy=False), valid
+
+
+def _status_codes(status):
+    status = np.asarray(status)
+    try:
+        unique, inverse = np.unique(status, return_inverse=True)
+    except TypeError:
+        # statuses of mixed types cannot be sorted; look them up one by one
+        return np.fromiter(
+            (STATUS_CODES.get(s, UNKNOWN_DECISION) if isinstance(s, str) else UNKNOWN_DECISION
+             for s in status),
+            dtype=np.uint8, count=len(status),
+        )
+    table = np.array(
+        [STATUS_CODES.get(s, UNKNOWN_DECISION) if isinstance(s, str) else UNKNOWN_DECISION
+         for s in unique.tolist()],
+        dtype=np.uint8,
+    )
+    return table[inverse.reshape(-1)] if len(table) else np.zeros(0, dtype=np.uint8)
+
+
+def classify_clients_columnar(columns):
+    """
+    Vectorized classify_clients.
+    columns: dict of arrays (or a NumPy structured array) with
+    "name", "amount" and "status" fields. Amounts may be a numeric
+    array, a masked array (masked = invalid) or an object array.
+    Returns a dict with "name" and uint8 "category"/"decision" codes.
+    """
+    numbers, valid = _amount_column(columns["amount"])
+
+    # NaN sorts after every threshold, matching the if/elif chain
+    category = np.searchsorted(AMOUNT_THRESHOLDS, numbers, side="right").astype(np.uint8)
+    decision = _status_codes(columns["status"])
+
+    category[~valid] = INVALID_CATEGORY
+    decision[~valid] = INVALID_DECISION
+
+    return {"name": columns["name"], "category": category, "decision": decision}
+
+
+def columns_from_records(clients):
+    """Turn a list of client dicts into the columnar input format."""
+    return {
+        "name": np.array([c.get("name") for c in clients], dtype=object),
+        "amount": np.array([c.get("amount") for c in clients], dtype=object),
+        "status": np.array([c.get("status") for c in clients], dtype=object),
+    }
+
+
+def records_from_columns(result):
+    """Turn columnar output back into classify_clients-style dicts."""
+    return [
+        {"name": name, "category": CATEGORY_LABELS[c], "decision": DECISION_LABELS[d]}
+        for name, c, d in zip(list(result["name"]), result["category"].tolist(), result["decision"].tolist())
+    ]
+
+
+# Example data set:
+clients_data = [
+    {"name": "Ivan", "amount": 55, "status": "clean"},
+    {"name": "Maria", "amount": "500", "status": "clean"},
+    {"name": "Oleh", "amount": 420, "status": "suspicious"},
+    {"name": "Daria", "amount": 1800, "status": "fraud"},
+    {"name": "Sergiy", "amount": 730, "status": "unknown"},
+]
+
+if __name__ == "__main__":
+    # Running classification:
+    classified = classify_clients(clients_data)
+
+    # Simple output of results.
+    for item in classified:
+        print(f"{item['name']}: {item['category']} — {item['decision']}")
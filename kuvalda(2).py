@@ -1,151 +1,228 @@
-import threading
-import time
-import random
-import sys
-
-
-# Warehouse class
-# Represents a supply warehouse storing medical units.
-# Each warehouse has a lock to prevent race conditions
-# when multiple runners attempt to steal simultaneously.
-# The steal() method simulates various possible outcomes:
-# - successful theft (with random stolen amount),
-# - failed attempt (nothing stolen),
-# - capture event (runner is caught and stops).
-# The warehouse never allows the meds count to go negative.
-
-class Warehouse:
-    def __init__(self, name, meds):
-        self.name = name
-        self.meds = meds
-        self.lock = threading.Lock()
-
-    def steal(self, amount):
-        """
-        Simulate a single theft attempt.
-        Outcome types:
-        - 'success': runner steals a random amount (1..requested),
-        - 'fail': no meds stolen,
-        - 'caught': runner is caught and must stop.
-        """
-        outcome = random.choice(["success", "fail", "caught"])
-
-        if outcome == "caught":
-            return ("caught", 0)
-
-        elif outcome == "fail":
-            return ("fail", 0)
-
-        elif outcome == "success":
-            stolen = min(self.meds, random.randint(1, amount))
-            self.meds -= stolen
-            return ("success", stolen)
-
-
-# Runner class (Thread)
-# Each runner represents a thief operating in a separate thread.
-# A runner performs 10 theft attempts on a warehouse.
-# For each attempt:
-# - generates a random theft amount,
-# - locks the warehouse to perform the steal safely,
-# - updates personal earnings,
-# - updates progress status shared with the main thread.
-# If the runner gets caught, it immediately stops.
-
-class Runner(threading.Thread):
-    price_per_unit = 5  # earnings per stolen medical unit
-
-    def __init__(self, name, warehouse, progress_dict):
-        super().__init__()
-        self.name = name
-        self.warehouse = warehouse
-        self.earnings = 0
-        self.progress_dict = progress_dict
-
-    def run(self):
-        total_attempts = 10
-
-        for i in range(total_attempts):
-            amount = random.randint(10, 30)
-
-            with self.warehouse.lock:
-                result, stolen = self.warehouse.steal(amount)
-
-                if result == "success":
-                    self.earnings += stolen * self.price_per_unit
-
-                elif result == "caught":
-                    self.progress_dict[self.name] = f"CAUGHT at attempt {i+1}"
-                    break
-
-            self.progress_dict[self.name] = f"{i+1}/{total_attempts}"
-
-            time.sleep(random.uniform(0.1, 0.5))
-
-        if "CAUGHT" not in self.progress_dict[self.name]:
-            self.progress_dict[self.name] += " (done)"
-
-
-# Progress bar display
-# Continuously clears and redraws the terminal to show
-# the live progress of each runner. This allows observing
-# thread activity in real time.
-
-def display_progress(progress_dict):
-    sys.stdout.write("\033[2J\033[H")
-    print("=== RUNNER PROGRESS ===")
-    for runner, status in progress_dict.items():
-        print(f"{runner:<12}: {status}")
-    print("========================")
-
-
-# Single simulation run
-def simulate():
-    warehouses = [
-        Warehouse("Depot A", random.randint(100, 300)),
-        Warehouse("Depot B", random.randint(100, 300)),
-        Warehouse("Depot C", random.randint(100, 300)),
-        Warehouse("Depot D", random.randint(100, 300)),
-    ]
-
-    progress = {}
-
-    runners = []
-    for i in range(5):
-        wh = random.choice(warehouses)
-        name = f"Runner_{i+1}"
-        progress[name] = "0/10"
-        r = Runner(name, wh, progress)
-        runners.append(r)
-
-    for r in runners:
-        r.start()
-
-    while any(r.is_alive() for r in runners):
-        display_progress(progress)
-        time.sleep(0.2)
-
-    display_progress(progress)
-
-    print("\n=== FINAL REPORT ===")
-    total_earnings = sum(r.earnings for r in runners)
-
-    print("\nRemaining meds per warehouse:")
-    for wh in warehouses:
-        print(f"{wh.name}: {wh.meds} units left")
-
-    print("\nEarnings per runner:")
-    for r in runners:
-        print(f"{r.name}: earned {r.earnings}")
-
-    print(f"\nTOTAL EARNED: {total_earnings}")
-    print("======================")
-    return total_earnings
-
-
-# Run multiple simulations
-if __name__ == "__main__":
-    for sim in range(3):
-        print(f"\n\n########### SIMULATION {sim+1} ###########")
-        simulate()
-        time.sleep(2)
+import heapq
+import threading
+import time
+import random
+import sys
+
+from progress_renderer import ProgressBoard
+
+
+# Warehouse class
+# Represents a supply warehouse storing medical units.
+# Each warehouse has a lock to prevent race conditions
+# when multiple runners attempt to steal simultaneously.
+# The steal() method simulates various possible outcomes:
+# - successful theft (with random stolen amount),
+# - failed attempt (nothing stolen),
+# - capture event (runner is caught and stops).
+# The warehouse never allows the meds count to go negative.
+
+class Warehouse:
+    def __init__(self, name, meds):
+        self.name = name
+        self.meds = meds
+        self.lock = threading.Lock()
+
+    def steal(self, amount, rng=random):
+        """
+        Simulate a single theft attempt.
+        Outcome types:
+        - 'success': runner steals a random amount (1..requested),
+        - 'fail': no meds stolen,
+        - 'caught': runner is caught and must stop.
+        rng: source of randomness (a seeded random.Random for
+        reproducible runs).
+        """
+        outcome = rng.choice(["success", "fail", "caught"])
+
+        if outcome == "caught":
+            return ("caught", 0)
+
+        elif outcome == "fail":
+            return ("fail", 0)
+
+        elif outcome == "success":
+            stolen = min(self.meds, rng.randint(1, amount))
+            self.meds -= stolen
+            return ("success", stolen)
+
+
+# Runner class (Thread)
+# Each runner represents a thief operating in a separate thread.
+# A runner performs 10 theft attempts on a warehouse.
+# For each attempt:
+# - generates a random theft amount,
+# - locks the warehouse to perform the steal safely,
+# - updates personal earnings,
+# - updates progress status shared with the main thread.
+# If the runner gets caught, it immediately stops.
+
+class Runner(threading.Thread):
+    price_per_unit = 5  # earnings per stolen medical unit
+
+    def __init__(self, name, warehouse, progress_dict, attempts=10):
+        super().__init__()
+        self.name = name
+        self.warehouse = warehouse
+        self.earnings = 0
+        self.progress_dict = progress_dict
+        self.attempts = attempts
+
+    def run(self):
+        total_attempts = self.attempts
+
+        for i in range(total_attempts):
+            amount = random.randint(10, 30)
+
+            with self.warehouse.lock:
+                result, stolen = self.warehouse.steal(amount)
+
+                if result == "success":
+                    self.earnings += stolen * self.price_per_unit
+
+                elif result == "caught":
+                    self.progress_dict[self.name] = f"CAUGHT at attempt {i+1}"
+                    break
+
+            self.progress_dict[self.name] = f"{i+1}/{total_attempts}"
+
+            time.sleep(random.uniform(0.1, 0.5))
+
+        if "CAUGHT" not in self.progress_dict[self.name]:
+            self.progress_dict[self.name] += " (done)"
+
+
+# Virtual runner
+# The same runner state without a thread: its attempts are
+# events on a virtual clock (see run_events).
+
+class VirtualRunner:
+    price_per_unit = Runner.price_per_unit
+
+    def __init__(self, name, warehouse, progress_dict, attempts=10):
+        self.name = name
+        self.warehouse = warehouse
+        self.earnings = 0
+        self.progress_dict = progress_dict
+        self.attempts = attempts
+
+
+# Discrete-event engine
+# Replays Runner.run on a virtual clock: a priority queue holds the
+# time of every runner's next attempt, and the pause between attempts
+# advances the clock instead of sleeping. All randomness comes from rng,
+# so a seeded run is fully reproducible. Returns the virtual end time.
+
+def run_events(runners, rng):
+    events = [(0.0, i) for i in range(len(runners))]
+    heapq.heapify(events)
+    attempt = [0] * len(runners)
+    clock = 0.0
+
+    while events:
+        clock, index = heapq.heappop(events)
+        r = runners[index]
+        i = attempt[index]
+        amount = rng.randint(10, 30)
+
+        result, stolen = r.warehouse.steal(amount, rng)
+        if result == "success":
+            r.earnings += stolen * r.price_per_unit
+        elif result == "caught":
+            r.progress_dict[r.name] = f"CAUGHT at attempt {i+1}"
+            continue
+
+        r.progress_dict[r.name] = f"{i+1}/{r.attempts}"
+        attempt[index] = i + 1
+        if i + 1 < r.attempts:
+            heapq.heappush(events, (clock + rng.uniform(0.1, 0.5), index))
+        else:
+            r.progress_dict[r.name] += " (done)"
+
+    return clock
+
+
+# Progress bar display
+# Continuously clears and redraws the terminal to show
+# the live progress of each runner. This allows observing
+# thread activity in real time.
+
+def display_progress(progress_dict):
+    sys.stdout.write("\033[2J\033[H")
+    print("=== RUNNER PROGRESS ===")
+    for runner, status in progress_dict.items():
+        print(f"{runner:<12}: {status}")
+    print("========================")
+
+
+# Final report
+def print_report(warehouses, runners):
+    print("\n=== FINAL REPORT ===")
+    total_earnings = sum(r.earnings for r in runners)
+
+    print("\nRemaining meds per warehouse:")
+    for wh in warehouses:
+        print(f"{wh.name}: {wh.meds} units left")
+
+    print("\nEarnings per runner:")
+    for r in runners:
+        print(f"{r.name}: earned {r.earnings}")
+
+    print(f"\nTOTAL EARNED: {total_earnings}")
+    print("======================")
+    return total_earnings
+
+
+# Single simulation run
+# virtual=True runs the discrete-event engine instead of threads;
+# seed makes the virtual run reproducible.
+def simulate(runner_count=5, attempts=10, virtual=False, seed=None):
+    rng = random.Random(seed) if virtual else random
+
+    warehouses = [
+        Warehouse("Depot A", rng.randint(100, 300)),
+        Warehouse("Depot B", rng.randint(100, 300)),
+        Warehouse("Depot C", rng.randint(100, 300)),
+        Warehouse("Depot D", rng.randint(100, 300)),
+    ]
+
+    # threads publish their progress to the board, which redraws only
+    # changed lines; the virtual run just fills a dict
+    progress = {} if virtual else ProgressBoard()
+
+    runner_class = VirtualRunner if virtual else Runner
+    runners = []
+    for i in range(runner_count):
+        wh = rng.choice(warehouses)
+        name = f"Runner_{i+1}"
+        progress[name] = f"0/{attempts}"
+        r = runner_class(name, wh, progress, attempts)
+        runners.append(r)
+
+    if virtual:
+        run_events(runners, rng)
+        display_progress(progress)
+    else:
+        progress.start()
+        for r in runners:
+            r.start()
+        for r in runners:
+            r.join()
+        progress.stop()
+
+    return print_report(warehouses, runners)
+
+
+# Run multiple simulations
+# --virtual [seed] uses the discrete-event engine.
+if __name__ == "__main__":
+    virtual = "--virtual" in sys.argv
+    seed = None
+    if virtual and sys.argv.index("--virtual") + 1 < len(sys.argv):
+        seed = int(sys.argv[sys.argv.index("--virtual") + 1])
+
+    for sim in range(3):
+        print(f"\n\n########### SIMULATION {sim+1} ###########")
+        simulate(virtual=virtual, seed=None if seed is None else seed + sim)
+        if not virtual:
+            time.sleep(2)
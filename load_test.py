@@ -0,0 +1,309 @@
+# load_test.py
+# Навантажувальний тест сервера доставки: тисячі одночасних клієнтів.
+#
+#   python load_test.py --clients 2000 --processes 4 --spawn-server
+#   python load_test.py --clients 500 --mode framed --window 8 --drop-rate 0.01
+#
+# Затримка доставки — час від моменту, коли клієнт став готовий до
+# повідомлення (підключення або надіслане перед ним підтвердження),
+# до першого отримання цього повідомлення. У режимі stop-and-wait
+# вона включає паузу SEND_INTERVAL сервера.
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import framing
+from server import HOST, PORT, raise_fd_limit
+
+
+class ClientStats:
+    def __init__(self):
+        self.latencies = []
+        self.delivered = 0
+        self.retransmits = 0
+        self.dropped_acks = 0
+        self.sessions = 0
+        self.errors = 0
+
+    def merge(self, other):
+        self.latencies.extend(other.latencies)
+        self.delivered += other.delivered
+        self.retransmits += other.retransmits
+        self.dropped_acks += other.dropped_acks
+        self.sessions += other.sessions
+        self.errors += other.errors
+
+
+class Session:
+    """Стан одного з'єднання: які id вже бачили і коли стали готові."""
+
+    def __init__(self, stats, options):
+        self.stats = stats
+        self.options = options
+        self.seen = set()
+        self.ready_at = time.perf_counter()
+
+    def on_message(self, message_id):
+        """Повертає True, якщо на повідомлення треба відповісти."""
+        now = time.perf_counter()
+        if message_id in self.seen:
+            self.stats.retransmits += 1
+        else:
+            self.seen.add(message_id)
+            self.stats.delivered += 1
+            self.stats.latencies.append(now - self.ready_at)
+
+        if random.random() < self.options["drop_rate"]:
+            self.stats.dropped_acks += 1
+            return False
+        return True
+
+    def on_ack_sent(self):
+        self.ready_at = time.perf_counter()
+
+
+async def run_legacy(reader, writer, session, options):
+    while True:
+        data = await reader.read(1024)
+        if not data:
+            return
+        # кілька повідомлень можуть злитися в одне читання
+        for part in data.decode().split("MSG:")[1:]:
+            message_id = int(part)
+            if session.on_message(message_id):
+                await asyncio.sleep(options["ack_delay"])
+                writer.write(f"ACK:{message_id}".encode())
+                session.on_ack_sent()
+
+
+async def run_windowed(reader, writer, session, options):
+    writer.write(f"HELLO:WINDOW:{options['window']}\n".encode())
+    while True:
+        line = await reader.readline()
+        if not line:
+            return
+        kind, _, value = line.decode().strip().partition(":")
+        if kind != "MSG":
+            continue
+        message_id = int(value)
+        if session.on_message(message_id):
+            await asyncio.sleep(options["ack_delay"])
+            writer.write(f"SACK:{message_id}\n".encode())
+            session.on_ack_sent()
+
+
+async def run_framed(reader, writer, session, options):
+    writer.write(framing.MAGIC + framing.encode_hello(options["window"]))
+    buffer = framing.FrameBuffer()
+    out = framing.FrameWriter()
+    while True:
+        data = await reader.read(65536)
+        if not data:
+            return
+        buffer.feed(data)
+        acks = [framing.read_id(body) for kind, body in buffer.frames() if kind == framing.MSG]
+        acks = [message_id for message_id in acks if session.on_message(message_id)]
+        if acks:
+            await asyncio.sleep(options["ack_delay"])
+            out.add(framing.SACK, *acks)
+            writer.write(out.take())
+            session.on_ack_sent()
+
+
+MODES = {
+    "legacy": run_legacy,
+    "window": run_windowed,
+    "framed": run_framed,
+}
+
+
+async def run_client(stats, options):
+    """Один віртуальний клієнт: сесія та, за потреби, перепідключення."""
+    for _ in range(options["reconnects"] + 1):
+        try:
+            reader, writer = await asyncio.open_connection(options["host"], options["port"])
+        except OSError:
+            stats.errors += 1
+            await asyncio.sleep(options["reconnect_delay"])
+            continue
+
+        stats.sessions += 1
+        try:
+            await MODES[options["mode"]](reader, writer, Session(stats, options), options)
+        except (ConnectionResetError, BrokenPipeError, ValueError):
+            stats.errors += 1
+        finally:
+            writer.close()
+        await asyncio.sleep(options["reconnect_delay"])
+
+
+async def run_fleet(count, options):
+    stats = ClientStats()
+    clients = []
+    for _ in range(count):
+        clients.append(asyncio.create_task(run_client(stats, options)))
+        # розтягуємо підключення, щоб не переповнити чергу accept
+        await asyncio.sleep(options["ramp"] / max(1, count))
+    await asyncio.gather(*clients)
+    return stats
+
+
+def fleet_process(count, options):
+    """Точка входу процесу-воркера."""
+    raise_fd_limit()
+    return asyncio.run(run_fleet(count, options))
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    index = min(len(values) - 1, int(fraction * len(values)))
+    return values[index]
+
+
+class ProcessSampler:
+    """Знімає CPU і RSS процесу сервера через /proc (лише Linux)."""
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+        self.start_cpu = self.cpu_seconds()
+        self.max_rss = 0
+
+    def cpu_seconds(self):
+        try:
+            with open(f"/proc/{self.pid}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            return None
+        # utime і stime — 14-те і 15-те поля, після імені процесу — 12-те і 13-те
+        return (int(fields[11]) + int(fields[12])) / self.ticks
+
+    def sample_rss(self):
+        try:
+            with open(f"/proc/{self.pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        self.max_rss = max(self.max_rss, int(line.split()[1]) * 1024)
+        except OSError:
+            pass
+
+    def report(self, seconds):
+        end_cpu = self.cpu_seconds()
+        if self.start_cpu is None or end_cpu is None:
+            return {"cpu_seconds": None, "cpu_percent": None, "max_rss_bytes": self.max_rss or None}
+        cpu = end_cpu - self.start_cpu
+        return {
+            "cpu_seconds": cpu,
+            "cpu_percent": 100 * cpu / seconds if seconds else None,
+            "max_rss_bytes": self.max_rss or None,
+        }
+
+
+def run_load_test(clients, processes, options, server_pid=None):
+    started = time.perf_counter()
+    sampler = ProcessSampler(server_pid) if server_pid else None
+
+    stats = ClientStats()
+    shares = [clients // processes + (1 if i < clients % processes else 0) for i in range(processes)]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [pool.submit(fleet_process, share, options) for share in shares if share]
+        while sampler and not all(future.done() for future in futures):
+            sampler.sample_rss()
+            time.sleep(0.2)
+        for future in futures:
+            stats.merge(future.result())
+
+    elapsed = time.perf_counter() - started
+    latencies = sorted(stats.latencies)
+
+    return {
+        "options": options,
+        "clients": clients,
+        "processes": processes,
+        "seconds": elapsed,
+        "sessions": stats.sessions,
+        "delivered": stats.delivered,
+        "messages_per_sec": stats.delivered / elapsed if elapsed else 0.0,
+        "latency_p50": percentile(latencies, 0.50),
+        "latency_p99": percentile(latencies, 0.99),
+        "latency_p999": percentile(latencies, 0.999),
+        "retransmits": stats.retransmits,
+        "dropped_acks": stats.dropped_acks,
+        "errors": stats.errors,
+        "server": sampler.report(elapsed) if sampler else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Навантажувальний тест server.py")
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--mode", choices=sorted(MODES), default="legacy")
+    parser.add_argument("--window", type=int, default=8)
+    parser.add_argument("--ack-delay", type=float, default=0.0, help="затримка перед ACK (с)")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="частка повідомлень без ACK")
+    parser.add_argument("--reconnects", type=int, default=0, help="перепідключень на клієнта")
+    parser.add_argument("--reconnect-delay", type=float, default=0.0)
+    parser.add_argument("--ramp", type=float, default=1.0, help="час на підключення всіх клієнтів (с)")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--server-pid", type=int, help="pid сервера для замірів CPU/RSS")
+    parser.add_argument("--spawn-server", action="store_true",
+                        help="запустити python server.py --async на час тесту")
+    parser.add_argument("--report", default="load_report.json")
+    args = parser.parse_args()
+
+    options = {
+        "host": args.host,
+        "port": args.port,
+        "mode": args.mode,
+        "window": args.window,
+        "ack_delay": args.ack_delay,
+        "drop_rate": args.drop_rate,
+        "reconnects": args.reconnects,
+        "reconnect_delay": args.reconnect_delay,
+        "ramp": args.ramp,
+    }
+
+    server_process = None
+    server_pid = args.server_pid
+    if args.spawn_server:
+        server_process = subprocess.Popen(
+            [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "server.py"), "--async"],
+            stdout=subprocess.DEVNULL,
+        )
+        server_pid = server_process.pid
+        time.sleep(1)
+
+    try:
+        report = run_load_test(args.clients, args.processes, options, server_pid)
+    finally:
+        if server_process:
+            server_process.terminate()
+            server_process.wait()
+
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    def ms(value):
+        return "-" if value is None else f"{value * 1e3:.1f} ms"
+
+    print(f"Клієнтів: {report['clients']}, сесій: {report['sessions']}, помилок: {report['errors']}")
+    print(f"Доставлено: {report['delivered']} ({report['messages_per_sec']:.0f} повідомлень/с)")
+    print(f"Затримка p50/p99/p999: {ms(report['latency_p50'])} / "
+          f"{ms(report['latency_p99'])} / {ms(report['latency_p999'])}")
+    print(f"Повторні відправки: {report['retransmits']}, пропущені ACK: {report['dropped_acks']}")
+    if report["server"]:
+        print(f"Сервер: {report['server']}")
+    print(f"Звіт: {args.report}")
+
+
+if __name__ == "__main__":
+    main()
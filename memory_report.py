@@ -0,0 +1,73 @@
+# memory_report.py
+# Звіт про пам'ять: скільки байтів займає один товар у замовленні
+# до (Item з __dict__) та після (Item зі __slots__, CompactOrder).
+import sys
+import tracemalloc
+
+from order_manager import Item, Order, CompactOrder, NameTable
+
+# кількість товарів у вимірюваному замовленні
+ITEMS = 100_000
+
+# кількість різних назв товарів
+DISTINCT_NAMES = 1000
+
+
+class DictItem:
+    """Товар у старому вигляді — звичайний об'єкт з __dict__."""
+
+    def __init__(self, name, price):
+        self.name = name
+        self.price = price
+
+
+def measure(build):
+    """Кількість байтів на один товар, виділених під час build()."""
+    names = [f"item-{i % DISTINCT_NAMES}" for i in range(ITEMS)]
+    prices = [float(i) for i in range(ITEMS)]
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build(names, prices)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del result
+    return (after - before) / ITEMS
+
+
+def build_dict_items(names, prices):
+    return [DictItem(n, p) for n, p in zip(names, prices)]
+
+
+def build_slot_items(names, prices):
+    return [Item(n, p) for n, p in zip(names, prices)]
+
+
+def build_slot_order(names, prices):
+    return Order([Item(n, p) for n, p in zip(names, prices)])
+
+
+def build_compact_order(names, prices):
+    order = CompactOrder(names=NameTable())
+    for n, p in zip(names, prices):
+        order.add(n, p)
+    return order
+
+
+def main():
+    rows = [
+        ("list[DictItem] (до)", measure(build_dict_items)),
+        ("list[Item + __slots__]", measure(build_slot_items)),
+        ("Order[Item + __slots__]", measure(build_slot_order)),
+        ("CompactOrder (array)", measure(build_compact_order)),
+    ]
+
+    print(f"Python {sys.version.split()[0]}, товарів: {ITEMS}")
+    print(f"{'Представлення':<26}{'байт/товар':>12}")
+    for label, per_item in rows:
+        print(f"{label:<26}{per_item:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+# metrics.py
+# Метрики сервера доставки та вибіркове асинхронне логування.
+#
+# Кожен потік пише лише у власні лічильники (threading.local), тож
+# на гарячому шляху немає блокувань; snapshot() сумує всі потоки.
+# Лічильники завершеного потоку зливаються в один спільний підсумок,
+# тож кількість шардів не росте з кількістю з'єднань.
+# Метрики віддаються текстом через локальний HTTP (/metrics) або
+# періодично записуються у файл.
+import bisect
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+import time
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# межі кошиків гістограми часу відправка→ACK (секунди)
+RTT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+               0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+class Shard:
+    """Метрики одного потоку."""
+
+    def __init__(self):
+        self.counters = {}
+        self.histograms = {}
+
+
+def merge_into(counters, histograms, shard):
+    for name, value in shard.counters.copy().items():
+        counters[name] = counters.get(name, 0) + value
+    for name, buckets in shard.histograms.copy().items():
+        total = histograms.setdefault(name, [0] * len(buckets))
+        for i, value in enumerate(buckets):
+            total[i] += value
+
+
+class _Owner:
+    """Живе лише в threading.local потоку: зникає разом із потоком."""
+    __slots__ = ("__weakref__",)
+
+
+class Metrics:
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = set()
+        # метрики потоків, що вже завершилися
+        self._retired = Shard()
+        # реєстрація і списання потоків та читання знімків (не гарячий шлях);
+        # RLock — фіналізатор потоку може спрацювати всередині знімка
+        self._lock = threading.RLock()
+        self.shared = None
+
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = Shard()
+            owner = self._local.owner = _Owner()
+            with self._lock:
+                self._shards.add(shard)
+            # коли потік завершиться, його лічильники переходять у _retired
+            weakref.finalize(owner, self._retire, shard)
+            return shard
+
+    def _retire(self, shard):
+        with self._lock:
+            merge_into(self._retired.counters, self._retired.histograms, shard)
+            self._shards.discard(shard)
+
+    def attach_shared(self, values, row, names):
+        """
+        Дублювати лічильники names у рядок row спільного масиву
+        (prefork-режим: supervisor сумує рядки всіх воркерів).
+        """
+        offset = row * len(names)
+        self.shared = (values, offset, {name: i for i, name in enumerate(names)})
+        for i, name in enumerate(names):
+            values[offset + i] = self.get(name)
+
+    def inc(self, name, amount=1):
+        counters = self._shard().counters
+        counters[name] = counters.get(name, 0) + amount
+        if self.shared is not None:
+            values, offset, columns = self.shared
+            column = columns.get(name)
+            if column is not None:
+                values[offset + column] += amount
+
+    def observe(self, name, value):
+        histograms = self._shard().histograms
+        histogram = histograms.get(name)
+        if histogram is None:
+            # кошики, останній — понад RTT_BUCKETS[-1]; далі сума значень
+            histogram = histograms[name] = [0] * (len(RTT_BUCKETS) + 2)
+        histogram[bisect.bisect_left(RTT_BUCKETS, value)] += 1
+        histogram[-1] += value
+
+    def get(self, name):
+        with self._lock:
+            shards = [self._retired, *self._shards]
+            return sum(shard.counters.get(name, 0) for shard in shards)
+
+    def snapshot(self):
+        counters = {}
+        histograms = {}
+        with self._lock:
+            for shard in [self._retired, *self._shards]:
+                merge_into(counters, histograms, shard)
+        return counters, histograms
+
+    def render(self):
+        """Текстовий формат у стилі Prometheus."""
+        counters, histograms = self.snapshot()
+        lines = [f"{name} {value}" for name, value in sorted(counters.items())]
+        for name, buckets in sorted(histograms.items()):
+            cumulative = 0
+            for bound, count in zip(RTT_BUCKETS, buckets):
+                cumulative += count
+                lines.append(f'{name}_bucket{{le="{bound}"}} {cumulative}')
+            cumulative += buckets[len(RTT_BUCKETS)]
+            lines.append(f'{name}_bucket{{le="+Inf"}} {cumulative}')
+            lines.append(f"{name}_count {cumulative}")
+            lines.append(f"{name}_sum {buckets[-1]}")
+        return "\n".join(lines) + "\n"
+
+
+# метрики поточного процесу
+metrics = Metrics()
+
+
+def serve_http(host, port, source=metrics):
+    """
+    Віддає source.render() на http://host:port/metrics у фоновому потоці.
+    Повертає сервер (server.shutdown() — зупинка).
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = source.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def write_snapshots(path, interval=5, source=metrics):
+    """Кожні interval секунд атомарно перезаписує path знімком метрик."""
+
+    def loop():
+        while True:
+            time.sleep(interval)
+            tmp = f"{path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(source.render())
+            os.replace(tmp, path)
+
+    thread = threading.Thread(target=loop, daemon=True)
+    thread.start()
+    return thread
+
+
+class SampledLogger:
+    """
+    Логер, що пише лише частку rate повідомлень.
+    Запис у консоль виконує окремий потік (QueueListener),
+    тож гарячий шлях лише кладе запис у чергу.
+    """
+
+    def __init__(self, logger, rate=1.0):
+        self.logger = logger
+        self.rate = rate
+
+    def info(self, msg, *args):
+        if self.rate >= 1 or random.random() < self.rate:
+            self.logger.info(msg, *args)
+
+    def warning(self, msg, *args):
+        # попередження не відкидаються
+        self.logger.warning(msg, *args)
+
+
+def start_async_logging(name, stream=None):
+    """
+    Налаштовує логер name на запис через чергу у фоновому потоці.
+    Повертає QueueListener (listener.stop() дописує залишок черги).
+    """
+    records = queue.SimpleQueue()
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(records, handler)
+
+    logger = logging.getLogger(name)
+    logger.handlers[:] = [logging.handlers.QueueHandler(records)]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
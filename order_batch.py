@@ -0,0 +1,123 @@
+# order_batch.py
+import numpy as np
+
+from order_manager import Item, Order
+
+
+class OrderBatch:
+    """
+    Багато замовлень у вигляді плоских масивів NumPy.
+
+    prices  - ціни всіх товарів підряд (float64)
+    offsets - межі замовлень: товари замовлення i лежать у
+              prices[offsets[i]:offsets[i + 1]]
+    codes   - коди назв товарів в таблиці names
+    """
+
+    def __init__(self, prices, offsets, codes, names):
+        self.prices = np.asarray(prices, dtype=np.float64)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.codes = np.asarray(codes, dtype=np.int32)
+        self.names = list(names)
+
+        if self.offsets.ndim != 1 or len(self.offsets) == 0 or self.offsets[0] != 0:
+            raise ValueError("offsets must start with 0")
+        if self.offsets[-1] != len(self.prices) or len(self.codes) != len(self.prices):
+            raise ValueError("offsets, prices and codes do not match")
+        if np.any(np.diff(self.offsets) < 0):
+            raise ValueError("offsets must be non-decreasing")
+
+    @classmethod
+    def from_orders(cls, orders):
+        prices = []
+        codes = []
+        offsets = [0]
+        names = []
+        table = {}
+
+        for order in orders:
+            for item in order.items:
+                code = table.get(item.name)
+                if code is None:
+                    code = table[item.name] = len(names)
+                    names.append(item.name)
+                prices.append(item.price)
+                codes.append(code)
+            offsets.append(len(prices))
+
+        return cls(prices, offsets, codes, names)
+
+    def to_orders(self):
+        names = self.names
+        prices = self.prices.tolist()
+        codes = self.codes.tolist()
+        offsets = self.offsets.tolist()
+
+        return [
+            Order([Item(names[codes[i]], prices[i]) for i in range(start, end)])
+            for start, end in zip(offsets, offsets[1:])
+        ]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def lengths(self):
+        return np.diff(self.offsets)
+
+    def order_ids(self):
+        """Номер замовлення для кожного товару."""
+        return np.repeat(np.arange(len(self)), self.lengths())
+
+    def totals(self):
+        result = np.zeros(len(self), dtype=np.float64)
+        non_empty = self.lengths() > 0
+        if non_empty.any():
+            # порожні замовлення не мають товарів, тож сегменти між
+            # непорожніми стартами збігаються з межами замовлень
+            result[non_empty] = np.add.reduceat(self.prices, self.offsets[:-1][non_empty])
+        return result
+
+    def argmax(self):
+        """
+        Глобальний індекс найдорожчого товару кожного замовлення
+        (-1 для порожніх). Як і max(), при рівних цінах бере перший.
+        """
+        result = np.full(len(self), -1, dtype=np.int64)
+        non_empty = self.lengths() > 0
+        if not non_empty.any():
+            return result
+
+        order_ids = self.order_ids()
+        seg_max = np.full(len(self), -np.inf)
+        seg_max[non_empty] = np.maximum.reduceat(self.prices, self.offsets[:-1][non_empty])
+
+        candidates = np.flatnonzero(self.prices == seg_max[order_ids])
+        found, first = np.unique(order_ids[candidates], return_index=True)
+        result[found] = candidates[first]
+        return result
+
+    def most_expensive(self):
+        return [
+            None if i < 0 else Item(self.names[self.codes[i]], float(self.prices[i]))
+            for i in self.argmax().tolist()
+        ]
+
+    def apply_discount(self, percent):
+        """
+        Знижка для всіх замовлень: одне число або масив
+        з окремим відсотком для кожного замовлення.
+        """
+        percent = np.asarray(percent, dtype=np.float64)
+        if np.any((percent < 0) | (percent > 100)):
+            raise ValueError("Discount must be between 0 and 100")
+
+        factor = 1 - percent / 100
+        if factor.ndim == 0:
+            self.prices *= factor
+        else:
+            if factor.shape != (len(self),):
+                raise ValueError("Expected one discount per order")
+            self.prices *= np.repeat(factor, self.lengths())
+
+    def __repr__(self):
+        return f"OrderBatch(orders={len(self)}, items={len(self.prices)})"
@@ -0,0 +1,161 @@
+# order_ingest.py
+# Потокове завантаження замовлень із JSONL-файлу.
+# Кожен рядок файлу — одне замовлення:
+#   {"id": "42", "items": [{"name": "A", "price": 10.5}, ...], "discount": 10}
+# Поле "discount" необов'язкове.
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from order_manager import Item, Order
+
+
+def parse_order(line):
+    """
+    Розбирає один рядок JSONL.
+    Повертає (id, Order, discount) або None для порожнього рядка.
+    """
+    line = line.strip()
+    if not line:
+        return None
+    data = json.loads(line)
+    items = [Item(item["name"], item["price"]) for item in data.get("items", [])]
+    return data.get("id"), Order(items), data.get("discount", 0)
+
+
+def iter_lines(path, start=0, end=None):
+    """
+    Читає рядки, що починаються в діапазоні байтів [start, end).
+    Рядок належить тому діапазону, в якому лежить його перший байт,
+    тож сусідні діапазони не дублюють і не гублять рядків.
+    """
+    with open(path, "rb") as f:
+        if start > 0:
+            # дочитуємо рядок, що почався до start
+            f.seek(start - 1)
+            f.readline()
+        while end is None or f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            yield line
+
+
+def iter_orders(path, start=0, end=None):
+    for line in iter_lines(path, start, end):
+        parsed = parse_order(line)
+        if parsed is not None:
+            yield parsed
+
+
+def summarize_order(order_id, order, discount=0):
+    """Агрегати одного замовлення."""
+    total = order.total()
+    top = order.most_expensive()
+    order.apply_discount(discount)
+    return {
+        "id": order_id,
+        "total": total,
+        "most_expensive": None if top is None else (top.name, top.price),
+        "discounted_total": order.total(),
+    }
+
+
+def ingest(path, discount=None, start=0, end=None):
+    """
+    Генератор агрегатів по кожному замовленню файлу.
+    discount, якщо задано, замінює знижку з файлу.
+    """
+    for order_id, order, file_discount in iter_orders(path, start, end):
+        yield summarize_order(order_id, order, file_discount if discount is None else discount)
+
+
+def new_stats():
+    return {
+        "orders": 0,
+        "items_total": 0,
+        "discounted_total": 0,
+        "most_expensive": None,
+    }
+
+
+def add_summary(stats, summary):
+    stats["orders"] += 1
+    stats["items_total"] += summary["total"]
+    stats["discounted_total"] += summary["discounted_total"]
+    top = summary["most_expensive"]
+    if top is not None and (stats["most_expensive"] is None or top[1] > stats["most_expensive"][1]):
+        stats["most_expensive"] = top
+
+
+def merge_stats(stats, other):
+    stats["orders"] += other["orders"]
+    stats["items_total"] += other["items_total"]
+    stats["discounted_total"] += other["discounted_total"]
+    top = other["most_expensive"]
+    if top is not None and (stats["most_expensive"] is None or top[1] > stats["most_expensive"][1]):
+        stats["most_expensive"] = top
+
+
+def ingest_range(path, start, end, discount=None):
+    """Агрегати для одного шматка файлу (виконується у воркері)."""
+    stats = new_stats()
+    for summary in ingest(path, discount, start, end):
+        add_summary(stats, summary)
+    return stats
+
+
+def shard_ranges(path, shards):
+    """Ділить файл на shards приблизно рівних діапазонів байтів."""
+    size = os.path.getsize(path)
+    step = max(1, -(-size // shards))
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+
+def run(path, workers=1, discount=None):
+    """
+    Обробляє весь файл і повертає сумарні агрегати
+    разом із пропускною здатністю (замовлень за секунду).
+    workers > 1 вмикає режим пулу процесів.
+    """
+    started = time.perf_counter()
+
+    if workers <= 1:
+        stats = ingest_range(path, 0, None, discount)
+    else:
+        stats = new_stats()
+        ranges = shard_ranges(path, workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(ingest_range, path, start, end, discount) for start, end in ranges]
+            for future in futures:
+                merge_stats(stats, future.result())
+
+    elapsed = time.perf_counter() - started
+    stats["seconds"] = elapsed
+    stats["orders_per_sec"] = stats["orders"] / elapsed if elapsed > 0 else 0.0
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Потокова обробка замовлень з JSONL")
+    parser.add_argument("path")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="кількість процесів (0 — усі ядра)")
+    parser.add_argument("--discount", type=float, default=None,
+                        help="знижка для всіх замовлень замість знижки з файлу")
+    args = parser.parse_args()
+
+    workers = args.workers or os.cpu_count()
+    stats = run(args.path, workers, args.discount)
+
+    print(f"Замовлень: {stats['orders']}")
+    print(f"Сума: {stats['items_total']:.2f}")
+    print(f"Сума зі знижками: {stats['discounted_total']:.2f}")
+    print(f"Найдорожчий товар: {stats['most_expensive']}")
+    print(f"Час: {stats['seconds']:.3f} с, {stats['orders_per_sec']:.0f} замовлень/с")
+
+
+if __name__ == "__main__":
+    main()
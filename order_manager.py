@@ -1,31 +1,226 @@
-# order_manager.py
-
-class Item:
-    def __init__(self, name, price):
-        self.name = name
-        self.price = price
-
-    def __repr__(self):
-        return f"Item({self.name!r}, {self.price})"
-
-
-class Order:
-    def __init__(self, items=None):
-        self.items = items or []
-
-    def total(self):
-        return sum(item.price for item in self.items)
-
-    def most_expensive(self):
-        if not self.items:
-            return None
-        return max(self.items, key=lambda x: x.price)
-
-    def apply_discount(self, percent):
-        if percent < 0 or percent > 100:
-            raise ValueError("Discount must be between 0 and 100")
-        for item in self.items:
-            item.price = item.price * (1 - percent / 100)
-
-    def __repr__(self):
-        return f"Order({self.items})"
+# order_manager.py
+import heapq
+from array import array
+
+
+class Item:
+    __slots__ = ("name", "price")
+
+    def __init__(self, name, price):
+        self.name = name
+        self.price = price
+
+    def __repr__(self):
+        return f"Item({self.name!r}, {self.price})"
+
+
+class Order:
+    """
+    Замовлення з накопичувальною сумою та купою для пошуку максимуму.
+
+    Знижки не переписують ціни одразу, а множаться в self._factor;
+    ціни товарів оновлюються лише тоді, коли їх читають (items,
+    most_expensive) або коли змінюється склад замовлення.
+    Ціни товарів слід змінювати тільки через методи Order.
+    """
+
+    __slots__ = ("_items", "_seqs", "_next_seq", "_factor", "_total", "_live", "_heap")
+
+    def __init__(self, items=None):
+        self.items = items or []
+
+    @property
+    def items(self):
+        self._flush()
+        return self._items
+
+    @items.setter
+    def items(self, items):
+        self._items = items
+        self._seqs = list(range(len(items)))
+        self._next_seq = len(items)
+        self._factor = 1
+        self._rebuild()
+
+    def _rebuild(self):
+        self._total = sum(item.price for item in self._items)
+        self._live = set(self._seqs)
+        self._heap = [(-item.price, seq, item) for seq, item in zip(self._seqs, self._items)]
+        heapq.heapify(self._heap)
+
+    def _flush(self):
+        # застосовуємо відкладену знижку до цін товарів
+        if self._factor == 1:
+            return
+        for item in self._items:
+            item.price = item.price * self._factor
+        self._factor = 1
+        self._rebuild()
+
+    def add_item(self, item):
+        self._flush()
+        seq = self._next_seq
+        self._next_seq += 1
+        self._items.append(item)
+        self._seqs.append(seq)
+        self._live.add(seq)
+        self._total += item.price
+        heapq.heappush(self._heap, (-item.price, seq, item))
+
+    def remove_item(self, item):
+        for index, current in enumerate(self._items):
+            if current is item:
+                break
+        else:
+            raise ValueError(f"{item!r} is not in order")
+
+        del self._items[index]
+        self._live.discard(self._seqs.pop(index))
+        self._total -= item.price
+        if not self._items:
+            self._total = 0
+
+        # видалені записи лишаються в купі, доки не опиняться на вершині
+        if len(self._heap) > 2 * len(self._live) + 16:
+            self._heap = [entry for entry in self._heap if entry[1] in self._live]
+            heapq.heapify(self._heap)
+
+    def total(self):
+        return self._total * self._factor
+
+    def most_expensive(self):
+        if not self._items:
+            return None
+        self._flush()
+        while self._heap[0][1] not in self._live:
+            heapq.heappop(self._heap)
+        return self._heap[0][2]
+
+    def apply_discount(self, percent):
+        if percent < 0 or percent > 100:
+            raise ValueError("Discount must be between 0 and 100")
+        self._factor = self._factor * (1 - percent / 100)
+
+    def __repr__(self):
+        return f"Order({self.items})"
+
+
+class NameTable:
+    """
+    Спільна таблиця назв товарів: кожна назва зберігається один раз,
+    а замовлення тримають лише її числовий код.
+    """
+
+    def __init__(self):
+        self.names = []
+        self.codes = {}
+
+    def intern(self, name):
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+    def __len__(self):
+        return len(self.names)
+
+
+# таблиця за замовчуванням, спільна для всіх компактних замовлень
+NAMES = NameTable()
+
+
+class ItemView:
+    """Легкий погляд на товар усередині CompactOrder."""
+
+    __slots__ = ("_order", "_index")
+
+    def __init__(self, order, index):
+        self._order = order
+        self._index = index
+
+    @property
+    def name(self):
+        return self._order.names.names[self._order.codes[self._index]]
+
+    @property
+    def price(self):
+        return self._order.prices[self._index] * self._order._factor
+
+    def __repr__(self):
+        return f"Item({self.name!r}, {self.price})"
+
+
+class CompactOrder:
+    """
+    Замовлення, що зберігає ціни в array('d'), а назви — кодами
+    у спільній NameTable. Об'єкти товарів створюються лише на вимогу.
+    Знижка, як і в Order, зберігається множником.
+    """
+
+    __slots__ = ("prices", "codes", "names", "_factor", "_total", "_max_index")
+
+    def __init__(self, items=None, names=None):
+        self.prices = array("d")
+        self.codes = array("I")
+        self.names = NAMES if names is None else names
+        self._factor = 1
+        self._total = 0
+        self._max_index = -1
+        for item in items or []:
+            self.add_item(item)
+
+    def add_item(self, item):
+        self.add(item.name, item.price)
+
+    def add(self, name, price):
+        if self._factor != 1:
+            # зберігаємо ціну в тих самих одиницях, що й решта масиву
+            if self._factor == 0:
+                self._reset_factor()
+            else:
+                price = price / self._factor
+        self.prices.append(price)
+        self.codes.append(self.names.intern(name))
+        self._total += price
+        if self._max_index < 0 or price > self.prices[self._max_index]:
+            self._max_index = len(self.prices) - 1
+
+    def _reset_factor(self):
+        for i in range(len(self.prices)):
+            self.prices[i] *= self._factor
+        self._factor = 1
+        self._total = sum(self.prices)
+
+    def __len__(self):
+        return len(self.prices)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.prices)
+        if not 0 <= index < len(self.prices):
+            raise IndexError("item index out of range")
+        return ItemView(self, index)
+
+    @property
+    def items(self):
+        return [ItemView(self, i) for i in range(len(self.prices))]
+
+    def total(self):
+        return self._total * self._factor
+
+    def most_expensive(self):
+        if self._max_index < 0:
+            return None
+        return ItemView(self, self._max_index)
+
+    def apply_discount(self, percent):
+        if percent < 0 or percent > 100:
+            raise ValueError("Discount must be between 0 and 100")
+        self._factor = self._factor * (1 - percent / 100)
+
+    def to_order(self):
+        return Order([Item(view.name, view.price) for view in self.items])
+
+    def __repr__(self):
+        return f"CompactOrder({self.items})"
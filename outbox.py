@@ -0,0 +1,169 @@
+# outbox.py
+# Стійка черга вихідних повідомлень для сесій клієнтів.
+#
+# Кожна сесія — два файли в каталозі сховища:
+#   <session>.log  - журнал лише для дописування, відображений у пам'ять (mmap):
+#                    записи MSG (повідомлення в черзі) і ACK (вибіркове
+#                    підтвердження, що прийшло не по порядку)
+#   <session>.ack  - індекс на 16 байтів: перший непідтверджений id і
+#                    зсув його запису в журналі
+#
+# Відновлення читає індекс і послідовно сканує лише хвіст журналу від
+# збереженого зсуву. Записи в mmap переживають падіння процесу; flush()
+# додатково скидає їх на диск на випадок падіння ОС.
+import mmap
+import os
+import re
+import struct
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: блокування між процесами недоступне
+    fcntl = None
+
+RECORD = struct.Struct("<BIH")   # тип, id, довжина даних
+INDEX = struct.Struct("<QQ")     # перший непідтверджений id, його зсув
+
+END = 0
+MSG = 1
+ACK = 2
+
+# журнал росте шматками такого розміру
+CHUNK = 64 * 1024
+
+SESSION_RE = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+class Outbox:
+    def __init__(self, path):
+        self.path = path
+        self.log_file = open(path + ".log", "a+b")
+        self.index_file = open(path + ".ack", "a+b")
+
+        # сесію може обслуговувати лише один процес (prefork-режим)
+        if fcntl is not None:
+            try:
+                fcntl.flock(self.index_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                self.log_file.close()
+                self.index_file.close()
+                raise ValueError(f"session {os.path.basename(path)!r} is already connected")
+
+        if os.path.getsize(path + ".log") == 0:
+            self.log_file.truncate(CHUNK)
+        if os.path.getsize(path + ".ack") < INDEX.size:
+            self.index_file.truncate(INDEX.size)
+
+        self.log = mmap.mmap(self.log_file.fileno(), 0)
+        self.index = mmap.mmap(self.index_file.fileno(), INDEX.size)
+
+        self.acked_through, offset = INDEX.unpack_from(self.index)
+        self.pending = {}        # id -> (зсув запису, дані)
+        self.next_id = self.acked_through
+        self.tail = offset
+        self._recover(offset)
+
+    def _recover(self, offset):
+        """Сканує хвіст журналу від offset і відновлює чергу."""
+        acked = set()
+        while offset + RECORD.size <= len(self.log):
+            kind, message_id, length = RECORD.unpack_from(self.log, offset)
+            end = offset + RECORD.size + length
+            if kind == END or end > len(self.log):
+                break
+            if kind == MSG and message_id >= self.acked_through:
+                self.pending[message_id] = (offset, bytes(self.log[offset + RECORD.size:end]))
+                self.next_id = max(self.next_id, message_id + 1)
+            elif kind == ACK:
+                acked.add(message_id)
+            offset = end
+        self.tail = offset
+
+        for message_id in acked:
+            self.pending.pop(message_id, None)
+        self._advance()
+
+    def _grow(self, size):
+        if self.tail + size + RECORD.size <= len(self.log):
+            return
+        new_size = len(self.log) + max(CHUNK, size + RECORD.size)
+        self.log.close()
+        self.log_file.truncate(new_size)
+        self.log = mmap.mmap(self.log_file.fileno(), 0)
+
+    def _write(self, kind, message_id, data=b""):
+        offset = self.tail
+        self._grow(RECORD.size + len(data))
+        start = offset + RECORD.size
+        self.log[start:start + len(data)] = data
+        # заголовок пишемо останнім: запис без заголовка вважається кінцем журналу
+        RECORD.pack_into(self.log, offset, kind, message_id, len(data))
+        self.tail = start + len(data)
+        return offset
+
+    def append(self, data=b""):
+        """Ставить повідомлення в чергу. Повертає його id."""
+        message_id = self.next_id
+        self.next_id += 1
+        self.pending[message_id] = (self._write(MSG, message_id, data), data)
+        return message_id
+
+    def ack(self, message_id):
+        if message_id not in self.pending:
+            return
+        del self.pending[message_id]
+        if message_id == self.acked_through:
+            self._advance()
+        else:
+            self._write(ACK, message_id)
+
+    def _advance(self):
+        # переносимо індекс на перший непідтверджений запис
+        while self.acked_through < self.next_id and self.acked_through not in self.pending:
+            self.acked_through += 1
+        if self.acked_through in self.pending:
+            offset = self.pending[self.acked_through][0]
+        else:
+            offset = self.tail
+        INDEX.pack_into(self.index, 0, self.acked_through, offset)
+
+    def pending_ids(self):
+        return sorted(self.pending)
+
+    def flush(self):
+        self.log.flush()
+        self.index.flush()
+
+    def close(self):
+        self.flush()
+        self.log.close()
+        self.index.close()
+        self.log_file.close()
+        self.index_file.close()
+
+
+class OutboxStore:
+    """
+    Каталог черг. Кожну сесію одночасно може обслуговувати
+    лише одне з'єднання.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.open = {}
+
+    def acquire(self, session):
+        if not SESSION_RE.match(session):
+            raise ValueError(f"invalid session id: {session!r}")
+        if session in self.open:
+            raise ValueError(f"session {session!r} is already connected")
+        outbox = Outbox(os.path.join(self.directory, session))
+        self.open[session] = outbox
+        return outbox
+
+    def release(self, session):
+        outbox = self.open.pop(session, None)
+        if outbox is not None:
+            outbox.close()
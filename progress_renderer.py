@@ -0,0 +1,157 @@
+# progress_renderer.py
+# Event-driven terminal progress for the runner simulation of kuvalda(2).py.
+#
+# Runners publish status changes (board[name] = status) into a queue and
+# never touch the screen. A renderer thread owns the displayed state: it
+# drains the queue, builds the frame and redraws only the lines that
+# changed, using cursor addressing, at most `fps` times per second. When
+# there are more runners than fit on the screen it switches to a summary
+# (counts by state plus the most recent changes).
+import queue
+import shutil
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+HEADER = "=== RUNNER PROGRESS ==="
+FOOTER = "========================"
+FPS = 10
+
+
+def state_of(status):
+    if status.startswith("CAUGHT"):
+        return "caught"
+    if status.endswith("(done)"):
+        return "done"
+    return "running"
+
+
+class ProgressBoard:
+    """
+    Dict-like progress sink: board[name] = status from any thread.
+    Reading board[name] returns the last status written for name.
+    """
+
+    def __init__(self, stream=None, fps=FPS, height=None):
+        self.stream = stream or sys.stdout
+        self.interval = 1 / fps
+        self.height = height or shutil.get_terminal_size().lines
+        self.events = queue.SimpleQueue()
+        self.latest = {}           # last status per runner (writer side)
+        self.shown = {}            # state of the renderer: name -> status
+        self.recent = OrderedDict()  # names in order of their last change
+        self.lines = []            # lines currently on the screen
+        self.thread = None
+        self.frames = 0
+
+    # writer side
+
+    def __setitem__(self, name, status):
+        self.latest[name] = status
+        self.events.put((name, status))
+
+    def __getitem__(self, name):
+        return self.latest[name]
+
+    def items(self):
+        return list(self.latest.items())
+
+    # renderer side
+
+    def apply(self, event):
+        """Applies one change. Returns False for the stop marker."""
+        if event is None:
+            return False
+        name, status = event
+        self.shown[name] = status
+        self.recent[name] = None
+        self.recent.move_to_end(name)
+        return True
+
+    def drain(self):
+        """Applies all queued changes. Returns False if stop was requested."""
+        running = True
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                return running
+            running = self.apply(event) and running
+
+    def frame(self):
+        """Lines of the frame for the current renderer state."""
+        if len(self.shown) + 2 <= self.height:
+            return [HEADER, *(f"{name:<12}: {status}" for name, status in self.shown.items()), FOOTER]
+
+        counts = {"running": 0, "done": 0, "caught": 0}
+        for status in self.shown.values():
+            counts[state_of(status)] += 1
+        lines = [
+            HEADER,
+            f"Runners: {len(self.shown)}  running: {counts['running']}  "
+            f"done: {counts['done']}  caught: {counts['caught']}",
+            "Recent:",
+        ]
+        room = max(0, self.height - len(lines) - 1)
+        while len(self.recent) > room:
+            self.recent.popitem(last=False)
+        lines.extend(f"{name:<12}: {self.shown[name]}" for name in reversed(self.recent))
+        lines.append(FOOTER)
+        return lines
+
+    def render(self):
+        """Writes only the changed lines of the new frame."""
+        lines = self.frame()
+        out = []
+        if self.frames == 0:
+            out.append("\033[2J")
+        for row, line in enumerate(lines):
+            if row >= len(self.lines) or self.lines[row] != line:
+                out.append(f"\033[{row + 1};1H{line}\033[K")
+        for row in range(len(lines), len(self.lines)):
+            out.append(f"\033[{row + 1};1H\033[K")
+        out.append(f"\033[{len(lines) + 1};1H")
+        self.lines = lines
+        self.frames += 1
+        self.stream.write("".join(out))
+        self.stream.flush()
+
+    def run(self):
+        last = 0.0
+        running = True
+        while running:
+            # block until something changes
+            running = self.apply(self.events.get())
+            # wait until the next frame is allowed, then take all changes at once
+            wait = last + self.interval - time.monotonic()
+            if running and wait > 0:
+                time.sleep(wait)
+            running = self.drain() and running
+            self.render()
+            last = time.monotonic()
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Renders the final state and stops the renderer thread."""
+        self.events.put(None)
+        self.thread.join()
+
+
+if __name__ == "__main__":
+    # demo: python progress_renderer.py 300
+    import random
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    board = ProgressBoard().start()
+    for step in range(1, 11):
+        for i in range(count):
+            board[f"Runner_{i+1}"] = f"{step}/10" + (" (done)" if step == 10 else "")
+            if random.random() < 0.01:
+                board[f"Runner_{i+1}"] = f"CAUGHT at attempt {step}"
+        time.sleep(0.1)
+    board.stop()
@@ -0,0 +1,163 @@
+# runner_experiments.py
+# Parallel experiment runner for the warehouse/runner simulation.
+#
+#   python runner_experiments.py --simulations 10000000 --workers 0 --seed 42
+#   python runner_experiments.py --simulations 100000 --mode events
+#
+# The simulations are split into tasks; every task gets its own seed from
+# SeedSequence(seed).spawn(), so the result depends only on the seed and
+# the task size, not on the number of workers or completion order. Workers
+# return histograms, which the aggregator merges as they arrive; mean,
+# variance and quantiles are computed exactly from the merged histograms.
+import argparse
+import importlib.util
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from runner_montecarlo import DEPOTS, simulate_batch
+
+TASK_SIZE = 50_000
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+_sim = None
+
+
+def load_simulation():
+    """kuvalda(2).py, loaded once per process."""
+    global _sim
+    if _sim is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "kuvalda(2).py")
+        spec = importlib.util.spec_from_file_location("kuvalda_2", path)
+        _sim = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(_sim)
+    return _sim
+
+
+def run_events(seed_seq, simulations, runners, attempts):
+    """The discrete-event engine of kuvalda(2).py, one run at a time."""
+    sim = load_simulation()
+    rng = random.Random(int(seed_seq.generate_state(1)[0]))
+    total_earned = np.empty(simulations, dtype=np.int64)
+    remaining = np.empty((simulations, DEPOTS), dtype=np.int64)
+    for n in range(simulations):
+        warehouses = [sim.Warehouse(f"Depot {'ABCD'[d]}", rng.randint(100, 300)) for d in range(DEPOTS)]
+        team = [sim.VirtualRunner(f"Runner_{i+1}", rng.choice(warehouses), {}, attempts)
+                for i in range(runners)]
+        sim.run_events(team, rng)
+        total_earned[n] = sum(r.earnings for r in team)
+        remaining[n] = [wh.meds for wh in warehouses]
+    return {"total_earned": total_earned, "remaining": remaining}
+
+
+def run_task(seed_seq, simulations, runners, attempts, mode):
+    """One task (runs in a worker). Returns histograms of the results."""
+    if mode == "events":
+        result = run_events(seed_seq, simulations, runners, attempts)
+    else:
+        result = simulate_batch(np.random.default_rng(seed_seq), simulations, runners, attempts)
+    return {
+        "total_earned": np.bincount(result["total_earned"]),
+        "remaining": np.bincount(result["remaining"].ravel()),
+    }
+
+
+class Histogram:
+    """Counts of non-negative integer values; merging is order independent."""
+
+    def __init__(self):
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def add(self, counts):
+        if len(counts) > len(self.counts):
+            self.counts = np.pad(self.counts, (0, len(counts) - len(self.counts)))
+        self.counts[:len(counts)] += counts
+
+    @property
+    def total(self):
+        return int(self.counts.sum())
+
+    def summary(self, quantiles=QUANTILES):
+        n = self.total
+        values = np.arange(len(self.counts))
+        mean = float((values * self.counts).sum() / n)
+        variance = float((((values - mean) ** 2) * self.counts).sum() / n)
+        cumulative = np.cumsum(self.counts)
+        summary = {"mean": mean, "variance": variance}
+        for q in quantiles:
+            # the value at rank floor(q * (n - 1)), like numpy's "lower" method
+            summary[f"p{round(q * 100)}"] = int(np.searchsorted(cumulative, int(q * (n - 1)), side="right"))
+        return summary
+
+
+class Aggregator:
+    def __init__(self):
+        self.total_earned = Histogram()
+        self.remaining = Histogram()
+        self.tasks = 0
+
+    def add(self, result):
+        self.total_earned.add(result["total_earned"])
+        self.remaining.add(result["remaining"])
+        self.tasks += 1
+
+    def report(self):
+        return {
+            "simulations": self.total_earned.total,
+            "total_earned": self.total_earned.summary(),
+            "remaining": self.remaining.summary(),
+            "emptied_share": float(self.remaining.counts[0] / self.remaining.total),
+        }
+
+
+def run_experiments(simulations, workers=1, seed=None, runners=5, attempts=10,
+                    mode="vectorized", task_size=TASK_SIZE, progress=None):
+    sizes = [min(task_size, simulations - start) for start in range(0, simulations, task_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    aggregator = Aggregator()
+
+    if workers <= 1:
+        for seed_seq, size in zip(seeds, sizes):
+            aggregator.add(run_task(seed_seq, size, runners, attempts, mode))
+            if progress:
+                progress(aggregator.tasks, len(sizes))
+        return aggregator.report()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_task, seed_seq, size, runners, attempts, mode)
+                   for seed_seq, size in zip(seeds, sizes)]
+        for future in as_completed(futures):
+            aggregator.add(future.result())
+            if progress:
+                progress(aggregator.tasks, len(sizes))
+    return aggregator.report()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel runs of the runner simulation")
+    parser.add_argument("--simulations", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=0, help="number of processes (0 - all cores)")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--runners", type=int, default=5)
+    parser.add_argument("--attempts", type=int, default=10)
+    parser.add_argument("--mode", choices=("vectorized", "events"), default="vectorized")
+    parser.add_argument("--task-size", type=int, default=TASK_SIZE)
+    args = parser.parse_args()
+
+    def progress(done, total):
+        print(f"\rTasks: {done}/{total}", end="", flush=True)
+
+    started = time.perf_counter()
+    report = run_experiments(args.simulations, args.workers or os.cpu_count(), args.seed,
+                             args.runners, args.attempts, args.mode, args.task_size, progress)
+    print(f"\nSimulations: {report['simulations']} in {time.perf_counter() - started:.2f} s")
+    print(f"TOTAL EARNED: {report['total_earned']}")
+    print(f"Remaining meds per depot: {report['remaining']}")
+    print(f"Emptied depots: {report['emptied_share']:.4f}")
+
+
+if __name__ == "__main__":
+    main()
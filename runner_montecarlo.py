@@ -0,0 +1,104 @@
+# runner_montecarlo.py
+# Vectorized Monte Carlo for the warehouse/runner simulation of kuvalda(2).py.
+#
+#   python runner_montecarlo.py --simulations 1000000 --seed 1
+#
+# Every simulation follows simulate(): 4 depots with 100..300 meds, runners
+# assigned to random depots, up to `attempts` steal attempts per runner,
+# each one success/fail/caught with equal odds; a success takes 1..amount
+# (amount 10..30) but never more than the depot has left; a caught runner
+# stops. All draws for a batch of simulations are made as arrays.
+#
+# Within a depot every success takes min(left, x), so the depot loses
+# exactly min(meds, sum of x) whatever the order of attempts. Totals and
+# remaining meds therefore match the threaded model exactly in
+# distribution; only the split of earnings between runners of one depot
+# depends on timing and is not modelled.
+import argparse
+import time
+
+import numpy as np
+
+DEPOTS = 4
+PRICE_PER_UNIT = 5
+BATCH = 100_000
+
+
+def simulate_batch(rng, simulations, runners=5, attempts=10):
+    """
+    Runs `simulations` independent simulations.
+    Returns a dict of arrays:
+      total_earned  (simulations,)          - TOTAL EARNED
+      remaining     (simulations, DEPOTS)   - meds left per depot
+      catch_attempt (simulations, runners)  - attempt (1-based) where the
+                                              runner was caught, 0 - never
+    """
+    shape = (simulations, runners, attempts)
+    meds = rng.integers(100, 301, size=(simulations, DEPOTS), dtype=np.int32)
+    depot = rng.integers(0, DEPOTS, size=(simulations, runners), dtype=np.int8)
+
+    outcome = rng.integers(0, 3, size=shape, dtype=np.int8)   # 0 success, 1 fail, 2 caught
+    caught = outcome == 2
+    # attempts after the first caught never happen
+    active = np.cumsum(caught, axis=2, dtype=np.int8) == 0
+    success = (outcome == 0) & active
+
+    amount = rng.integers(10, 31, size=shape, dtype=np.int16)
+    take = rng.integers(1, amount + 1, dtype=np.int16)
+    demand_per_runner = np.where(success, take, 0).sum(axis=2, dtype=np.int32)
+
+    demand = np.zeros((simulations, DEPOTS), dtype=np.int32)
+    for d in range(DEPOTS):
+        demand[:, d] = np.where(depot == d, demand_per_runner, 0).sum(axis=1)
+
+    stolen = np.minimum(meds, demand)
+    any_caught = caught.any(axis=2)
+    catch_attempt = np.where(any_caught, caught.argmax(axis=2) + 1, 0).astype(np.int8)
+
+    return {
+        "total_earned": stolen.sum(axis=1) * PRICE_PER_UNIT,
+        "remaining": meds - stolen,
+        "catch_attempt": catch_attempt,
+    }
+
+
+def simulate_many(simulations, runners=5, attempts=10, seed=None, batch=BATCH):
+    """simulate_batch in batches of `batch` simulations to bound memory."""
+    rng = np.random.default_rng(seed)
+    parts = [simulate_batch(rng, min(batch, simulations - start), runners, attempts)
+             for start in range(0, simulations, batch)]
+    return {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+
+
+def summarize(values, quantiles=(0.05, 0.5, 0.95)):
+    values = np.asarray(values, dtype=np.float64)
+    summary = {"mean": float(values.mean()), "std": float(values.std())}
+    for q, value in zip(quantiles, np.quantile(values, quantiles)):
+        summary[f"p{round(q * 100)}"] = float(value)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo for the runner simulation")
+    parser.add_argument("--simulations", type=int, default=1_000_000)
+    parser.add_argument("--runners", type=int, default=5)
+    parser.add_argument("--attempts", type=int, default=10)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    result = simulate_many(args.simulations, args.runners, args.attempts, args.seed)
+    elapsed = time.perf_counter() - started
+
+    print(f"Simulations: {args.simulations} in {elapsed:.2f} s")
+    print(f"TOTAL EARNED: {summarize(result['total_earned'])}")
+    for d in range(DEPOTS):
+        print(f"Depot {'ABCD'[d]} remaining: {summarize(result['remaining'][:, d])}")
+        print(f"Depot {'ABCD'[d]} emptied: {np.mean(result['remaining'][:, d] == 0):.4f}")
+    caught = result["catch_attempt"]
+    print(f"Runners caught: {np.mean(caught > 0):.4f}")
+    print(f"Catch attempt: {summarize(caught[caught > 0])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,230 +1,441 @@
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-import csv
-from datetime import datetime
-
-class Product:
-    def __init__(self, id, name, category, quantity, price, location, created_at=None):
-        self.id = id or str(int(datetime.now().timestamp()*1000))
-        self.name = name
-        self.category = category
-        self.quantity = int(quantity)
-        self.price = float(str(price).replace(',', '.'))
-        self.location = location
-        self.created_at = created_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-    def to_list(self):
-        return [self.id, self.name, self.category, str(self.quantity), f"{self.price:.2f}", self.location, self.created_at]
-
-class InventoryApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Inventory Manager")
-        self.products = []
-        self.filtered_products = []
-        self.create_widgets()
-        
-    def create_widgets(self):
-        menubar = tk.Menu(self.root)
-        filemenu = tk.Menu(menubar, tearoff=0)
-        filemenu.add_command(label="Відкрити...", command=self.load_csv)
-        filemenu.add_command(label="Зберегти", command=self.save_csv)
-        filemenu.add_command(label="Зберегти як...", command=lambda: self.save_csv(save_as=True))
-        menubar.add_cascade(label="Файл", menu=filemenu)
-        self.root.config(menu=menubar)
-        
-        table_frame = tk.Frame(self.root)
-        table_frame.pack(fill=tk.BOTH, expand=True)
-        
-        columns = ["id", "name", "category", "quantity", "price", "location", "created_at"]
-        self.tree = ttk.Treeview(table_frame, columns=columns, show="headings")
-        for col in columns:
-            self.tree.heading(col, text=col.capitalize(), command=lambda _col=col: self.sort_column(_col, False))
-            self.tree.column(col, width=100)
-        self.tree.pack(fill=tk.BOTH, expand=True)
-        self.tree.bind("<<TreeviewSelect>>", self.on_tree_select)
-        
-        search_frame = tk.Frame(self.root)
-        search_frame.pack(fill=tk.X)
-        tk.Label(search_frame, text="Пошук:").pack(side=tk.LEFT, padx=5)
-        self.search_var = tk.StringVar()
-        self.search_var.trace_add("write", lambda *args: self.update_tree())
-        tk.Entry(search_frame, textvariable=self.search_var).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        form_frame = tk.Frame(self.root, relief=tk.RIDGE, bd=2)
-        form_frame.pack(fill=tk.X, padx=5, pady=5)
-        self.entries = {}
-        fields = ["id", "name", "category", "quantity", "price", "location"]
-        for i, field in enumerate(fields):
-            tk.Label(form_frame, text=field.capitalize()).grid(row=i, column=0, sticky=tk.W, padx=5, pady=2)
-            entry = tk.Entry(form_frame)
-            entry.grid(row=i, column=1, sticky=tk.W, padx=5, pady=2)
-            self.entries[field] = entry
-        
-        btn_frame = tk.Frame(form_frame)
-        btn_frame.grid(row=0, column=2, rowspan=len(fields), padx=10)
-        tk.Button(btn_frame, text="Додати", width=12, command=self.add_product).pack(pady=2)
-        tk.Button(btn_frame, text="Оновити", width=12, command=self.update_product).pack(pady=2)
-        tk.Button(btn_frame, text="Видалити", width=12, command=self.delete_product).pack(pady=2)
-        tk.Button(btn_frame, text="Очистити форму", width=12, command=self.clear_form).pack(pady=2)
-        
-        self.status_var = tk.StringVar()
-        self.status_var.set("Готово")
-        status = tk.Label(self.root, textvariable=self.status_var, bd=1, relief=tk.SUNKEN, anchor=tk.W)
-        status.pack(side=tk.BOTTOM, fill=tk.X)
-        
-    def set_status(self, msg):
-        self.status_var.set(msg)
-        
-    def clear_form(self):
-        for entry in self.entries.values():
-            entry.delete(0, tk.END)
-        self.tree.selection_remove(self.tree.selection())
-        self.set_status("Форма очищена")
-        
-    def validate_form(self):
-        try:
-            name = self.entries["name"].get().strip()
-            category = self.entries["category"].get().strip()
-            quantity = int(self.entries["quantity"].get())
-            price = float(self.entries["price"].get().replace(',', '.'))
-            location = self.entries["location"].get().strip()
-            if not name or not category:
-                raise ValueError("Name і Category не можуть бути порожніми")
-            if quantity < 0 or price < 0:
-                raise ValueError("Quantity і Price ≥ 0")
-            return {
-                "id": self.entries["id"].get().strip() or None,
-                "name": name,
-                "category": category,
-                "quantity": quantity,
-                "price": price,
-                "location": location
-            }
-        except Exception as e:
-            self.set_status(f"Помилка: {e}")
-            return None
-        
-    def add_product(self):
-        data = self.validate_form()
-        if not data:
-            return
-        if data["id"] and any(p.id == data["id"] for p in self.products):
-            self.set_status("Помилка: id вже існує")
-            return
-        product = Product(**data)
-        self.products.append(product)
-        self.update_tree()
-        self.clear_form()
-        self.set_status(f"Додано продукт {product.name}")
-        
-    def update_product(self):
-        selected = self.tree.selection()
-        if not selected:
-            self.set_status("Немає обраного продукту")
-            return
-        data = self.validate_form()
-        if not data:
-            return
-        item_id = selected[0]
-        prod = next((p for p in self.products if p.id == item_id), None)
-        if prod:
-            new_id = data["id"] or prod.id
-            if new_id != prod.id and any(p.id == new_id for p in self.products):
-                self.set_status("Помилка: id вже існує")
-                return
-            prod.id = new_id
-            prod.name = data["name"]
-            prod.category = data["category"]
-            prod.quantity = data["quantity"]
-            prod.price = data["price"]
-            prod.location = data["location"]
-            self.update_tree()
-            self.clear_form()
-            self.set_status(f"Оновлено продукт {prod.name}")
-        
-    def delete_product(self):
-        selected = self.tree.selection()
-        if not selected:
-            self.set_status("Немає обраного продукту")
-            return
-        if not messagebox.askyesno("Підтвердження", "Видалити обраний продукт?"):
-            return
-        item_id = selected[0]
-        self.products = [p for p in self.products if p.id != item_id]
-        self.update_tree()
-        self.clear_form()
-        self.set_status("Продукт видалено")
-        
-    def on_tree_select(self, event):
-        selected = self.tree.selection()
-        if not selected:
-            return
-        item_id = selected[0]
-        prod = next((p for p in self.products if p.id == item_id), None)
-        if prod:
-            for field in ["id", "name", "category", "quantity", "price", "location"]:
-                self.entries[field].delete(0, tk.END)
-                self.entries[field].insert(0, str(getattr(prod, field)))
-        
-    def update_tree(self):
-        query = self.search_var.get().lower()
-        self.filtered_products = [p for p in self.products if query in p.name.lower() or query in p.category.lower()]
-        self.tree.delete(*self.tree.get_children())
-        for p in self.filtered_products:
-            self.tree.insert("", tk.END, iid=p.id, values=p.to_list())
-            
-    def load_csv(self):
-        path = filedialog.askopenfilename(filetypes=[("CSV files","*.csv")])
-        if not path:
-            return
-        try:
-            with open(path, newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                self.products = []
-                for row in reader:
-                    p = Product(
-                        id=row["id"],
-                        name=row["name"],
-                        category=row["category"],
-                        quantity=int(row["quantity"]),
-                        price=float(row["price"].replace(',', '.')),
-                        location=row["location"],
-                        created_at=row.get("created_at")
-                    )
-                    self.products.append(p)
-                self.update_tree()
-                self.clear_form()
-                self.set_status(f"Завантажено {len(self.products)} продуктів")
-        except Exception as e:
-            self.set_status(f"Помилка завантаження: {e}")
-        
-    def save_csv(self, save_as=False):
-        if save_as or not hasattr(self, "current_file") or not self.current_file:
-            path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files","*.csv")])
-            if not path:
-                return
-            self.current_file = path
-        try:
-            with open(self.current_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(["id","name","category","quantity","price","location","created_at"])
-                for p in self.products:
-                    writer.writerow(p.to_list())
-            self.set_status(f"Збережено {len(self.products)} продуктів")
-        except Exception as e:
-            self.set_status(f"Помилка збереження: {e}")
-            
-    def sort_column(self, col, reverse):
-        try:
-            self.products.sort(key=lambda p: getattr(p, col), reverse=reverse)
-            self.update_tree()
-            self.tree.heading(col, command=lambda: self.sort_column(col, not reverse))
-        except Exception as e:
-            self.set_status(f"Помилка сортування: {e}")
-
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = InventoryApp(root)
-    root.geometry("900x600")
-    root.mainloop()
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+import csv
+from collections import defaultdict
+from datetime import datetime
+
+class Product:
+    def __init__(self, id, name, category, quantity, price, location, created_at=None):
+        self.id = id or str(int(datetime.now().timestamp()*1000))
+        self.name = name
+        self.category = category
+        self.quantity = int(quantity)
+        self.price = float(str(price).replace(',', '.'))
+        self.location = location
+        self.created_at = created_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+    def to_list(self):
+        return [self.id, self.name, self.category, str(self.quantity), f"{self.price:.2f}", self.location, self.created_at]
+
+class InventoryStore:
+    """
+    Сховище продуктів з O(1) пошуком і видаленням за id.
+    Порядок зберігається за номером вставки (seq), тож зміна id не
+    змінює позицію продукту. Індекси за категорією та розташуванням
+    оновлюються разом із продуктом.
+    """
+    def __init__(self, products=()):
+        self.rows = {}        # seq -> Product, у порядку відображення
+        self.seq_by_id = {}   # id -> seq
+        self.by_category = defaultdict(dict)   # category -> {seq: Product}
+        self.by_location = defaultdict(dict)   # location -> {seq: Product}
+        self.next_seq = 0
+        for product in products:
+            self.add(product)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows.values())
+
+    def __contains__(self, product_id):
+        return product_id in self.seq_by_id
+
+    def get(self, product_id):
+        seq = self.seq_by_id.get(product_id)
+        return None if seq is None else self.rows[seq]
+
+    def _index(self, seq, product):
+        self.by_category[product.category][seq] = product
+        self.by_location[product.location][seq] = product
+
+    def _unindex(self, seq, product):
+        for index, key in ((self.by_category, product.category), (self.by_location, product.location)):
+            bucket = index[key]
+            del bucket[seq]
+            if not bucket:
+                del index[key]
+
+    def add(self, product):
+        if product.id in self.seq_by_id:
+            raise ValueError("id вже існує")
+        seq = self.next_seq
+        self.next_seq += 1
+        self.rows[seq] = product
+        self.seq_by_id[product.id] = seq
+        self._index(seq, product)
+        return product
+
+    def update(self, product_id, **fields):
+        """Змінює поля продукту (зокрема id). Повертає продукт або None."""
+        seq = self.seq_by_id.get(product_id)
+        if seq is None:
+            return None
+        product = self.rows[seq]
+        new_id = fields.get("id") or product.id
+        if new_id != product.id and new_id in self.seq_by_id:
+            raise ValueError("id вже існує")
+        self._unindex(seq, product)
+        for field, value in fields.items():
+            if field != "id":
+                setattr(product, field, value)
+        if new_id != product.id:
+            del self.seq_by_id[product.id]
+            product.id = new_id
+            self.seq_by_id[new_id] = seq
+        self._index(seq, product)
+        return product
+
+    def remove(self, product_id):
+        seq = self.seq_by_id.pop(product_id, None)
+        if seq is None:
+            return None
+        product = self.rows.pop(seq)
+        self._unindex(seq, product)
+        return product
+
+    def in_category(self, category):
+        return list(self.by_category.get(category, {}).values())
+
+    def at_location(self, location):
+        return list(self.by_location.get(location, {}).values())
+
+    def sort(self, key, reverse=False):
+        order = sorted(self.rows.items(), key=lambda row: key(row[1]), reverse=reverse)
+        self.rows = dict(order)
+
+
+class VirtualTree:
+    """
+    Віртуалізована таблиця: у Treeview живуть лише видимі рядки та
+    невеликий запас під ними (buffer), решта підвантажується під час
+    прокрутки. items — відфільтрований список продуктів у порядку
+    відображення; прокрутку веде окремий Scrollbar через yview().
+    """
+    def __init__(self, tree, scrollbar=None, rows=30, buffer=20):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.rows = rows
+        self.buffer = buffer
+        self.items = []
+        self.start = 0
+
+    def set_items(self, items):
+        self.items = items
+        self.scroll_to(self.start)
+
+    def window(self):
+        return self.items[self.start:self.start + self.rows + self.buffer]
+
+    def scroll_to(self, start):
+        self.start = max(0, min(start, len(self.items) - self.rows))
+        self.refresh()
+
+    def yview(self, *args):
+        """Команда для Scrollbar: ("moveto", частка) або ("scroll", n, "units"/"pages")."""
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * len(self.items)))
+        elif args[0] == "scroll":
+            step = self.rows if args[2] == "pages" else 1
+            self.scroll_to(self.start + int(args[1]) * step)
+
+    def resize(self, rows):
+        if rows != self.rows:
+            self.rows = max(1, rows)
+            self.scroll_to(self.start)
+
+    def refresh(self):
+        """Приводить рядки Treeview до поточного вікна мінімумом викликів Tk."""
+        wanted = self.window()
+        wanted_ids = [p.id for p in wanted]
+        wanted_set = set(wanted_ids)
+        current = self.tree.get_children()
+        stale = [iid for iid in current if iid not in wanted_set]
+        if stale:
+            self.tree.delete(*stale)
+        kept = [iid for iid in current if iid in wanted_set]
+        kept_set = set(kept)
+        # при прокрутці порядок наявних рядків не змінюється - лише вставки
+        reorder = kept != [iid for iid in wanted_ids if iid in kept_set]
+        for index, p in enumerate(wanted):
+            if p.id not in kept_set:
+                self.tree.insert("", index, iid=p.id, values=p.to_list())
+            elif reorder:
+                self.tree.move(p.id, "", index)
+        self.refresh_scrollbar()
+
+    def append(self, product):
+        self.items.append(product)
+        if len(self.items) <= self.start + self.rows + self.buffer:
+            self.tree.insert("", "end", iid=product.id, values=product.to_list())
+        self.refresh_scrollbar()
+
+    def update_item(self, old_id, product):
+        """Оновлює один рядок (з урахуванням зміни id), якщо він зараз у вікні."""
+        if not self.tree.exists(old_id):
+            return
+        if old_id == product.id:
+            self.tree.item(old_id, values=product.to_list())
+        else:
+            index = self.tree.index(old_id)
+            self.tree.delete(old_id)
+            self.tree.insert("", index, iid=product.id, values=product.to_list())
+
+    def remove(self, product):
+        self.items.remove(product)
+        if self.tree.exists(product.id):
+            self.tree.delete(product.id)
+        # вікно зсувається: підтягуємо наступний рядок
+        self.scroll_to(self.start)
+
+    def refresh_scrollbar(self):
+        if self.scrollbar is not None:
+            total = len(self.items) or 1
+            self.scrollbar.set(self.start / total, min(1.0, (self.start + self.rows) / total))
+
+
+class InventoryApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Inventory Manager")
+        self.store = InventoryStore()
+        self.filtered_products = []
+        self.last_query = ""
+        self.selected_id = None
+        self.create_widgets()
+        
+    def create_widgets(self):
+        menubar = tk.Menu(self.root)
+        filemenu = tk.Menu(menubar, tearoff=0)
+        filemenu.add_command(label="Відкрити...", command=self.load_csv)
+        filemenu.add_command(label="Зберегти", command=self.save_csv)
+        filemenu.add_command(label="Зберегти як...", command=lambda: self.save_csv(save_as=True))
+        menubar.add_cascade(label="Файл", menu=filemenu)
+        self.root.config(menu=menubar)
+        
+        table_frame = tk.Frame(self.root)
+        table_frame.pack(fill=tk.BOTH, expand=True)
+        
+        columns = ["id", "name", "category", "quantity", "price", "location", "created_at"]
+        self.tree = ttk.Treeview(table_frame, columns=columns, show="headings")
+        for col in columns:
+            self.tree.heading(col, text=col.capitalize(), command=lambda _col=col: self.sort_column(_col, False))
+            self.tree.column(col, width=100)
+        scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.view = VirtualTree(self.tree, scrollbar)
+        scrollbar.config(command=self.view.yview)
+        self.tree.bind("<<TreeviewSelect>>", self.on_tree_select)
+        self.tree.bind("<Configure>", self.on_tree_resize)
+        self.tree.bind("<MouseWheel>", lambda e: self.on_wheel(-1 if e.delta > 0 else 1))
+        self.tree.bind("<Button-4>", lambda e: self.on_wheel(-1))
+        self.tree.bind("<Button-5>", lambda e: self.on_wheel(1))
+        
+        search_frame = tk.Frame(self.root)
+        search_frame.pack(fill=tk.X)
+        tk.Label(search_frame, text="Пошук:").pack(side=tk.LEFT, padx=5)
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", lambda *args: self.update_tree(narrow=True))
+        tk.Entry(search_frame, textvariable=self.search_var).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        form_frame = tk.Frame(self.root, relief=tk.RIDGE, bd=2)
+        form_frame.pack(fill=tk.X, padx=5, pady=5)
+        self.entries = {}
+        fields = ["id", "name", "category", "quantity", "price", "location"]
+        for i, field in enumerate(fields):
+            tk.Label(form_frame, text=field.capitalize()).grid(row=i, column=0, sticky=tk.W, padx=5, pady=2)
+            entry = tk.Entry(form_frame)
+            entry.grid(row=i, column=1, sticky=tk.W, padx=5, pady=2)
+            self.entries[field] = entry
+        
+        btn_frame = tk.Frame(form_frame)
+        btn_frame.grid(row=0, column=2, rowspan=len(fields), padx=10)
+        tk.Button(btn_frame, text="Додати", width=12, command=self.add_product).pack(pady=2)
+        tk.Button(btn_frame, text="Оновити", width=12, command=self.update_product).pack(pady=2)
+        tk.Button(btn_frame, text="Видалити", width=12, command=self.delete_product).pack(pady=2)
+        tk.Button(btn_frame, text="Очистити форму", width=12, command=self.clear_form).pack(pady=2)
+        
+        self.status_var = tk.StringVar()
+        self.status_var.set("Готово")
+        status = tk.Label(self.root, textvariable=self.status_var, bd=1, relief=tk.SUNKEN, anchor=tk.W)
+        status.pack(side=tk.BOTTOM, fill=tk.X)
+        
+    def set_status(self, msg):
+        self.status_var.set(msg)
+        
+    def clear_form(self):
+        for entry in self.entries.values():
+            entry.delete(0, tk.END)
+        self.tree.selection_remove(self.tree.selection())
+        self.selected_id = None
+        self.set_status("Форма очищена")
+        
+    def validate_form(self):
+        try:
+            name = self.entries["name"].get().strip()
+            category = self.entries["category"].get().strip()
+            quantity = int(self.entries["quantity"].get())
+            price = float(self.entries["price"].get().replace(',', '.'))
+            location = self.entries["location"].get().strip()
+            if not name or not category:
+                raise ValueError("Name і Category не можуть бути порожніми")
+            if quantity < 0 or price < 0:
+                raise ValueError("Quantity і Price ≥ 0")
+            return {
+                "id": self.entries["id"].get().strip() or None,
+                "name": name,
+                "category": category,
+                "quantity": quantity,
+                "price": price,
+                "location": location
+            }
+        except Exception as e:
+            self.set_status(f"Помилка: {e}")
+            return None
+        
+    def add_product(self):
+        data = self.validate_form()
+        if not data:
+            return
+        try:
+            product = self.store.add(Product(**data))
+        except ValueError as e:
+            self.set_status(f"Помилка: {e}")
+            return
+        if self.matches(product):
+            self.view.append(product)
+        self.clear_form()
+        self.set_status(f"Додано продукт {product.name}")
+        
+    def update_product(self):
+        item_id = self.selected_id
+        if item_id is None:
+            self.set_status("Немає обраного продукту")
+            return
+        data = self.validate_form()
+        if not data:
+            return
+        try:
+            prod = self.store.update(item_id, **data)
+        except ValueError as e:
+            self.set_status(f"Помилка: {e}")
+            return
+        if prod:
+            shown = prod in self.filtered_products
+            if shown and self.matches(prod):
+                self.view.update_item(item_id, prod)
+            elif shown:
+                self.view.remove(prod)
+            elif self.matches(prod):
+                # позиція в списку залежить від порядку сховища
+                self.update_tree()
+            self.clear_form()
+            self.set_status(f"Оновлено продукт {prod.name}")
+        
+    def delete_product(self):
+        item_id = self.selected_id
+        if item_id is None:
+            self.set_status("Немає обраного продукту")
+            return
+        if not messagebox.askyesno("Підтвердження", "Видалити обраний продукт?"):
+            return
+        prod = self.store.remove(item_id)
+        if prod is not None and prod in self.filtered_products:
+            self.view.remove(prod)
+        self.clear_form()
+        self.set_status("Продукт видалено")
+        
+    def on_tree_select(self, event):
+        selected = self.tree.selection()
+        if not selected:
+            return
+        self.selected_id = selected[0]
+        prod = self.store.get(selected[0])
+        if prod:
+            for field in ["id", "name", "category", "quantity", "price", "location"]:
+                self.entries[field].delete(0, tk.END)
+                self.entries[field].insert(0, str(getattr(prod, field)))
+        
+    def matches(self, product):
+        query = self.search_var.get().lower()
+        return query in product.name.lower() or query in product.category.lower()
+
+    def update_tree(self, narrow=False):
+        """
+        Перераховує фільтр і показує вікно з початку списку.
+        narrow=True (введення в пошук): якщо новий запит містить
+        попередній, фільтруються лише вже знайдені продукти.
+        """
+        query = self.search_var.get().lower()
+        source = self.filtered_products if narrow and self.last_query in query else self.store
+        self.filtered_products = [p for p in source if query in p.name.lower() or query in p.category.lower()]
+        self.last_query = query
+        self.view.start = 0
+        self.view.set_items(self.filtered_products)
+
+    def on_tree_resize(self, event):
+        # приблизна висота рядка та заголовка Treeview у пікселях
+        row_height = ttk.Style().lookup("Treeview", "rowheight") or 20
+        self.view.resize((event.height - 25) // int(row_height))
+
+    def on_wheel(self, direction):
+        self.view.yview("scroll", 3 * direction, "units")
+        return "break"
+            
+    def load_csv(self):
+        path = filedialog.askopenfilename(filetypes=[("CSV files","*.csv")])
+        if not path:
+            return
+        try:
+            with open(path, newline='', encoding='utf-8') as f:
+                reader = csv.DictReader(f)
+                store = InventoryStore()
+                for row in reader:
+                    p = Product(
+                        id=row["id"],
+                        name=row["name"],
+                        category=row["category"],
+                        quantity=int(row["quantity"]),
+                        price=float(row["price"].replace(',', '.')),
+                        location=row["location"],
+                        created_at=row.get("created_at")
+                    )
+                    store.add(p)
+                self.store = store
+                self.update_tree()
+                self.clear_form()
+                self.set_status(f"Завантажено {len(self.store)} продуктів")
+        except Exception as e:
+            self.set_status(f"Помилка завантаження: {e}")
+        
+    def save_csv(self, save_as=False):
+        if save_as or not hasattr(self, "current_file") or not self.current_file:
+            path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files","*.csv")])
+            if not path:
+                return
+            self.current_file = path
+        try:
+            with open(self.current_file, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(["id","name","category","quantity","price","location","created_at"])
+                for p in self.store:
+                    writer.writerow(p.to_list())
+            self.set_status(f"Збережено {len(self.store)} продуктів")
+        except Exception as e:
+            self.set_status(f"Помилка збереження: {e}")
+            
+    def sort_column(self, col, reverse):
+        try:
+            self.store.sort(key=lambda p: getattr(p, col), reverse=reverse)
+            self.update_tree()
+            self.tree.heading(col, command=lambda: self.sort_column(col, not reverse))
+        except Exception as e:
+            self.set_status(f"Помилка сортування: {e}")
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = InventoryApp(root)
+    root.geometry("900x600")
+    root.mainloop()
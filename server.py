@@ -1,95 +1,705 @@
-import socket
-import threading
-import time
-
-# адреса та порт сервера
-HOST = '127.0.0.1'
-PORT = 5000
-
-# максимальна кількість повідомлень для одного клієнта
-MAX_MESSAGES = 5
-
-
-def handle_client(client_socket, client_address):
-    """
-    Обслуговування одного клієнта.
-    Кожен клієнт працює в окремому потоці.
-    """
-    print(f"Клієнт підключився: {client_address}")
-
-    # лічильник
-    message_id = 0
-
-    # таймаут, щоб сервер не зависав при відсутності відповіді
-    client_socket.settimeout(5)
-
-    try:
-        # надсилаємо обмежену кількість повідомлень
-        while message_id < MAX_MESSAGES:
-
-            # формуємо повідомлення з унікальним ID
-            message = f"MSG:{message_id}"
-            delivered = False
-
-            # повторюємо відправку, поки не отримаємо ACK
-            while not delivered:
-                try:
-                    # надсилаємо повідомлення клієнту
-                    client_socket.send(message.encode())
-                    print(f"Відправлено {message} клієнту {client_address}")
-
-                    # очікуємо підтвердження доставки
-                    response = client_socket.recv(1024).decode()
-
-                    # перевірка підтвердження
-                    if response == f"ACK:{message_id}":
-                        print(f"Підтверджено отримання {message}")
-                        delivered = True
-                        message_id += 1
-                    else:
-                        print("Невірне підтвердження, повторна відправка")
-
-                except socket.timeout:
-                    print("Таймаут. Повторна відправка повідомлення")
-
-            # пауза
-            time.sleep(1)
-
-    except (ConnectionResetError, BrokenPipeError):
-        print(f"Клієнт {client_address} відключився")
-
-    finally:
-        # закриваємо з’єднання з клієнтом
-        client_socket.close()
-        print(f"З’єднання з {client_address} завершено")
-
-
-def start_server():
-    """
-    Запуск сервера та очікування клієнтів
-    """
-    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    server_socket.bind((HOST, PORT))
-    server_socket.listen()
-
-    print("Сервер запущено, очікування клієнтів...")
-
-    while True:
-        # приймаємо нового клієнта
-        client_socket, client_address = server_socket.accept()
-
-        # запускаємо окремий потік для клієнта
-        client_thread = threading.Thread(
-            target=handle_client,
-            args=(client_socket, client_address),
-            daemon=True
-        )
-        client_thread.start()
-
-
-if __name__ == "__main__":
-    start_server()
-
-
-# cd D:\exam
+import asyncio
+import functools
+import logging
+import multiprocessing
+import signal
+import socket
+import sys
+import threading
+import time
+
+import framing
+from metrics import SampledLogger, metrics, serve_http, start_async_logging, write_snapshots
+from outbox import OutboxStore
+from timer_wheel import RetransmitScheduler
+
+# адреса та порт сервера
+HOST = '127.0.0.1'
+PORT = 5000
+
+# максимальна кількість повідомлень для одного клієнта
+MAX_MESSAGES = 5
+
+# скільки чекати ACK перед повторною відправкою (секунди)
+ACK_TIMEOUT = 5
+
+# asyncio-режим: кожен наступний таймаут у RETRY_BACKOFF разів довший
+# (не більше MAX_RETRY_TIMEOUT) з випадковим відхиленням ±RETRY_JITTER;
+# після MAX_RETRIES повторів з'єднання закривається
+RETRY_BACKOFF = 2
+MAX_RETRY_TIMEOUT = 60
+RETRY_JITTER = 0.1
+MAX_RETRIES = 10
+
+# пауза між повідомленнями (секунди)
+SEND_INTERVAL = 1
+
+# черга вхідних з'єднань для asyncio-режиму
+BACKLOG = 4096
+
+# скільки чекати HELLO від клієнта, що підтримує вікно (секунди)
+NEGOTIATE_TIMEOUT = 0.2
+
+# найбільше дозволене вікно непідтверджених повідомлень
+MAX_WINDOW = 64
+
+# як часто supervisor prefork-режиму перевіряє воркери (секунди)
+STATS_INTERVAL = 5
+
+# каталог стійких черг повідомлень для сесій клієнтів
+OUTBOX_DIR = "outbox"
+
+# розмір одного читання в кадровому режимі
+READ_SIZE = 65536
+
+# частка подій окремих повідомлень, що потрапляє в лог
+LOG_SAMPLE_RATE = 0.01
+
+# порт локального HTTP з метриками (/metrics);
+# у prefork-режимі воркер N слухає METRICS_PORT + 1 + N
+METRICS_PORT = 9100
+
+
+# лічильники, які prefork-воркери дублюють у спільну пам'ять
+SHARED_COUNTERS = ("connections_total", "connections_active", "delivered_total", "retransmits_total")
+
+logger = logging.getLogger("server")
+
+# події окремих повідомлень логуються вибірково
+log = SampledLogger(logger, LOG_SAMPLE_RATE)
+
+
+def handle_client(client_socket, client_address):
+    """
+    Обслуговування одного клієнта.
+    Кожен клієнт працює в окремому потоці.
+    """
+    log.info("Клієнт підключився: %s", client_address)
+    metrics.inc("connections_total")
+    metrics.inc("connections_active")
+
+    # лічильник
+    message_id = 0
+
+    # таймаут, щоб сервер не зависав при відсутності відповіді
+    client_socket.settimeout(ACK_TIMEOUT)
+
+    # кілька ACK можуть прийти одним читанням або розірватися між читаннями
+    acks = framing.LegacyParser(b"ACK")
+
+    try:
+        # надсилаємо обмежену кількість повідомлень
+        while message_id < MAX_MESSAGES:
+
+            # формуємо повідомлення з унікальним ID
+            message = f"MSG:{message_id}"
+            delivered = False
+            attempts = 0
+            resend = True
+
+            # повторюємо відправку, поки не отримаємо ACK
+            while not delivered:
+                try:
+                    if resend:
+                        # надсилаємо повідомлення клієнту
+                        client_socket.send(message.encode())
+                        sent_at = time.perf_counter()
+                        metrics.inc("retransmits_total" if attempts else "sent_total")
+                        attempts += 1
+                        log.info("Відправлено %s клієнту %s", message, client_address)
+                    resend = True
+
+                    # очікуємо підтвердження доставки
+                    response = client_socket.recv(1024)
+                    if not response:
+                        raise ConnectionResetError
+                    received = acks.feed(response)
+
+                    # перевірка підтвердження
+                    if message_id in received:
+                        log.info("Підтверджено отримання %s", message)
+                        # час до ACK рахуємо лише для повідомлень без повторів
+                        if attempts == 1:
+                            metrics.observe("ack_rtt_seconds", time.perf_counter() - sent_at)
+                        metrics.inc("delivered_total")
+                        delivered = True
+                        message_id += 1
+                    elif not received or max(received) < message_id:
+                        # запізнілий ACK попереднього повідомлення або його
+                        # неповна частина — чекаємо далі без повтору
+                        resend = False
+                    else:
+                        metrics.inc("invalid_acks_total")
+                        log.info("Невірне підтвердження, повторна відправка")
+
+                except socket.timeout:
+                    metrics.inc("timeouts_total")
+                    log.info("Таймаут. Повторна відправка повідомлення")
+
+            # пауза
+            time.sleep(SEND_INTERVAL)
+
+    except (ConnectionResetError, BrokenPipeError):
+        metrics.inc("disconnects_total")
+        log.info("Клієнт %s відключився", client_address)
+
+    finally:
+        # закриваємо з’єднання з клієнтом
+        client_socket.close()
+        metrics.inc("connections_active", -1)
+        log.info("З’єднання з %s завершено", client_address)
+
+
+def start_server():
+    """
+    Запуск сервера та очікування клієнтів
+    """
+    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server_socket.bind((HOST, PORT))
+    server_socket.listen()
+
+    start_observability(METRICS_PORT, snapshot_file())
+    logger.info("Сервер запущено, очікування клієнтів...")
+
+    while True:
+        # приймаємо нового клієнта
+        client_socket, client_address = server_socket.accept()
+
+        # запускаємо окремий потік для клієнта
+        client_thread = threading.Thread(
+            target=handle_client,
+            args=(client_socket, client_address),
+            daemon=True
+        )
+        client_thread.start()
+
+
+async def negotiate(reader, writer):
+    """
+    Визначає режим клієнта за першими байтами з'єднання:
+      HELLO:WINDOW:<n>[:SESSION:<id>]\\n  - текстові рядки з вікном
+      HELLO:SESSION:<id>\\n              - stop-and-wait із сесією
+      MAGIC + кадр HELLO                  - бінарні кадри (framing.py)
+    Повертає (канал, вікно, сесія). Канал None — режим stop-and-wait;
+    клієнт, що нічого не надіслав (старий клієнт), отримує (None, None, None).
+    """
+    try:
+        head = await asyncio.wait_for(reader.readexactly(len(framing.MAGIC)), NEGOTIATE_TIMEOUT)
+    except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+        return None, None, None
+
+    try:
+        if head == framing.MAGIC:
+            channel = FrameChannel(reader, writer)
+            kind, body = await channel.read_frame()
+            if kind != framing.HELLO:
+                return None, None, None
+            requested, session = framing.read_hello(body)
+        else:
+            fields = (head + await reader.readline()).decode().strip().split(":")
+            if fields[0] != "HELLO":
+                return None, None, None
+            options = dict(zip(fields[1::2], fields[2::2]))
+            session = options.get("SESSION")
+            if "WINDOW" not in options:
+                return None, None, session
+            channel = LineChannel(reader, writer)
+            requested = int(options["WINDOW"])
+    except (ValueError, asyncio.IncompleteReadError):
+        return None, None, None
+
+    return channel, max(1, min(requested, MAX_WINDOW)), session or None
+
+
+class LineChannel:
+    """Текстовий конвеєрний режим: кожне повідомлення — рядок з \\n."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    def send_window(self, window):
+        self.writer.write(f"WINDOW:{window}\n".encode())
+
+    def send(self, message_id):
+        self.writer.write(f"MSG:{message_id}\n".encode())
+
+    def write_pending(self):
+        # рядки пишуться одразу в send()
+        pass
+
+    async def flush(self):
+        await self.writer.drain()
+
+    async def receive(self):
+        """Список підтверджень (тип, [id]) з одного читання."""
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionResetError
+
+        kind, _, value = line.decode().strip().partition(":")
+        if kind == "CACK":
+            return [(framing.CACK, [int(value)])]
+        if kind in ("SACK", "ACK"):
+            return [(framing.SACK, [int(v) for v in value.split(",") if v])]
+        raise ValueError(kind)
+
+
+class FrameReceiver(asyncio.BufferedProtocol):
+    """
+    Протокол прийому кадрового режиму: транспорт читає байти прямо
+    у вільну частину FrameBuffer (get_buffer/buffer_updated), без
+    проміжних bytes. Керування записом і закриття передаються
+    початковому протоколу потоку, тож writer.drain() і
+    writer.wait_closed() працюють як раніше.
+    """
+
+    def __init__(self, buffer, stream_protocol):
+        self.buffer = buffer
+        self.stream_protocol = stream_protocol
+        self.transport = None
+        self.waiter = None
+        self.closed = False
+        self.paused = False
+
+    def get_buffer(self, sizehint):
+        return self.buffer.writable()
+
+    def buffer_updated(self, nbytes):
+        self.buffer.advance(nbytes)
+        # місця на ще один кадр немає — чекаємо, поки розберуть буфер
+        if len(self.buffer.writable()) < framing.MAX_FRAME:
+            self.transport.pause_reading()
+            self.paused = True
+        self._wake()
+
+    def eof_received(self):
+        self.closed = True
+        self._wake()
+        return False
+
+    def connection_lost(self, exc):
+        self.closed = True
+        self._wake()
+        self.stream_protocol.connection_lost(exc)
+
+    def pause_writing(self):
+        self.stream_protocol.pause_writing()
+
+    def resume_writing(self):
+        self.stream_protocol.resume_writing()
+
+    def _wake(self):
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    async def wait(self):
+        """Чекає нових даних. False — з'єднання закрито."""
+        if self.paused:
+            self.paused = False
+            self.transport.resume_reading()
+        if self.closed:
+            return False
+        self.waiter = asyncio.get_running_loop().create_future()
+        try:
+            await self.waiter
+        finally:
+            self.waiter = None
+        return True
+
+
+class FrameChannel:
+    """
+    Бінарний конвеєрний режим: кадри з префіксом довжини.
+    Одне читання може містити багато кадрів, усі вони
+    розбираються з одного буфера без створення рядків.
+    Після HELLO прийом переходить на FrameReceiver: дані з
+    сокета потрапляють у буфер без копіювання.
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.buffer = framing.FrameBuffer()
+        self.out = framing.FrameWriter()
+        self.receiver = None
+
+    async def read_frame(self):
+        header = await self.reader.readexactly(framing.HEADER.size)
+        length, kind = framing.HEADER.unpack(header)
+        return kind, await self.reader.readexactly(length)
+
+    def _attach(self):
+        transport = self.writer.transport
+        self.receiver = FrameReceiver(self.buffer, transport.get_protocol())
+        self.receiver.transport = transport
+        # байти, які StreamReader уже прочитав після HELLO
+        leftover = bytes(self.reader._buffer)
+        self.reader._buffer.clear()
+        self.buffer.feed(leftover)
+        transport.set_protocol(self.receiver)
+
+    def send_window(self, window):
+        self.out.add(framing.WINDOW, window)
+
+    def send(self, message_id):
+        self.out.add(framing.MSG, message_id)
+
+    def write_pending(self):
+        if self.out:
+            self.writer.write(self.out.take())
+
+    async def flush(self):
+        self.write_pending()
+        await self.writer.drain()
+
+    async def receive(self):
+        if self.receiver is None:
+            self._attach()
+
+        acks = []
+        while not acks:
+            for kind, body in self.buffer.frames():
+                if kind == framing.CACK:
+                    acks.append((framing.CACK, [framing.read_id(body)]))
+                elif kind in (framing.SACK, framing.ACK):
+                    acks.append((framing.SACK, framing.read_ids(body)))
+                else:
+                    raise ValueError(kind)
+            if not acks and not await self.receiver.wait():
+                raise ConnectionResetError
+        return acks
+
+
+async def deliver_stop_and_wait(reader, writer, client_address, scheduler, messages, on_ack=None):
+    """Одне повідомлення за раз: відправка, очікування ACK, пауза."""
+    loop = asyncio.get_running_loop()
+    acks = framing.LegacyParser(b"ACK")
+
+    for message_id in messages:
+        message = f"MSG:{message_id}"
+
+        def resend(message=message):
+            writer.write(message.encode())
+            metrics.inc("timeouts_total")
+            metrics.inc("retransmits_total")
+            log.info("Таймаут. Повторна відправка %s", message)
+
+        writer.write(message.encode())
+        sent_at = loop.time()
+        metrics.inc("sent_total")
+        log.info("Відправлено %s клієнту %s", message, client_address)
+        pending = scheduler.track(resend, functools.partial(give_up, writer))
+
+        try:
+            while True:
+                await writer.drain()
+                data = await reader.read(1024)
+
+                # порожні дані — клієнт закрив з'єднання
+                # (або сервер здався після MAX_RETRIES повторів)
+                if not data:
+                    raise ConnectionResetError
+
+                received = acks.feed(data)
+                if message_id in received:
+                    log.info("Підтверджено отримання %s", message)
+                    break
+                if not received or max(received) < message_id:
+                    # запізнілий ACK попереднього повідомлення або неповна частина
+                    continue
+
+                metrics.inc("invalid_acks_total")
+                metrics.inc("retransmits_total")
+                log.info("Невірне підтвердження, повторна відправка")
+                writer.write(message.encode())
+        finally:
+            pending.cancel()
+
+        # час до ACK рахуємо лише для повідомлень без повторів
+        if pending.attempt == 0:
+            metrics.observe("ack_rtt_seconds", loop.time() - sent_at)
+        metrics.inc("delivered_total")
+        if on_ack is not None:
+            on_ack(message_id)
+
+        await asyncio.sleep(SEND_INTERVAL)
+
+
+async def deliver_windowed(channel, client_address, window, scheduler, messages, on_ack=None):
+    """
+    Конвеєрна доставка: до window непідтверджених повідомлень у польоті.
+    Клієнт підтверджує кумулятивно (CACK: отримано все до id включно)
+    або вибірково (SACK: отримано лише ці id).
+    Повторні відправки робить спільний планувальник (timer_wheel.py),
+    і лише для тих id, для яких минув таймаут.
+    """
+    loop = asyncio.get_running_loop()
+    channel.send_window(window)
+
+    messages = list(messages)
+    base = 0          # позиція найстаршого непідтвердженого повідомлення
+    next_index = 0    # позиція наступного для першої відправки
+    acked = set()     # підтверджені id, що йдуть після base
+    in_flight = {}    # id у польоті -> таймер повторної відправки
+    sent_at = {}      # id без повторів -> час першої відправки
+
+    def resend(message_id):
+        channel.send(message_id)
+        channel.write_pending()
+        # після повтору вже не відомо, на яку відправку прийде ACK
+        sent_at.pop(message_id, None)
+        metrics.inc("timeouts_total")
+        metrics.inc("retransmits_total")
+        log.info("Таймаут. Повторна відправка MSG:%s", message_id)
+
+    try:
+        while base < len(messages):
+            while next_index < len(messages) and next_index - base < window:
+                message_id = messages[next_index]
+                channel.send(message_id)
+                sent_at[message_id] = loop.time()
+                metrics.inc("sent_total")
+                in_flight[message_id] = scheduler.track(
+                    lambda message_id=message_id: resend(message_id),
+                    functools.partial(give_up, channel.writer),
+                )
+                next_index += 1
+            await channel.flush()
+
+            try:
+                acks = await channel.receive()
+            except ValueError:
+                metrics.inc("invalid_acks_total")
+                log.info("Невірне підтвердження, ігноруємо")
+                continue
+
+            for kind, ids in acks:
+                if kind == framing.CACK:
+                    ids = [message_id for message_id in in_flight if message_id <= ids[0]]
+                for message_id in ids:
+                    pending = in_flight.pop(message_id, None)
+                    if pending is not None:
+                        pending.cancel()
+                        acked.add(message_id)
+                        if message_id in sent_at:
+                            metrics.observe("ack_rtt_seconds", loop.time() - sent_at.pop(message_id))
+                        metrics.inc("delivered_total")
+                        if on_ack is not None:
+                            on_ack(message_id)
+
+            while base < len(messages) and messages[base] in acked:
+                acked.discard(messages[base])
+                base += 1
+    finally:
+        for pending in in_flight.values():
+            pending.cancel()
+
+    log.info("Усі %s повідомлень підтверджено клієнтом %s", len(messages), client_address)
+
+
+async def handle_client_async(reader, writer, scheduler, outboxes=None):
+    """
+    Обслуговування одного клієнта в asyncio-режимі.
+    Клієнт, що привітався (текстом або кадром HELLO), отримує
+    конвеєрну доставку, решта — той самий stop-and-wait протокол,
+    що й у handle_client. Клієнт із сесією продовжує з останнього
+    підтвердженого повідомлення, навіть після перезапуску сервера.
+    """
+    client_address = writer.get_extra_info("peername")
+    log.info("Клієнт підключився: %s", client_address)
+    metrics.inc("connections_total")
+    metrics.inc("connections_active")
+
+    session = None
+    try:
+        channel, window, session = await negotiate(reader, writer)
+
+        if session and outboxes is not None:
+            try:
+                outbox = outboxes.acquire(session)
+            except ValueError as e:
+                log.warning("Відмова %s: %s", client_address, e)
+                session = None
+                return
+            # нова сесія — ставимо в чергу весь її набір повідомлень
+            if outbox.next_id == 0:
+                for message_id in range(MAX_MESSAGES):
+                    outbox.append(f"MSG:{message_id}".encode())
+            messages = outbox.pending_ids()
+            on_ack = outbox.ack
+            log.info("Сесія %s: до доставки %s повідомлень", session, len(messages))
+        else:
+            session = None
+            messages = range(MAX_MESSAGES)
+            on_ack = None
+
+        if channel:
+            await deliver_windowed(channel, client_address, window, scheduler, messages, on_ack)
+        else:
+            await deliver_stop_and_wait(reader, writer, client_address, scheduler, messages, on_ack)
+
+    except (ConnectionResetError, BrokenPipeError):
+        metrics.inc("disconnects_total")
+        log.info("Клієнт %s відключився", client_address)
+
+    finally:
+        if session:
+            outboxes.release(session)
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+        metrics.inc("connections_active", -1)
+        log.info("З’єднання з %s завершено", client_address)
+
+
+def give_up(writer):
+    """Клієнт не відповів після MAX_RETRIES повторів — закриваємо з'єднання."""
+    metrics.inc("give_ups_total")
+    log.warning("Немає ACK після %s повторів, з'єднання закрито", MAX_RETRIES)
+    writer.close()
+
+
+def start_observability(metrics_port, snapshot_file=None):
+    """Фоновий запис логу, HTTP з метриками і, за бажанням, файл зі знімками."""
+    start_async_logging("server")
+    try:
+        serve_http(HOST, metrics_port)
+    except OSError as e:
+        log.warning("Метрики недоступні на порту %s: %s", metrics_port, e)
+    if snapshot_file:
+        write_snapshots(snapshot_file)
+
+
+def raise_fd_limit():
+    """
+    Піднімає ліміт відкритих файлів до максимально дозволеного,
+    інакше тисячі одночасних сокетів упруться в ulimit -n.
+    """
+    try:
+        import resource
+    except ImportError:
+        # Windows: модуля resource немає
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or soft < hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+        except (ValueError, OSError):
+            pass
+
+
+async def serve_async(host=None, port=None, reuse_port=False):
+    host = host or HOST
+    port = port or PORT
+
+    # один планувальник повторних відправок на всі з'єднання
+    scheduler = RetransmitScheduler(
+        timeout=ACK_TIMEOUT,
+        backoff=RETRY_BACKOFF,
+        max_timeout=MAX_RETRY_TIMEOUT,
+        jitter=RETRY_JITTER,
+        max_retries=MAX_RETRIES,
+    )
+    scheduler.attach(asyncio.get_running_loop())
+
+    server = await asyncio.start_server(
+        functools.partial(handle_client_async, scheduler=scheduler, outboxes=OutboxStore(OUTBOX_DIR)),
+        host, port, backlog=BACKLOG, reuse_port=reuse_port,
+    )
+    logger.info("Сервер (asyncio) запущено, очікування клієнтів...")
+    async with server:
+        await server.serve_forever()
+
+
+def start_async_server():
+    """
+    Запуск сервера в asyncio-режимі: усі клієнти обслуговуються
+    одним потоком і одним циклом подій.
+    """
+    raise_fd_limit()
+    start_observability(METRICS_PORT, snapshot_file())
+    asyncio.run(serve_async())
+
+
+def prefork_worker(row, values):
+    """Воркер prefork-режиму: власний цикл подій на спільному порту."""
+    # з'єднання попереднього воркера в цьому рядку вже закриті,
+    # тож рядок починається з поточних (нульових) значень цього процесу
+    metrics.attach_shared(values, row, SHARED_COUNTERS)
+    raise_fd_limit()
+    start_observability(METRICS_PORT + 1 + row)
+    try:
+        asyncio.run(serve_async(reuse_port=True))
+    except KeyboardInterrupt:
+        pass
+
+
+def start_prefork_server(workers):
+    """
+    Запуск workers процесів, кожен з яких слухає HOST:PORT через
+    SO_REUSEPORT (ядро розподіляє з'єднання між ними).
+    Supervisor перезапускає воркери, що впали, і періодично
+    виводить сумарні лічильники з усіх процесів.
+    """
+    if not hasattr(socket, "SO_REUSEPORT"):
+        raise RuntimeError("SO_REUSEPORT is not supported on this platform")
+
+    values = multiprocessing.Array("q", workers * len(SHARED_COUNTERS), lock=False)
+
+    def spawn(row):
+        process = multiprocessing.Process(target=prefork_worker, args=(row, values), daemon=True)
+        process.start()
+        return process
+
+    processes = [spawn(row) for row in range(workers)]
+
+    # kill/systemd надсилають SIGTERM — зупиняємо й воркери
+    signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+    print(f"Сервер запущено: {workers} воркерів на {HOST}:{PORT}")
+
+    try:
+        while True:
+            time.sleep(STATS_INTERVAL)
+
+            for row, process in enumerate(processes):
+                if not process.is_alive():
+                    print(f"Воркер {row} завершився (код {process.exitcode}), перезапуск")
+                    processes[row] = spawn(row)
+
+            totals = {
+                name: sum(values[row * len(SHARED_COUNTERS) + i] for row in range(workers))
+                for i, name in enumerate(SHARED_COUNTERS)
+            }
+            print("Разом: " + ", ".join(f"{name}={value}" for name, value in totals.items()))
+
+    except KeyboardInterrupt:
+        pass
+
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+
+
+def snapshot_file():
+    """Шлях для періодичних знімків метрик (--metrics-file)."""
+    if "--metrics-file" in sys.argv:
+        return sys.argv[sys.argv.index("--metrics-file") + 1]
+    return None
+
+
+if __name__ == "__main__":
+    if "--workers" in sys.argv:
+        start_prefork_server(int(sys.argv[sys.argv.index("--workers") + 1]))
+    elif "--async" in sys.argv:
+        start_async_server()
+    else:
+        start_server()
+
+
+# cd D:\exam
 # python server.py
\ No newline at end of file
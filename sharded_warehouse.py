@@ -0,0 +1,181 @@
+# sharded_warehouse.py
+# Lower-contention warehouse model for the runner simulation of kuvalda(2).py.
+#
+#   python sharded_warehouse.py --runners 5 50 200 1000 --attempts 2000
+#
+# In kuvalda(2).py every runner holds warehouse.lock around steal(), the
+# earnings update and the progress write, so runners of one depot are
+# serialized. Here the stock is split across lock-striped shards and a
+# theft is a reservation: read a shard, then compare-and-update it under
+# that shard's lock, retrying if another runner changed it in between.
+# The outcome draw, earnings and progress are per runner and need no lock.
+import argparse
+import random
+import threading
+import time
+
+from runner_experiments import load_simulation
+
+SHARDS = 16
+
+
+class StockShard:
+    def __init__(self, meds):
+        self.meds = meds
+        self.lock = threading.Lock()
+
+    def compare_and_set(self, expected, new):
+        """Sets meds to new only if it still equals expected."""
+        with self.lock:
+            if self.meds != expected:
+                return False
+            self.meds = new
+            return True
+
+
+class ShardedWarehouse:
+    def __init__(self, name, meds, shards=SHARDS):
+        self.name = name
+        base, extra = divmod(meds, shards)
+        self.shards = [StockShard(base + (1 if i < extra else 0)) for i in range(shards)]
+        self.retries = 0
+
+    @property
+    def meds(self):
+        return sum(shard.meds for shard in self.shards)
+
+    def reserve(self, amount, hint=0):
+        """
+        Takes up to amount meds, starting from shard hint and moving on
+        to the next shards while stock runs out. Returns the amount taken.
+        """
+        taken = 0
+        count = len(self.shards)
+        for step in range(count):
+            shard = self.shards[(hint + step) % count]
+            while taken < amount:
+                meds = shard.meds
+                if meds == 0:
+                    break
+                want = min(meds, amount - taken)
+                if shard.compare_and_set(meds, meds - want):
+                    taken += want
+                else:
+                    self.retries += 1
+            if taken == amount:
+                break
+        return taken
+
+    def steal(self, amount, rng=random, hint=0):
+        """Same outcomes as Warehouse.steal; stock never goes below zero."""
+        outcome = rng.choice(["success", "fail", "caught"])
+
+        if outcome == "caught":
+            return ("caught", 0)
+
+        elif outcome == "fail":
+            return ("fail", 0)
+
+        return ("success", self.reserve(rng.randint(1, amount), hint))
+
+
+class ShardedRunner(threading.Thread):
+    """
+    Runner.run without the shared lock: earnings live on the runner and
+    progress is the runner's own slot of a list.
+    """
+    price_per_unit = 5
+
+    def __init__(self, index, warehouse, progress, attempts=10, pause=(0.1, 0.5), stop_when_caught=True):
+        super().__init__(name=f"Runner_{index+1}")
+        self.index = index
+        self.warehouse = warehouse
+        self.progress = progress
+        self.attempts = attempts
+        self.pause = pause
+        self.stop_when_caught = stop_when_caught
+        self.earnings = 0
+        self.rng = random.Random()
+
+    def run(self):
+        rng = self.rng
+        for i in range(self.attempts):
+            result, stolen = self.warehouse.steal(rng.randint(10, 30), rng, self.index)
+
+            if result == "success":
+                self.earnings += stolen * self.price_per_unit
+            elif result == "caught" and self.stop_when_caught:
+                self.progress[self.index] = f"CAUGHT at attempt {i+1}"
+                return
+
+            self.progress[self.index] = f"{i+1}/{self.attempts}"
+            if self.pause:
+                time.sleep(rng.uniform(*self.pause))
+
+        self.progress[self.index] += " (done)"
+
+
+# Contention benchmark
+# All runners work on one depot without pauses, and captures do not stop
+# them, so every runner makes the same number of attempts.
+
+def locked_worker(sim, warehouse, name, progress, attempts, earnings):
+    """The locking pattern of Runner.run from kuvalda(2).py."""
+    for i in range(attempts):
+        amount = random.randint(10, 30)
+        with warehouse.lock:
+            result, stolen = warehouse.steal(amount)
+            if result == "success":
+                earnings[name] = earnings.get(name, 0) + stolen * sim.Runner.price_per_unit
+            progress[name] = f"{i+1}/{attempts}"
+
+
+def bench_locked(runners, attempts, meds):
+    sim = load_simulation()
+    warehouse = sim.Warehouse("Depot A", meds)
+    progress, earnings = {}, {}
+    threads = [threading.Thread(target=locked_worker,
+                                args=(sim, warehouse, f"Runner_{i+1}", progress, attempts, earnings))
+               for i in range(runners)]
+    return run_threads(threads), meds - warehouse.meds, sum(earnings.values())
+
+
+def bench_sharded(runners, attempts, meds, shards=SHARDS):
+    warehouse = ShardedWarehouse("Depot A", meds, shards)
+    progress = [""] * runners
+    threads = [ShardedRunner(i, warehouse, progress, attempts, pause=None, stop_when_caught=False)
+               for i in range(runners)]
+    return run_threads(threads), meds - warehouse.meds, sum(t.earnings for t in threads)
+
+
+def run_threads(threads):
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warehouse contention benchmark")
+    parser.add_argument("--runners", type=int, nargs="+", default=[5, 50, 200, 1000])
+    parser.add_argument("--attempts", type=int, default=1000, help="attempts per runner")
+    parser.add_argument("--meds", type=int, default=None,
+                        help="stock of the depot (default: enough to run out half way)")
+    parser.add_argument("--shards", type=int, default=SHARDS)
+    args = parser.parse_args()
+
+    print(f"{'runners':>8}{'locked att/s':>16}{'sharded att/s':>16}{'stock ok':>10}")
+    for runners in args.runners:
+        attempts = runners * args.attempts
+        # on average a third of attempts succeed and take 10 meds
+        meds = args.meds or attempts * 10 // 6
+        locked_time, _, _ = bench_locked(runners, args.attempts, meds)
+        sharded_time, stolen, earned = bench_sharded(runners, args.attempts, meds, args.shards)
+        ok = 0 <= stolen <= meds and earned == stolen * ShardedRunner.price_per_unit
+        print(f"{runners:>8}{attempts / locked_time:>16.0f}{attempts / sharded_time:>16.0f}{str(ok):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# test_classify_cache.py
+from classify_cache import ClassificationCache
+from classify_stream import kuvalda
+
+def feed():
+    return [
+        {"name": "A", "amount": 50, "status": "clean"},
+        {"name": "B", "amount": 500, "status": "fraud"},
+        {"name": "C", "amount": "x", "status": "clean"},
+    ]
+
+def test_first_run_matches_and_reports_all():
+    cache = ClassificationCache()
+    results, delta = cache.classify(feed())
+    assert results == kuvalda.classify_clients(feed())
+    assert [d["name"] for d in delta] == ["A", "B", "C"]
+    assert all(d["old"] is None for d in delta)
+
+def test_only_changed_rows_are_reclassified(tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = ClassificationCache(path)
+    cache.classify(feed())
+    cache.save()
+
+    clients = feed()
+    clients[0]["amount"] = 60           # same category: no delta
+    clients[1]["status"] = "clean"      # decision changes
+    cache = ClassificationCache(path)
+    results, delta = cache.classify(clients)
+    assert results == kuvalda.classify_clients(clients)
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert delta == [{"name": "B", "old": ["Medium-value", "Blacklist the client"],
+                      "new": ["Medium-value", "Proceed without concerns"]}]
+
+def test_eviction_by_count_and_age():
+    now = [0]
+    cache = ClassificationCache(max_entries=2, max_age=10, clock=lambda: now[0])
+    cache.classify(feed())
+    assert list(cache.entries) == ["B", "C"]
+    now[0] = 5
+    cache.classify(feed()[1:2])
+    now[0] = 12
+    cache.evict()
+    assert list(cache.entries) == ["B"]
@@ -0,0 +1,40 @@
+# test_classify_rules.py
+import json
+import math
+import pytest
+from classify_rules import DEFAULT_RULES, compile_rules, default_rules, load_rules
+from classify_stream import kuvalda
+
+def make_clients():
+    amounts = [0, 99.9, 100, 999, 1000, -1, math.nan, math.inf, True, None, "5"]
+    statuses = ["clean", "suspicious", "fraud", "other", None]
+    return [{"name": f"c{i}", "amount": a, "status": statuses[i % len(statuses)]}
+            for i, a in enumerate(amounts)]
+
+def test_default_rules_match_classify_clients():
+    clients = make_clients()
+    assert default_rules.classify(clients) == kuvalda.classify_clients(clients)
+    assert kuvalda.classify_clients(clients, default_rules) == kuvalda.classify_clients(clients)
+
+def test_custom_rules_from_file(tmp_path):
+    rules = dict(DEFAULT_RULES)
+    rules["bands"] = [{"below": 10, "category": "Tiny"}, {"below": 100, "category": "Small"},
+                      {"category": "Big"}]
+    rules["statuses"] = {**DEFAULT_RULES["statuses"], "pending": "Wait"}
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps(rules))
+    compiled = load_rules(path)
+    results = compiled.classify([{"name": "a", "amount": 10, "status": "pending"},
+                                 {"name": "b", "amount": 9, "status": "clean"}])
+    assert [(r["category"], r["decision"]) for r in results] == [
+        ("Small", "Wait"), ("Tiny", "Proceed without concerns")]
+    assert compiled.category_codes([5, 10, 500]).tolist() == [0, 1, 2]
+
+@pytest.mark.parametrize("bands", [
+    [],
+    [{"below": 10, "category": "A"}],
+    [{"below": 10, "category": "A"}, {"below": 5, "category": "B"}, {"category": "C"}],
+])
+def test_invalid_bands(bands):
+    with pytest.raises(ValueError):
+        compile_rules({**DEFAULT_RULES, "bands": bands})
@@ -0,0 +1,42 @@
+# test_classify_stream.py
+import csv
+import io
+import json
+import pytest
+from classify_stream import classify_file, kuvalda
+
+STATUSES = ["clean", "suspicious", "fraud", "other"]
+
+def make_clients(count):
+    return [{"name": f"C{i}", "amount": [5, 150, 5000, "x"][i % 4], "status": STATUSES[i % 3]}
+            for i in range(count)]
+
+def write_jsonl(path, clients):
+    with open(path, "w") as f:
+        for client in clients:
+            f.write(json.dumps(client) + "\n")
+
+@pytest.mark.parametrize("workers,columnar", [(1, False), (3, False), (2, True)])
+def test_jsonl_in_order(tmp_path, workers, columnar):
+    clients = make_clients(103)
+    path = tmp_path / "deals.jsonl"
+    write_jsonl(path, clients)
+    out = io.StringIO()
+    rows = classify_file(str(path), out, workers=workers, chunk_size=10, columnar=columnar)
+    results = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert rows == 103
+    assert [r["row"] for r in results] == list(range(103))
+    expected = kuvalda.classify_clients(clients)
+    assert [{k: r[k] for k in ("name", "category", "decision")} for r in results] == expected
+
+def test_csv_input_and_output(tmp_path):
+    path = tmp_path / "deals.csv"
+    path.write_text("name,amount,status\nA,99.5,clean\nB,100,fraud\nC,abc,clean\nD,,clean\n")
+    out = io.StringIO()
+    progress = []
+    classify_file(str(path), out, out_fmt="csv", chunk_size=2,
+                  progress=lambda rows, seconds: progress.append(rows))
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert [r["category"] for r in rows] == ["Low-value", "Medium-value", "Invalid data", "Invalid data"]
+    assert rows[1]["decision"] == "Blacklist the client"
+    assert progress == [2, 4]
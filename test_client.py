@@ -0,0 +1,79 @@
+# test_client.py
+import framing
+from client import AckBatcher
+from framing import FrameBuffer, FrameWriter
+
+def acked(batcher):
+    out = FrameWriter()
+    batcher.write(out)
+    buffer = FrameBuffer()
+    buffer.feed(out.take())
+    return [framing.read_ids(body) for _, body in buffer.frames()]
+
+def test_batches_in_completion_order():
+    batcher = AckBatcher()
+    for message_id in (3, 1, 2):
+        batcher.received(message_id)
+    batcher.done(2)
+    batcher.done(3)
+    assert acked(batcher) == [[2, 3]]
+    assert acked(batcher) == []
+
+def test_strict_order_waits_for_earlier():
+    batcher = AckBatcher(strict_order=True)
+    for message_id in (5, 6, 7):
+        batcher.received(message_id)
+    batcher.done(6)
+    batcher.done(7)
+    assert acked(batcher) == []
+    batcher.done(5)
+    assert acked(batcher) == [[5, 6, 7]]
+
+def test_repeat_is_acked_again():
+    batcher = AckBatcher(strict_order=True)
+    batcher.again(4)
+    assert acked(batcher) == [[4]]
+
+def test_acked_ids_are_recorded():
+    batcher = AckBatcher()
+    batcher.done(1)
+    acked(batcher)
+    assert batcher.acked == {1}
+
+def test_pipelined_client_drops_repeats_in_progress(monkeypatch):
+    import socket
+    import threading
+    import client
+
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    monkeypatch.setattr(client, "PORT", listener.getsockname()[1])
+    monkeypatch.setattr(client, "PROCESSING_TIME", 0.2)
+    thread = threading.Thread(target=client.start_pipelined_client, args=(8, 2, True), daemon=True)
+    thread.start()
+
+    conn, _ = listener.accept()
+    conn.settimeout(5)
+    assert conn.recv(len(framing.MAGIC)) == framing.MAGIC
+    buffer = FrameBuffer()
+    buffer.recv_from(conn)
+    assert [kind for kind, _ in buffer.frames()] == [framing.HELLO]
+    conn.sendall(framing.encode(framing.MSG, 0) + framing.encode(framing.MSG, 1))
+    # повтори, поки обидва ще обробляються
+    conn.sendall(framing.encode(framing.MSG, 1) + framing.encode(framing.MSG, 0))
+
+    ids = []
+    while len(ids) < 2:
+        buffer.recv_from(conn)
+        ids += [i for kind, body in buffer.frames() for i in framing.read_ids(body)]
+    assert ids == [0, 1]
+
+    # повтор уже підтвердженого — ACK ще раз
+    conn.sendall(framing.encode(framing.MSG, 1))
+    buffer.recv_from(conn)
+    assert [framing.read_ids(body) for _, body in buffer.frames()] == [[1]]
+    conn.close()
+    listener.close()
+    thread.join(5)
+    assert not thread.is_alive()
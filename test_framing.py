@@ -0,0 +1,42 @@
+# test_framing.py
+import framing
+from framing import FrameBuffer, FrameWriter, encode, read_id, read_ids
+
+def test_many_frames_in_one_feed():
+    buffer = FrameBuffer()
+    buffer.feed(encode(framing.ACK, 1) + encode(framing.ACK, 2) + encode(framing.SACK, 3, 4))
+    frames = [(kind, bytes(body)) for kind, body in buffer.frames()]
+    assert [kind for kind, _ in frames] == [framing.ACK, framing.ACK, framing.SACK]
+    assert read_id(frames[1][1]) == 2
+    assert read_ids(frames[2][1]) == [3, 4]
+
+def test_split_frame_waits_for_rest():
+    data = encode(framing.MSG, 7)
+    buffer = FrameBuffer()
+    buffer.feed(data[:3])
+    assert list(buffer.frames()) == []
+    buffer.feed(data[3:])
+    assert [(kind, read_id(body)) for kind, body in buffer.frames()] == [(framing.MSG, 7)]
+
+def test_buffer_is_reused():
+    buffer = FrameBuffer(capacity=2 * framing.MAX_FRAME)
+    frame = encode(framing.MSG, 1)
+    for _ in range(100000):
+        buffer.feed(frame)
+        assert len(list(buffer.frames())) == 1
+    assert len(buffer.buffer) == 2 * framing.MAX_FRAME
+
+def test_writer_batches_frames():
+    out = FrameWriter()
+    out.add(framing.CACK, 5)
+    out.add(framing.SACK, 7, 9)
+    assert out.take() == encode(framing.CACK, 5) + encode(framing.SACK, 7, 9)
+    assert len(out) == 0
+
+def test_legacy_parser_coalesced_and_split():
+    parser = framing.LegacyParser(b"ACK")
+    assert parser.feed(b"ACK:1ACK:2AC") == [1, 2]
+    assert parser.feed(b"K:3") == [3]
+    assert parser.feed(b"noise") == []
+    assert parser.feed(b"ACK:") == []
+    assert parser.feed(b"12") == [12]
@@ -0,0 +1,57 @@
+# test_kuvalda.py
+import importlib.util
+import math
+import os
+
+import numpy as np
+import pytest
+
+
+def load(name, filename):
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+kuvalda = load("kuvalda_1", "kuvalda(1).py")
+
+
+def make_clients():
+    return kuvalda.clients_data + [
+        {"name": "Edge100", "amount": 100, "status": "clean"},
+        {"name": "Edge1000", "amount": 1000, "status": "fraud"},
+        {"name": "Just", "amount": 999.999, "status": "suspicious"},
+        {"name": "Neg", "amount": -5, "status": "other"},
+        {"name": "NaN", "amount": math.nan, "status": "clean"},
+        {"name": "Inf", "amount": -math.inf, "status": "clean"},
+        {"name": "Bool", "amount": True, "status": "clean"},
+        {"name": "None", "amount": None, "status": "fraud"},
+        {"name": "Int64", "amount": np.int64(5), "status": "clean"},
+        {"name": "Odd", "amount": 5, "status": None},
+    ]
+
+
+def test_columnar_matches_classify_clients():
+    clients = make_clients()
+    result = kuvalda.classify_clients_columnar(kuvalda.columns_from_records(clients))
+    assert kuvalda.records_from_columns(result) == kuvalda.classify_clients(clients)
+
+
+def test_numeric_and_masked_columns():
+    amounts = np.array([50.0, 100.0, 999.0, 1000.0, np.nan])
+    columns = {
+        "name": np.array(["a", "b", "c", "d", "e"]),
+        "amount": np.ma.array(amounts, mask=[False, False, True, False, False]),
+        "status": np.array(["clean", "suspicious", "fraud", "unknown", "fraud"]),
+    }
+    result = kuvalda.classify_clients_columnar(columns)
+    assert result["category"].tolist() == [0, 1, 3, 2, 2]
+    assert result["decision"].tolist() == [0, 1, 4, 3, 2]
+
+
+def test_empty_columns():
+    columns = {"name": np.array([]), "amount": np.array([]), "status": np.array([])}
+    result = kuvalda.classify_clients_columnar(columns)
+    assert len(result["category"]) == len(result["decision"]) == 0
@@ -0,0 +1,48 @@
+# test_kuvalda_sim.py
+import importlib.util
+import os
+import random
+import time
+
+
+def load(name, filename):
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+sim = load("kuvalda_2", "kuvalda(2).py")
+
+
+def virtual_run(seed, runners=5, attempts=10):
+    rng = random.Random(seed)
+    warehouses = [sim.Warehouse(f"Depot {i}", rng.randint(100, 300)) for i in range(4)]
+    initial = sum(wh.meds for wh in warehouses)
+    progress = {}
+    team = [sim.VirtualRunner(f"Runner_{i+1}", rng.choice(warehouses), progress, attempts)
+            for i in range(runners)]
+    sim.run_events(team, rng)
+    return warehouses, team, progress, initial
+
+
+def test_virtual_simulation_is_reproducible(capsys):
+    assert sim.simulate(virtual=True, seed=7) == sim.simulate(virtual=True, seed=7)
+    out = capsys.readouterr().out
+    assert out.count("TOTAL EARNED") == 2
+
+
+def test_virtual_invariants():
+    warehouses, team, progress, initial = virtual_run(3, runners=200, attempts=20)
+    assert all(wh.meds >= 0 for wh in warehouses)
+    stolen = initial - sum(wh.meds for wh in warehouses)
+    assert sum(r.earnings for r in team) == stolen * sim.Runner.price_per_unit
+    for status in progress.values():
+        assert status.startswith("CAUGHT at attempt") or status == "20/20 (done)"
+
+
+def test_virtual_is_fast():
+    started = time.perf_counter()
+    virtual_run(1, runners=2000, attempts=10)
+    assert time.perf_counter() - started < 1.0
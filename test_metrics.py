@@ -0,0 +1,66 @@
+# test_metrics.py
+import threading
+from metrics import Metrics, SampledLogger
+
+def test_counters_from_many_threads():
+    m = Metrics()
+
+    def work():
+        for _ in range(1000):
+            m.inc("sent_total")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert m.get("sent_total") == 8000
+    assert "sent_total 8000" in m.render()
+
+def test_histogram_render():
+    m = Metrics()
+    for value in (0.0001, 0.003, 0.003, 100):
+        m.observe("ack_rtt_seconds", value)
+    text = m.render()
+    assert 'ack_rtt_seconds_bucket{le="0.0005"} 1' in text
+    assert 'ack_rtt_seconds_bucket{le="0.005"} 3' in text
+    assert 'ack_rtt_seconds_bucket{le="+Inf"} 4' in text
+    assert "ack_rtt_seconds_count 4" in text
+
+def test_shared_row():
+    m = Metrics()
+    values = [0] * 4
+    m.attach_shared(values, 1, ("a", "b"))
+    m.inc("b", 3)
+    m.inc("c")
+    assert values == [0, 0, 0, 3]
+
+def test_sampled_logger_drops():
+    class Sink:
+        count = 0
+
+        def info(self, msg, *args):
+            self.count += 1
+
+    sink = Sink()
+    log = SampledLogger(sink, rate=0)
+    for _ in range(100):
+        log.info("x")
+    assert sink.count == 0
+
+def test_finished_threads_are_folded():
+    metrics = Metrics()
+
+    def work():
+        metrics.inc("connections_total")
+        metrics.observe("rtt", 0.002)
+
+    for _ in range(50):
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+    metrics.inc("connections_total")
+    assert len(metrics._shards) == 1       # лише поточний потік
+    counters, histograms = metrics.snapshot()
+    assert counters["connections_total"] == 51
+    assert sum(histograms["rtt"][:-1]) == 50
@@ -0,0 +1,64 @@
+# test_order_batch.py
+import pytest
+from order_manager import Order, Item
+from order_batch import OrderBatch
+
+def make_orders():
+    return [
+        Order([Item("A", 10), Item("B", 50), Item("C", 30)]),
+        Order([]),
+        Order([Item("A", 100), Item("D", 100)]),
+        Order([Item("X", 1e9), Item("Y", 2e9)]),
+    ]
+
+def test_totals_match_order():
+    orders = make_orders()
+    batch = OrderBatch.from_orders(orders)
+    assert batch.totals().tolist() == [o.total() for o in orders]
+
+def test_most_expensive_match_order():
+    orders = make_orders()
+    batch = OrderBatch.from_orders(orders)
+    for item, order in zip(batch.most_expensive(), orders):
+        expected = order.most_expensive()
+        if expected is None:
+            assert item is None
+        else:
+            assert (item.name, item.price) == (expected.name, expected.price)
+
+def test_argmax_empty_batch():
+    batch = OrderBatch.from_orders([Order([]), Order([])])
+    assert batch.argmax().tolist() == [-1, -1]
+    assert batch.totals().tolist() == [0, 0]
+
+def test_interned_names():
+    batch = OrderBatch.from_orders(make_orders())
+    assert batch.names == ["A", "B", "C", "D", "X", "Y"]
+    assert batch.codes.tolist() == [0, 1, 2, 0, 3, 4, 5]
+
+def test_apply_discount_scalar():
+    orders = make_orders()
+    batch = OrderBatch.from_orders(orders)
+    batch.apply_discount(10)
+    for order in orders:
+        order.apply_discount(10)
+    assert batch.totals().tolist() == [o.total() for o in orders]
+
+def test_apply_discount_per_order():
+    batch = OrderBatch.from_orders(make_orders())
+    batch.apply_discount([0, 50, 50, 100])
+    assert batch.totals().tolist() == [90, 0, 100, 0]
+
+def test_apply_discount_invalid():
+    batch = OrderBatch.from_orders(make_orders())
+    with pytest.raises(ValueError):
+        batch.apply_discount(150)
+    with pytest.raises(ValueError):
+        batch.apply_discount([10, 20])
+
+def test_round_trip():
+    orders = make_orders()
+    restored = OrderBatch.from_orders(orders).to_orders()
+    assert len(restored) == len(orders)
+    for a, b in zip(restored, orders):
+        assert [(i.name, i.price) for i in a.items] == [(i.name, i.price) for i in b.items]
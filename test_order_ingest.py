@@ -0,0 +1,46 @@
+# test_order_ingest.py
+import json
+import pytest
+from order_ingest import ingest, iter_lines, run, shard_ranges
+
+def write_dump(path, count):
+    with open(path, "w") as f:
+        for i in range(count):
+            order = {"id": str(i), "items": [{"name": f"N{i}", "price": i}, {"name": "X", "price": 1}]}
+            if i % 2:
+                order["discount"] = 50
+            f.write(json.dumps(order) + "\n")
+        f.write("\n")
+
+def test_ingest_summaries(tmp_path):
+    path = tmp_path / "orders.jsonl"
+    write_dump(path, 3)
+    summaries = list(ingest(path))
+    assert [s["id"] for s in summaries] == ["0", "1", "2"]
+    assert summaries[1]["total"] == 2
+    assert summaries[1]["discounted_total"] == 1
+    assert summaries[2]["most_expensive"] == ("N2", 2)
+
+def test_ingest_discount_override(tmp_path):
+    path = tmp_path / "orders.jsonl"
+    write_dump(path, 2)
+    assert [s["discounted_total"] for s in ingest(path, discount=0)] == [1, 2]
+
+@pytest.mark.parametrize("shards", [1, 2, 3, 7, 50])
+def test_shards_cover_every_line_once(tmp_path, shards):
+    path = tmp_path / "orders.jsonl"
+    write_dump(path, 20)
+    lines = []
+    for start, end in shard_ranges(path, shards):
+        lines.extend(iter_lines(path, start, end))
+    assert lines == list(iter_lines(path))
+
+def test_run_pool_matches_sequential(tmp_path):
+    path = tmp_path / "orders.jsonl"
+    write_dump(path, 200)
+    sequential = run(path)
+    parallel = run(path, workers=3)
+    for key in ("orders", "items_total", "discounted_total", "most_expensive"):
+        assert parallel[key] == sequential[key]
+    assert sequential["orders"] == 200
+    assert sequential["orders_per_sec"] > 0
@@ -1,69 +1,158 @@
-# test_order_manager.py
-import pytest
-from order_manager import Order, Item
-
-def test_total_normal():
-    items = [Item("A", 10), Item("B", 20), Item("C", 30)]
-    order = Order(items)
-    assert order.total() == 60
-
-def test_total_empty():
-    order = Order([])
-    assert order.total() == 0
-
-def test_total_extreme():
-    items = [Item("X", 1e9), Item("Y", 2e9)]
-    order = Order(items)
-    assert order.total() == 3e9
-
-def test_most_expensive_normal():
-    items = [Item("A", 10), Item("B", 50), Item("C", 30)]
-    order = Order(items)
-    assert order.most_expensive().name == "B"
-    assert order.most_expensive().price == 50
-
-def test_most_expensive_empty():
-    order = Order([])
-    assert order.most_expensive() is None
-
-def test_apply_discount_valid():
-    items = [Item("A", 100), Item("B", 200)]
-    order = Order(items)
-    order.apply_discount(10)
-    assert order.items[0].price == 90
-    assert order.items[1].price == 180
-
-def test_apply_discount_invalid_negative():
-    items = [Item("A", 100)]
-    order = Order(items)
-    with pytest.raises(ValueError):
-        order.apply_discount(-5)
-
-def test_apply_discount_invalid_over_100():
-    items = [Item("A", 100)]
-    order = Order(items)
-    with pytest.raises(ValueError):
-        order.apply_discount(150)
-
-def test_discount_all_items():
-    items = [Item("A", 50), Item("B", 50), Item("C", 50)]
-    order = Order(items)
-    order.apply_discount(20)
-    for item in order.items:
-        assert item.price == 40
-
-def test_repr_non_empty():
-    items = [Item("A", 10), Item("B", 20)]
-    order = Order(items)
-    r = repr(order)
-    assert "A" in r and "B" in r
-    assert "10" in r and "20" in r
-
-def test_repr_empty():
-    order = Order([])
-    r = repr(order)
-    assert r == "Order([])"
-
-
-
-# python -m pytest service_body_test.py --maxfail=1 --disable-warnings -q
+# test_order_manager.py
+import pytest
+from order_manager import Order, Item, CompactOrder, NameTable
+
+def test_total_normal():
+    items = [Item("A", 10), Item("B", 20), Item("C", 30)]
+    order = Order(items)
+    assert order.total() == 60
+
+def test_total_empty():
+    order = Order([])
+    assert order.total() == 0
+
+def test_total_extreme():
+    items = [Item("X", 1e9), Item("Y", 2e9)]
+    order = Order(items)
+    assert order.total() == 3e9
+
+def test_most_expensive_normal():
+    items = [Item("A", 10), Item("B", 50), Item("C", 30)]
+    order = Order(items)
+    assert order.most_expensive().name == "B"
+    assert order.most_expensive().price == 50
+
+def test_most_expensive_empty():
+    order = Order([])
+    assert order.most_expensive() is None
+
+def test_apply_discount_valid():
+    items = [Item("A", 100), Item("B", 200)]
+    order = Order(items)
+    order.apply_discount(10)
+    assert order.items[0].price == 90
+    assert order.items[1].price == 180
+
+def test_apply_discount_invalid_negative():
+    items = [Item("A", 100)]
+    order = Order(items)
+    with pytest.raises(ValueError):
+        order.apply_discount(-5)
+
+def test_apply_discount_invalid_over_100():
+    items = [Item("A", 100)]
+    order = Order(items)
+    with pytest.raises(ValueError):
+        order.apply_discount(150)
+
+def test_discount_all_items():
+    items = [Item("A", 50), Item("B", 50), Item("C", 50)]
+    order = Order(items)
+    order.apply_discount(20)
+    for item in order.items:
+        assert item.price == 40
+
+def test_repr_non_empty():
+    items = [Item("A", 10), Item("B", 20)]
+    order = Order(items)
+    r = repr(order)
+    assert "A" in r and "B" in r
+    assert "10" in r and "20" in r
+
+def test_repr_empty():
+    order = Order([])
+    r = repr(order)
+    assert r == "Order([])"
+
+def test_add_item_updates_total_and_max():
+    order = Order([])
+    order.add_item(Item("A", 10))
+    order.add_item(Item("B", 50))
+    order.add_item(Item("C", 30))
+    assert order.total() == 90
+    assert order.most_expensive().name == "B"
+
+def test_remove_item_updates_total_and_max():
+    b = Item("B", 50)
+    order = Order([Item("A", 10), b, Item("C", 30)])
+    order.remove_item(b)
+    assert order.total() == 40
+    assert order.most_expensive().name == "C"
+    with pytest.raises(ValueError):
+        order.remove_item(b)
+
+def test_remove_all_items():
+    a = Item("A", 0.1)
+    order = Order([a])
+    order.remove_item(a)
+    assert order.total() == 0
+    assert order.most_expensive() is None
+
+def test_most_expensive_tie_returns_first():
+    order = Order([Item("A", 10), Item("B", 10)])
+    assert order.most_expensive().name == "A"
+
+def test_stacked_discounts_are_lazy():
+    items = [Item("A", 100), Item("B", 200)]
+    order = Order(items)
+    order.apply_discount(50)
+    order.apply_discount(50)
+    assert order.total() == 75
+    assert items[0].price == 100
+    assert order.items[0].price == 25
+    assert order.items[1].price == 50
+
+def test_add_item_after_discount():
+    order = Order([Item("A", 100)])
+    order.apply_discount(10)
+    order.add_item(Item("B", 50))
+    assert order.total() == 140
+    assert order.most_expensive().price == 90
+
+def test_full_discount_most_expensive():
+    order = Order([Item("A", 10), Item("B", 50)])
+    order.apply_discount(100)
+    assert order.total() == 0
+    assert order.most_expensive().name == "A"
+
+
+def test_item_has_no_dict():
+    with pytest.raises(AttributeError):
+        Item("A", 10).colour = "red"
+
+def test_compact_order_matches_order():
+    items = [Item("A", 10), Item("B", 50), Item("C", 30)]
+    compact = CompactOrder(items, names=NameTable())
+    assert compact.total() == 90
+    assert compact.most_expensive().name == "B"
+    assert [(i.name, i.price) for i in compact.items] == [("A", 10), ("B", 50), ("C", 30)]
+
+def test_compact_order_shares_names():
+    names = NameTable()
+    first = CompactOrder([Item("A", 1), Item("B", 2)], names=names)
+    second = CompactOrder([Item("B", 3), Item("A", 4)], names=names)
+    assert len(names) == 2
+    assert second[0].name == "B" and second[-1].name == "A"
+    assert list(first.codes) == [0, 1]
+
+def test_compact_order_discount():
+    compact = CompactOrder([Item("A", 100), Item("B", 200)], names=NameTable())
+    compact.apply_discount(10)
+    assert compact[0].price == 90
+    assert compact.total() == 270
+    compact.add("C", 300)
+    assert compact.most_expensive().name == "C"
+    assert compact.most_expensive().price == 300
+    with pytest.raises(ValueError):
+        compact.apply_discount(101)
+
+def test_compact_order_empty():
+    compact = CompactOrder(names=NameTable())
+    assert compact.total() == 0
+    assert compact.most_expensive() is None
+    assert repr(compact) == "CompactOrder([])"
+
+
+
+
+# python -m pytest service_body_test.py --maxfail=1 --disable-warnings -q
@@ -0,0 +1,57 @@
+# test_outbox.py
+import pytest
+from outbox import Outbox, OutboxStore, CHUNK
+
+def test_resume_after_reopen(tmp_path):
+    path = str(tmp_path / "s1")
+    outbox = Outbox(path)
+    for i in range(5):
+        outbox.append(f"MSG:{i}".encode())
+    outbox.ack(0)
+    outbox.ack(1)
+    outbox.ack(3)
+    outbox.close()
+
+    outbox = Outbox(path)
+    assert outbox.pending_ids() == [2, 4]
+    assert outbox.pending[4][1] == b"MSG:4"
+    assert outbox.acked_through == 2
+    assert outbox.append() == 5
+    outbox.close()
+
+def test_all_acked_nothing_redelivered(tmp_path):
+    path = str(tmp_path / "s2")
+    outbox = Outbox(path)
+    for i in range(3):
+        outbox.append()
+    for i in (2, 0, 1):
+        outbox.ack(i)
+    outbox.close()
+
+    outbox = Outbox(path)
+    assert outbox.pending_ids() == []
+    assert outbox.next_id == 3
+    outbox.close()
+
+def test_log_grows(tmp_path):
+    path = str(tmp_path / "s3")
+    outbox = Outbox(path)
+    payload = b"x" * 1000
+    for _ in range(2 * CHUNK // 1000):
+        outbox.append(payload)
+    outbox.close()
+
+    outbox = Outbox(path)
+    assert len(outbox.pending_ids()) == 2 * CHUNK // 1000
+    outbox.close()
+
+def test_store_rejects_bad_and_busy_sessions(tmp_path):
+    store = OutboxStore(str(tmp_path))
+    with pytest.raises(ValueError):
+        store.acquire("../etc")
+    store.acquire("abc")
+    with pytest.raises(ValueError):
+        store.acquire("abc")
+    store.release("abc")
+    store.acquire("abc")
+    store.release("abc")
@@ -0,0 +1,56 @@
+# test_progress_renderer.py
+import io
+import threading
+
+from progress_renderer import ProgressBoard
+
+
+def test_only_changed_lines_are_redrawn():
+    out = io.StringIO()
+    board = ProgressBoard(out, height=20)
+    board["R1"] = "0/10"
+    board["R2"] = "0/10"
+    board.drain()
+    board.render()
+    assert "\033[2J" in out.getvalue()
+
+    out.truncate(0)
+    out.seek(0)
+    board["R2"] = "1/10"
+    board.drain()
+    board.render()
+    frame = out.getvalue()
+    assert "\033[3;1HR2          : 1/10" in frame
+    assert "R1" not in frame and "\033[2J" not in frame
+
+
+def test_summary_mode_when_screen_is_too_small():
+    board = ProgressBoard(io.StringIO(), height=8)
+    for i in range(100):
+        board[f"R{i}"] = "1/10"
+    board["R5"] = "CAUGHT at attempt 2"
+    board["R7"] = "10/10 (done)"
+    board.drain()
+    lines = board.frame()
+    assert len(lines) <= 8
+    assert "running: 98  done: 1  caught: 1" in lines[1]
+    assert lines[3].startswith("R7") and lines[4].startswith("R5")
+
+
+def test_threaded_writers_and_final_frame():
+    out = io.StringIO()
+    board = ProgressBoard(out, fps=1000, height=50).start()
+
+    def runner(name):
+        for step in range(1, 51):
+            board[name] = f"{step}/50"
+        board[name] += " (done)"
+
+    threads = [threading.Thread(target=runner, args=(f"R{i}",)) for i in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    board.stop()
+    assert all(status == "50/50 (done)" for status in board.shown.values())
+    assert len(board.shown) == 10
@@ -0,0 +1,25 @@
+# test_runner_experiments.py
+import numpy as np
+import pytest
+
+from runner_experiments import Histogram, run_experiments
+
+
+def test_histogram_summary_matches_numpy():
+    values = np.random.default_rng(0).integers(0, 500, size=1001)
+    histogram = Histogram()
+    histogram.add(np.bincount(values[:300]))
+    histogram.add(np.bincount(values[300:]))
+    summary = histogram.summary()
+    assert summary["mean"] == pytest.approx(values.mean())
+    assert summary["variance"] == pytest.approx(values.var())
+    for q in (0.05, 0.5, 0.95):
+        assert summary[f"p{round(q * 100)}"] == np.quantile(values, q, method="lower")
+
+
+@pytest.mark.parametrize("mode,simulations", [("vectorized", 20000), ("events", 400)])
+def test_result_does_not_depend_on_workers(mode, simulations):
+    serial = run_experiments(simulations, workers=1, seed=9, mode=mode, task_size=simulations // 4)
+    parallel = run_experiments(simulations, workers=2, seed=9, mode=mode, task_size=simulations // 4)
+    assert serial == parallel
+    assert serial["simulations"] == simulations
@@ -0,0 +1,34 @@
+# test_runner_montecarlo.py
+import random
+
+import numpy as np
+
+from runner_montecarlo import DEPOTS, simulate_many
+from test_kuvalda_sim import sim
+
+
+def test_invariants():
+    result = simulate_many(5000, runners=7, attempts=12, seed=1, batch=1000)
+    assert result["total_earned"].shape == (5000,)
+    assert result["remaining"].shape == (5000, DEPOTS)
+    assert (result["remaining"] >= 0).all()
+    assert ((result["catch_attempt"] >= 0) & (result["catch_attempt"] <= 12)).all()
+    assert (result["total_earned"] % 5 == 0).all()
+
+
+def test_seeded_runs_repeat():
+    a = simulate_many(1000, seed=3)
+    b = simulate_many(1000, seed=3)
+    assert all(np.array_equal(a[key], b[key]) for key in a)
+
+
+def test_matches_event_simulation_in_distribution():
+    rng = random.Random(5)
+    totals = []
+    for _ in range(3000):
+        warehouses = [sim.Warehouse("D", rng.randint(100, 300)) for _ in range(DEPOTS)]
+        team = [sim.VirtualRunner(f"R{i}", rng.choice(warehouses), {}, 10) for i in range(5)]
+        sim.run_events(team, rng)
+        totals.append(sum(r.earnings for r in team))
+    result = simulate_many(200_000, seed=5)
+    assert abs(np.mean(totals) - result["total_earned"].mean()) < 15
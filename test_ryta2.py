@@ -0,0 +1,105 @@
+# test_ryta2.py
+import pytest
+from ryta2 import InventoryStore, Product
+
+def make_store():
+    return InventoryStore([
+        Product("1", "Bandage", "Medical", 10, 2.5, "A1"),
+        Product("2", "Gloves", "Medical", 5, 1, "B2"),
+        Product("3", "Hammer", "Tools", 1, 20, "A1"),
+    ])
+
+def test_lookup_and_duplicate_id():
+    store = make_store()
+    assert store.get("2").name == "Gloves"
+    assert store.get("9") is None
+    with pytest.raises(ValueError):
+        store.add(Product("2", "X", "Y", 0, 0, ""))
+
+def test_update_keeps_indexes_and_order():
+    store = make_store()
+    store.update("1", id="10", name="Bandage", category="Tools", quantity=3, price=2.5, location="C3")
+    assert [p.id for p in store] == ["10", "2", "3"]
+    assert "1" not in store and store.get("10").quantity == 3
+    assert {p.id for p in store.in_category("Tools")} == {"10", "3"}
+    assert [p.id for p in store.in_category("Medical")] == ["2"]
+    assert store.at_location("C3")[0].id == "10"
+    assert [p.id for p in store.at_location("A1")] == ["3"]
+    with pytest.raises(ValueError):
+        store.update("10", id="2")
+
+def test_remove_and_sort():
+    store = make_store()
+    assert store.remove("2").name == "Gloves"
+    assert store.remove("2") is None
+    assert len(store) == 2 and store.in_category("Medical")[0].id == "1"
+    assert store.at_location("B2") == []
+    store.sort(key=lambda p: p.price, reverse=True)
+    assert [p.id for p in store] == ["3", "1"]
+
+class ListTree:
+    """Мінімальна заміна ttk.Treeview для VirtualTree (без дисплея)."""
+    def __init__(self):
+        self.rows = []
+        self.values = {}
+        self.calls = 0
+
+    def get_children(self):
+        return tuple(self.rows)
+
+    def insert(self, parent, index, iid, values):
+        self.calls += 1
+        self.rows.insert(len(self.rows) if index == "end" else index, iid)
+        self.values[iid] = values
+
+    def delete(self, *iids):
+        self.calls += 1
+        for iid in iids:
+            self.rows.remove(iid)
+            del self.values[iid]
+
+    def move(self, iid, parent, index):
+        self.calls += 1
+        self.rows.remove(iid)
+        self.rows.insert(index, iid)
+
+    def item(self, iid, values):
+        self.calls += 1
+        self.values[iid] = values
+
+    def exists(self, iid):
+        return iid in self.values
+
+    def index(self, iid):
+        return self.rows.index(iid)
+
+def make_view(count=1000):
+    from ryta2 import VirtualTree
+    products = [Product(str(i), f"P{i}", "C", 1, 1, "L") for i in range(count)]
+    view = VirtualTree(ListTree(), rows=10, buffer=5)
+    view.set_items(products)
+    return view, products
+
+def test_virtual_tree_materializes_only_window():
+    view, products = make_view()
+    assert view.tree.rows == [str(i) for i in range(15)]
+    view.tree.calls = 0
+    view.yview("scroll", 1, "units")
+    assert view.tree.rows == [str(i) for i in range(1, 16)]
+    assert view.tree.calls == 2           # один delete, один insert
+    view.yview("moveto", "1.0")
+    assert view.tree.rows == [str(i) for i in range(990, 1000)]
+
+def test_virtual_tree_targeted_edits():
+    view, products = make_view()
+    view.tree.calls = 0
+    products[3].name = "X"
+    view.update_item("3", products[3])
+    assert view.tree.values["3"][1] == "X" and view.tree.calls == 1
+    products[4].id = "new"
+    view.update_item("4", products[4])
+    assert view.tree.rows[4] == "new"
+    view.remove(products[0])
+    assert view.tree.rows[0] == "1" and len(view.tree.rows) == 15
+    view.append(Product("last", "L", "C", 1, 1, "L"))
+    assert "last" not in view.tree.rows and view.items[-1].id == "last"
@@ -0,0 +1,70 @@
+# test_server.py
+import asyncio
+import socket
+import threading
+
+import framing
+import server
+from metrics import metrics
+
+
+def test_frame_channel_receives_into_frame_buffer():
+    received = []
+
+    async def handler(reader, writer):
+        channel, window, session = await server.negotiate(reader, writer)
+        while len(received) < 4:
+            received.extend(await channel.receive())
+        received.append(type(writer.transport.get_protocol()).__name__)
+        writer.close()
+
+    async def main():
+        srv = await asyncio.start_server(handler, "127.0.0.1", 0)
+        port = srv.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        data = (framing.MAGIC + framing.encode_hello(8) + framing.encode(framing.CACK, 1)
+                + framing.encode(framing.SACK, 3, 4))
+        writer.write(data)
+        await writer.drain()
+        await asyncio.sleep(0.05)
+        tail = framing.encode(framing.SACK, 5) + framing.encode(framing.ACK, 6)
+        # кадр, розірваний між двома записами
+        writer.write(tail[:4])
+        await writer.drain()
+        await asyncio.sleep(0.05)
+        writer.write(tail[4:])
+        await writer.drain()
+        assert await reader.read() == b""
+        writer.close()
+        srv.close()
+        await srv.wait_closed()
+
+    asyncio.run(main())
+    assert received == [(framing.CACK, [1]), (framing.SACK, [3, 4]),
+                        (framing.SACK, [5]), (framing.SACK, [6]), "FrameReceiver"]
+
+
+def test_legacy_server_accepts_coalesced_acks(monkeypatch):
+    monkeypatch.setattr(server, "MAX_MESSAGES", 3)
+    monkeypatch.setattr(server, "SEND_INTERVAL", 0)
+    server_side, client_side = socket.socketpair()
+    invalid = metrics.get("invalid_acks_total")
+    retransmits = metrics.get("retransmits_total")
+    thread = threading.Thread(target=server.handle_client, args=(server_side, "test"))
+    thread.start()
+
+    messages = framing.LegacyParser(b"MSG")
+    assert messages.feed(client_side.recv(1024)) == [0]
+    client_side.sendall(b"ACK:0")
+    assert messages.feed(client_side.recv(1024)) == [1]
+    # запізнілий дубль і потрібний ACK в одному пакеті
+    client_side.sendall(b"ACK:0ACK:1")
+    assert messages.feed(client_side.recv(1024)) == [2]
+    client_side.sendall(b"AC")
+    client_side.sendall(b"K:2")
+    thread.join(5)
+    client_side.close()
+
+    assert not thread.is_alive()
+    assert metrics.get("invalid_acks_total") == invalid
+    assert metrics.get("retransmits_total") == retransmits
@@ -0,0 +1,40 @@
+# test_sharded_warehouse.py
+import random
+
+from sharded_warehouse import ShardedRunner, ShardedWarehouse, StockShard, bench_locked, bench_sharded
+
+
+def test_compare_and_set():
+    shard = StockShard(10)
+    assert not shard.compare_and_set(9, 0)
+    assert shard.compare_and_set(10, 4)
+    assert shard.meds == 4
+
+
+def test_reserve_spans_shards_and_never_goes_negative():
+    warehouse = ShardedWarehouse("A", 10, shards=4)
+    assert [s.meds for s in warehouse.shards] == [3, 3, 2, 2]
+    assert warehouse.reserve(5, hint=3) == 5
+    assert warehouse.reserve(100) == 5
+    assert warehouse.reserve(1) == 0
+    assert warehouse.meds == 0
+
+
+def test_runners_keep_stock_and_earnings_consistent():
+    warehouse = ShardedWarehouse("A", 3000, shards=8)
+    progress = [""] * 100
+    runners = [ShardedRunner(i, warehouse, progress, attempts=50, pause=None) for i in range(100)]
+    for i, r in enumerate(runners):
+        r.rng = random.Random(i)
+        r.start()
+    for r in runners:
+        r.join()
+    assert warehouse.meds >= 0
+    assert sum(r.earnings for r in runners) == (3000 - warehouse.meds) * 5
+    assert all(p.startswith("CAUGHT") or p == "50/50 (done)" for p in progress)
+
+
+def test_benchmarks_run():
+    for bench in (bench_locked, bench_sharded):
+        seconds, stolen, earned = bench(20, 50, 500)
+        assert 0 <= stolen <= 500 and earned == stolen * 5
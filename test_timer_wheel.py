@@ -0,0 +1,77 @@
+# test_timer_wheel.py
+import random
+import pytest
+from timer_wheel import TimerWheel, RetransmitScheduler
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_timers_fire_in_order():
+    clock = FakeClock()
+    wheel = TimerWheel(tick=0.01, clock=clock)
+    fired = []
+    for delay in [0.05, 0.01, 3.0, 0.7, 45.0]:
+        wheel.schedule(delay, fired.append, delay)
+    clock.now = 1.0
+    wheel.advance()
+    assert fired == [0.01, 0.05, 0.7]
+    clock.now = 100.0
+    wheel.advance()
+    assert fired == [0.01, 0.05, 0.7, 3.0, 45.0]
+    assert len(wheel) == 0
+
+def test_timer_never_fires_early():
+    clock = FakeClock()
+    wheel = TimerWheel(tick=0.01, clock=clock)
+    rng = random.Random(1)
+    fired = []
+    for _ in range(2000):
+        delay = rng.uniform(0, 60)
+        wheel.schedule(delay, lambda d: fired.append((d, clock.now)), delay)
+    while clock.now < 61:
+        clock.now += 0.1
+        wheel.advance()
+    assert len(fired) == 2000
+    assert all(now >= delay for delay, now in fired)
+    assert all(now - delay < 0.2 for delay, now in fired)
+
+def test_cancel():
+    clock = FakeClock()
+    wheel = TimerWheel(tick=0.01, clock=clock)
+    fired = []
+    timer = wheel.schedule(0.5, fired.append, "a")
+    wheel.schedule(0.5, fired.append, "b")
+    timer.cancel()
+    assert len(wheel) == 1
+    clock.now = 1
+    wheel.advance()
+    assert fired == ["b"]
+
+def test_retransmit_backoff_and_give_up():
+    clock = FakeClock()
+    scheduler = RetransmitScheduler(timeout=1, backoff=2, jitter=0, max_retries=3, clock=clock)
+    sent = []
+    gave_up = []
+    scheduler.track(lambda: sent.append(clock.now), lambda: gave_up.append(clock.now))
+    while clock.now < 20:
+        clock.now = round(clock.now + 0.01, 2)
+        scheduler.poll()
+    assert sent == pytest.approx([1, 3, 7])
+    assert gave_up == pytest.approx([15])
+
+def test_retransmit_cancelled_by_ack():
+    clock = FakeClock()
+    scheduler = RetransmitScheduler(timeout=1, jitter=0, clock=clock)
+    sent = []
+    entry = scheduler.track(lambda: sent.append(clock.now))
+    clock.now = 0.5
+    scheduler.poll()
+    entry.cancel()
+    clock.now = 10
+    scheduler.poll()
+    assert sent == []
+    assert len(scheduler) == 0
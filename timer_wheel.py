@@ -0,0 +1,231 @@
+# timer_wheel.py
+# Ієрархічне колесо таймерів і планувальник повторних відправок.
+#
+# Усі дедлайни всіх повідомлень усіх з'єднань живуть в одному колесі.
+# Додавання і скасування таймера — O(1), один крок колеса обробляє
+# лише слот поточного тіку (плюс зрідка перенесення з вищих рівнів).
+import random
+import time
+
+# біт на рівень: 64 слоти в кожному рівні
+SLOT_BITS = 6
+SLOTS = 1 << SLOT_BITS
+SLOT_MASK = SLOTS - 1
+
+# 4 рівні по 64 слоти покривають 64^4 тіків (при 10 мс — ~1.9 доби)
+LEVELS = 4
+
+
+class Timer:
+    __slots__ = ("wheel", "expires", "callback", "args", "slot", "cancelled")
+
+    def __init__(self, wheel, expires, callback, args):
+        self.wheel = wheel
+        self.expires = expires
+        self.callback = callback
+        self.args = args
+        self.slot = None
+        self.cancelled = False
+
+    def cancel(self):
+        """Скасування за O(1): таймер просто зникає зі свого слота."""
+        self.cancelled = True
+        if self.slot is not None:
+            del self.slot[self]
+            self.slot = None
+            self.wheel.count -= 1
+
+
+class TimerWheel:
+    """
+    Ієрархічне колесо таймерів.
+    Рівень l має 64 слоти шириною 64^l тіків; таймери з далеким
+    дедлайном спускаються на нижчі рівні, коли до них доходить черга.
+    """
+
+    def __init__(self, tick=0.01, clock=time.monotonic):
+        self.tick = tick
+        self.clock = clock
+        self.started = clock()
+        self.current = 0
+        self.count = 0
+        # слот — dict як упорядкована множина таймерів
+        self.levels = [[{} for _ in range(SLOTS)] for _ in range(LEVELS)]
+
+    def __len__(self):
+        return self.count
+
+    def now_tick(self, now=None):
+        if now is None:
+            now = self.clock()
+        return int((now - self.started) / self.tick)
+
+    def schedule(self, delay, callback, *args):
+        """Викликати callback(*args) приблизно через delay секунд."""
+        now = self.now_tick()
+        if not self.count:
+            # порожнє колесо не крутилось — одразу переводимо його на зараз
+            self.current = max(self.current, now)
+        expires = now + max(1, -int(-delay // self.tick))
+        timer = Timer(self, expires, callback, args)
+        self._add(timer)
+        return timer
+
+    def _add(self, timer):
+        delta = timer.expires - self.current
+        if delta <= 0:
+            # прострочений таймер спрацює на наступному тіку
+            timer.expires = self.current + 1
+            delta = 1
+
+        for level in range(LEVELS):
+            if delta < SLOTS ** (level + 1) or level == LEVELS - 1:
+                index = (timer.expires >> (SLOT_BITS * level)) & SLOT_MASK
+                break
+
+        slot = self.levels[level][index]
+        slot[timer] = None
+        if timer.slot is None:
+            self.count += 1
+        timer.slot = slot
+
+    def _take(self, level, index):
+        slot = self.levels[level][index]
+        self.levels[level][index] = {}
+        timers = list(slot)
+        for timer in timers:
+            timer.slot = None
+        self.count -= len(timers)
+        return timers
+
+    def advance(self, now=None):
+        """
+        Просуває колесо до поточного часу і викликає всі таймери,
+        що спрацювали. Повертає кількість викликів.
+        """
+        target = self.now_tick(now)
+        fired = 0
+
+        while self.current < target:
+            if not self.count:
+                self.current = target
+                break
+
+            self.current += 1
+
+            # переносимо таймери з вищих рівнів, коли доходимо до їхнього слота
+            for level in range(LEVELS - 1, 0, -1):
+                if self.current & ((1 << (SLOT_BITS * level)) - 1) == 0:
+                    index = (self.current >> (SLOT_BITS * level)) & SLOT_MASK
+                    for timer in self._take(level, index):
+                        if timer.expires <= self.current:
+                            timer.expires = self.current
+                        self._add_or_keep(timer)
+
+            for timer in self._take(0, self.current & SLOT_MASK):
+                if timer.cancelled:
+                    continue
+                if timer.expires > self.current:
+                    # таймер з верхнього рівня, якому ще рано
+                    self._add(timer)
+                    continue
+                fired += 1
+                timer.callback(*timer.args)
+
+        return fired
+
+    def _add_or_keep(self, timer):
+        if timer.expires == self.current:
+            # належить поточному тіку — кладемо в слот, що зараз обробиться
+            slot = self.levels[0][self.current & SLOT_MASK]
+            slot[timer] = None
+            timer.slot = slot
+            self.count += 1
+        else:
+            self._add(timer)
+
+
+class Retransmit:
+    """Одне повідомлення, що чекає підтвердження."""
+
+    __slots__ = ("scheduler", "resend", "give_up", "attempt", "timer")
+
+    def __init__(self, scheduler, resend, give_up):
+        self.scheduler = scheduler
+        self.resend = resend
+        self.give_up = give_up
+        self.attempt = 0
+        self.timer = None
+
+    def cancel(self):
+        """Викликається, коли прийшов ACK."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+
+class RetransmitScheduler:
+    """
+    Повторні відправки для всіх повідомлень у польоті.
+    Таймаут росте експоненційно: timeout * backoff^спроба
+    (не більше max_timeout), з випадковим відхиленням ±jitter.
+    Після max_retries повторів викликається give_up().
+    """
+
+    def __init__(self, timeout=5, backoff=2, max_timeout=60, jitter=0.1,
+                 max_retries=10, tick=0.01, clock=time.monotonic):
+        self.timeout = timeout
+        self.backoff = backoff
+        self.max_timeout = max_timeout
+        self.jitter = jitter
+        self.max_retries = max_retries
+        self.wheel = TimerWheel(tick, clock)
+        self.loop = None
+        self.handle = None
+
+    def delay(self, attempt):
+        base = min(self.max_timeout, self.timeout * self.backoff ** attempt)
+        return base * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def track(self, resend, give_up=None):
+        """Почати відлік для щойно відправленого повідомлення."""
+        entry = Retransmit(self, resend, give_up)
+        entry.timer = self.wheel.schedule(self.delay(0), self._expired, entry)
+        self._wake()
+        return entry
+
+    def _expired(self, entry):
+        entry.timer = None
+        if entry.attempt >= self.max_retries:
+            if entry.give_up is not None:
+                entry.give_up()
+            return
+        entry.attempt += 1
+        entry.resend()
+        entry.timer = self.wheel.schedule(self.delay(entry.attempt), self._expired, entry)
+
+    def poll(self, now=None):
+        return self.wheel.advance(now)
+
+    def __len__(self):
+        return len(self.wheel)
+
+    # --- робота в циклі подій asyncio ---
+
+    def attach(self, loop):
+        """Крутити колесо в циклі подій loop (і брати час з нього)."""
+        self.loop = loop
+        self.wheel.clock = loop.time
+        self.wheel.started = loop.time()
+        self.wheel.current = 0
+
+    def _wake(self):
+        if self.loop is not None and self.handle is None:
+            self.handle = self.loop.call_later(self.wheel.tick, self._on_tick)
+
+    def _on_tick(self):
+        self.handle = None
+        self.poll()
+        # поки є таймери — тікаємо далі, інакше колесо спить
+        if len(self.wheel):
+            self._wake()